@@ -1,3 +1,3 @@
-from app.api.routes import cats_router, missions_router
+from app.api.routes import cats_router, missions_router, stats_router, targets_router, jobs_router
 
-__all__ = ["cats_router", "missions_router"]
+__all__ = ["cats_router", "missions_router", "stats_router", "targets_router", "jobs_router"]
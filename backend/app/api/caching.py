@@ -0,0 +1,101 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.cache import CachedResponse, response_cache
+from app.core.serialization import json_dumps
+
+
+def make_etag(versions: Sequence[Tuple]) -> str:
+    """Strong ETag from the version tuples a representation was built from."""
+    return '"' + hashlib.blake2b(repr(list(versions)).encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match uses the weak comparison, so a W/ prefix is ignored."""
+    if not if_none_match or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def serialize(
+    adapter: TypeAdapter, value: Any, versions: Sequence[Tuple], headers: Optional[Dict[str, str]] = None
+) -> CachedResponse:
+    """Validate ORM objects through a response schema and dump them to JSON bytes."""
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return CachedResponse(body, {**(headers or {}), "ETag": make_etag(versions)})
+
+
+_ROWS = TypeAdapter(List[Dict[str, Any]])
+
+
+def serialize_fields(
+    items: Sequence[Any],
+    fields: Sequence[str],
+    versions: Sequence[Tuple],
+    headers: Optional[Dict[str, str]] = None,
+    nested: Optional[Mapping[str, TypeAdapter]] = None,
+) -> CachedResponse:
+    """Like serialize() for a `fields=` projection: only the listed attributes,
+    relationships dumped through their schema's adapter in `nested`."""
+    nested = nested or {}
+    rows = []
+    for item in items:
+        row = {}
+        for name in fields:
+            value = getattr(item, name)
+            if name in nested:
+                value = nested[name].dump_python(nested[name].validate_python(value, from_attributes=True))
+            row[name] = value
+        rows.append(row)
+    return CachedResponse(_ROWS.dump_json(rows), {**(headers or {}), "ETag": make_etag(versions)})
+
+
+def serialize_rows(
+    rows: Sequence[Mapping[str, Any]],
+    fields: Sequence[str],
+    versions: Sequence[Tuple],
+    headers: Optional[Dict[str, str]] = None,
+) -> CachedResponse:
+    """Dump rows read straight from SQL (get_cat_rows, get_mission_rows) to JSON,
+    keeping `fields` of each. Nothing is validated: the columns already have
+    the response schema's types."""
+    body = json_dumps([{name: row[name] for name in fields} for row in rows])
+    return CachedResponse(body, {**(headers or {}), "ETag": make_etag(versions)})
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def cached_json(
+    request: Request,
+    key: Optional[str],
+    build: Callable[[], Awaitable[CachedResponse]],
+    current_versions: Callable[[], Awaitable[Optional[Sequence[Tuple]]]],
+) -> Response:
+    """Serve a GET from the response cache, answering If-None-Match with 304.
+
+    A conditional request that misses the cache is checked against
+    `current_versions` (a cheap version-only query) before the body is loaded
+    and serialized. `build` may raise HTTPException; errors are never cached.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    cached = await response_cache.get(key)
+    if cached is None and if_none_match:
+        versions = await current_versions()
+        if versions is not None:
+            etag = make_etag(versions)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+    if cached is None:
+        cached = await build()
+        await response_cache.set(key, cached)
+
+    if etag_matches(if_none_match, cached.headers.get("ETag")):
+        return _not_modified(cached.headers["ETag"])
+    return Response(cached.body, media_type="application/json", headers=cached.headers)
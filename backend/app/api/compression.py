@@ -0,0 +1,203 @@
+import asyncio
+import zlib
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        import brotli
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        out = self._compressor.process(data)
+        return out + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        try:
+            from compression import zstd  # Python 3.14+
+        except ImportError:
+            import zstandard
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            modes = (zstandard.COMPRESSOBJ_FLUSH_BLOCK, zstandard.COMPRESSOBJ_FLUSH_FINISH)
+            self._compress = lambda data, final: compressor.compress(data) + compressor.flush(modes[final])
+        else:
+            compressor = zstd.ZstdCompressor(level=level)
+            modes = (zstd.ZstdCompressor.FLUSH_BLOCK, zstd.ZstdCompressor.FLUSH_FRAME)
+            self._compress = lambda data, final: compressor.compress(data, mode=modes[final])
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compress(data, final)
+
+
+CODECS: Dict[str, Callable[[int], object]] = {"zstd": _Zstd, "br": _Brotli, "gzip": _Gzip}
+
+
+def available_encodings(encodings: Sequence[str]) -> List[str]:
+    """The configured encodings whose codec can be loaded (brotli and zstandard are optional)."""
+    available = []
+    for encoding in encodings:
+        if encoding not in CODECS:
+            raise ValueError(f"Unknown compression encoding '{encoding}'")
+        try:
+            CODECS[encoding](1)
+        except ImportError:
+            continue
+        available.append(encoding)
+    return available
+
+
+def negotiate(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """First of `encodings` (server preference) that Accept-Encoding allows, or None."""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False  # events must reach the client one by one
+    return (
+        media_type.startswith("text/")
+        or media_type in ("application/json", "application/x-ndjson", "application/javascript")
+        or media_type.endswith("+json")
+    )
+
+
+def _weak(etag: str) -> str:
+    return etag if etag.startswith("W/") else "W/" + etag
+
+
+_THREAD_MIN_SIZE = 256 * 1024  # larger bodies are compressed off the event loop
+
+
+class CompressionMiddleware:
+    """Compresses JSON, NDJSON and text responses with the first of `encodings`
+    the client accepts.
+
+    Bodies shorter than `minimum_size` and event streams pass through as they
+    are. Streamed bodies (the exports) are compressed chunk by chunk with a
+    flush after each, so rows still reach the client as they are produced. A
+    compressed body is another representation of the resource, so its ETag is
+    made weak; If-None-Match uses the weak comparison and still matches it.
+    """
+
+    def __init__(self, app: ASGIApp, encodings: Sequence[str], minimum_size: int, levels: Mapping[str, int]) -> None:
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+        self.levels = levels
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = negotiate(headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSend(
+            send, encoding, self.levels[encoding], self.minimum_size, headers.get("if-none-match", "")
+        )
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """The `send` of one response: holds back the start message until the first
+    body chunk shows whether (and how) the body is compressed."""
+
+    def __init__(self, send: Send, encoding: str, level: int, minimum_size: int, if_none_match: str):
+        self.send = send
+        self.if_none_match = if_none_match
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            await self._on_start(message)
+        elif message["type"] == "http.response.body":
+            await self._on_body(message)
+        else:
+            await self.send(message)
+
+    async def _on_start(self, message: Message) -> None:
+        headers = MutableHeaders(scope=message)
+        if message["status"] == 304 and "etag" in headers:
+            # Repeat the ETag the client holds: weak if it was given a compressed body
+            if _weak(headers["etag"]) in self.if_none_match:
+                headers["ETag"] = _weak(headers["etag"])
+            headers.add_vary_header("Accept-Encoding")
+        if (
+            message["status"] < 200 or message["status"] in (204, 206, 304)
+            or "content-encoding" in headers or not _compressible(headers.get("content-type", ""))
+        ):
+            self.passthrough = True
+            await self.send(message)
+            return
+        self.start = message
+
+    async def _on_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            headers = MutableHeaders(scope=self.start)
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self.compressor = CODECS[self.encoding](self.level)
+            headers["Content-Encoding"] = self.encoding
+            if "etag" in headers:
+                headers["ETag"] = _weak(headers["etag"])
+            if more_body:
+                del headers["Content-Length"]
+                await self.send(self.start)
+            else:
+                body = await self._compress(body, final=True)
+                headers["Content-Length"] = str(len(body))
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+        compressed = await self._compress(body, final=not more_body)
+        if compressed or not more_body:
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        if len(body) >= _THREAD_MIN_SIZE:
+            return await asyncio.to_thread(self.compressor.compress, body, final)
+        return self.compressor.compress(body, final)
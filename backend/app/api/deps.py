@@ -1,4 +1,53 @@
+from typing import Any, Iterable, List, Optional
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.database import get_db
+from app.schemas import JobResponse
+from app.services import BulkImportService
+
+__all__ = ["get_db", "read_bulk_items", "parse_fields", "job_accepted"]
+
+
+async def read_bulk_items(request: Request) -> List[Any]:
+    """Read a bulk request body given as a JSON array or NDJSON."""
+    body = await request.body()
+    try:
+        items = BulkImportService.parse_payload(body, request.headers.get("content-type", ""))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk requests are limited to {settings.BULK_MAX_ITEMS} items"
+        )
+    return items
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """Split a comma-separated `fields=` projection, rejecting unknown names."""
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in allowed]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+            if unknown else "fields must name at least one field"
+        )
+    return names
+
 
-__all__ = ["get_db"]
+def job_accepted(job: JobResponse) -> JSONResponse:
+    """202 Accepted for work queued as a background job, pointing at its status."""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=job.model_dump(mode="json"),
+        headers={"Location": f"/jobs/{job.id}"},
+    )
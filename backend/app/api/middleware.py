@@ -0,0 +1,67 @@
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logger import access_logger, request_id_var, should_log_access
+from app.core.metrics import RequestTimings, observe_request, start_request
+
+
+class RequestContextMiddleware:
+    """Request id, timings, metrics and the access log for every HTTP request.
+
+    Plain ASGI rather than `@app.middleware("http")`: the app runs in the
+    caller's task and the response passes straight through. Headers are added
+    to the `http.response.start` message and the body is never buffered, so
+    streaming responses reach the client as they are produced. Metrics and the
+    access log are recorded once the body is done (or the app failed, as a 500).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request()
+        request_id = Headers(scope=scope).get("x-request-id") or uuid.uuid4().hex
+        request_id_var.set(request_id)
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                if settings.SERVER_TIMING_ENABLED:
+                    headers.append("Server-Timing", timings.server_timing(time.perf_counter() - timings.start))
+                headers.append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _record(scope, status_code, time.perf_counter() - timings.start, timings)
+
+
+def _record(scope: Scope, status_code: int, process_time: float, timings: RequestTimings) -> None:
+    method = scope["method"]
+    route = scope.get("route")
+    observe_request(method, route.path if route else "unmatched", status_code, process_time, timings)
+    if should_log_access(status_code, process_time) and access_logger.isEnabledFor(logging.INFO):
+        path = scope["path"]
+        access_logger.info(
+            "%s %s %s", method, path, status_code,
+            extra={
+                "method": method,
+                "path": path,
+                "status": status_code,
+                "duration_ms": round(process_time * 1000, 2),
+                "sql_queries": timings.sql_count,
+            },
+        )
@@ -1,4 +1,7 @@
 from app.api.routes.cats import router as cats_router
 from app.api.routes.missions import router as missions_router
+from app.api.routes.stats import router as stats_router
+from app.api.routes.targets import router as targets_router
+from app.api.routes.jobs import router as jobs_router
 
-__all__ = ["cats_router", "missions_router"]
+__all__ = ["cats_router", "missions_router", "stats_router", "targets_router", "jobs_router"]
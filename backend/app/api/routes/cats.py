@@ -1,13 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Any, List, Literal, Optional
 
 from app.database import get_db
-from app.schemas import CatCreate, CatUpdate, CatResponse
-from app.crud import create_cat, get_cat, get_cats, update_cat, delete_cat
-from app.services import BreedValidator
+from app.api.caching import cached_json, serialize, serialize_fields, serialize_rows
+from app.api.deps import read_bulk_items, parse_fields, job_accepted
+from app.api.timing import TimedRoute
+from app.schemas import CatCreate, CatUpdate, CatResponse, CatFilters, BulkCreateResponse, JobResponse
+from app.crud import (
+    create_cat, get_cat, get_cats, stream_cats, update_cat, delete_cat,
+    cat_version, get_cat_version, get_cat_versions, get_cat_rows, cat_row_version
+)
+from app.crud.pagination import next_cursor
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.services import BreedValidator, BulkImportService, Exporter, JobService
 
-router = APIRouter(prefix="/cats", tags=["cats"])
+router = APIRouter(prefix="/cats", tags=["cats"], route_class=TimedRoute)
+
+CAT_ADAPTER = TypeAdapter(CatResponse)
+CAT_LIST_ADAPTER = TypeAdapter(List[CatResponse])
+CAT_FIELDS = tuple(CatResponse.model_fields)
 
 
 @router.post("/", response_model=CatResponse, status_code=status.HTTP_201_CREATED)
@@ -29,22 +44,118 @@ async def create_cat_endpoint(cat_data: CatCreate, db: AsyncSession = Depends(ge
     return await create_cat(db, cat_data)
 
 
+@router.post("/bulk", response_model=BulkCreateResponse, responses={202: {"model": JobResponse}})
+async def bulk_create_cats_endpoint(
+    items: List[Any] = Depends(read_bulk_items),
+    background: bool = Query(False, description="Run as a background job and answer 202 with it"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many cats from a JSON array or NDJSON (application/x-ndjson) body.
+
+    Every item gets its own result; invalid items do not stop the rest.
+    """
+    if background:
+        job = await JobService.submit(
+            db, "cats.import", {"items": len(items)},
+            lambda job_db, job: BulkImportService.create_cats(job_db, items, job.progress)
+        )
+        return job_accepted(job)
+    try:
+        return await BulkImportService.create_cats(db, items)
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+
+
 @router.get("/", response_model=List[CatResponse])
-async def list_cats(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    """Get all spy cats with pagination."""
-    return await get_cats(db, skip=skip, limit=limit)
+async def list_cats(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: Literal[
+        "id", "-id", "salary", "-salary", "years_of_experience", "-years_of_experience"
+    ] = "id",
+    filters: CatFilters = Depends(),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of CatResponse fields"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get all spy cats with pagination, filters and sorting (prefix `-` for descending).
+
+    Pass the `X-Next-Cursor` response header back as `cursor` to fetch the next
+    page by keyset seek instead of `skip`. `fields=name,salary` returns and
+    loads only those fields. Answers `If-None-Match` with 304 when no cat on the
+    page changed.
+    """
+    projection = parse_fields(fields, CatResponse.model_fields)
+
+    async def build():
+        load = get_cat_rows if settings.JSON_FAST_PATH else get_cats
+        try:
+            cats = await load(
+                db, skip=skip, limit=limit, cursor=cursor, order_by=order_by, filters=filters, fields=projection
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        cursor_out = next_cursor(cats, limit, order_by)
+        headers = {"X-Next-Cursor": cursor_out} if cursor_out else {}
+        if settings.JSON_FAST_PATH:
+            versions = [cat_row_version(row) for row in cats]
+            return serialize_rows(cats, projection or CAT_FIELDS, versions, headers)
+        versions = [cat_version(cat) for cat in cats]
+        if projection is None:
+            return serialize(CAT_LIST_ADAPTER, cats, versions, headers)
+        return serialize_fields(cats, projection, versions, headers)
+
+    async def versions():
+        try:
+            return await get_cat_versions(
+                db, skip=skip, limit=limit, cursor=cursor, order_by=order_by, filters=filters
+            )
+        except ValueError:
+            return None  # build() reports the bad cursor
+
+    key = await response_cache.list_key(
+        "cats", skip, limit, cursor, order_by, filters.model_dump_json(), projection
+    )
+    return await cached_json(request, key, build, versions)
+
+
+@router.get("/export")
+async def export_cats(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream every cat as NDJSON or CSV from a server-side cursor."""
+    return StreamingResponse(
+        Exporter.cats(stream_cats(db), format),
+        media_type=Exporter.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="cats.{format}"'},
+    )
 
 
 @router.get("/{cat_id}", response_model=CatResponse)
-async def get_cat_endpoint(cat_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a single spy cat by ID."""
-    cat = await get_cat(db, cat_id)
-    if not cat:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Cat with id {cat_id} not found"
-        )
-    return cat
+async def get_cat_endpoint(cat_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """Get a single spy cat by ID. Answers `If-None-Match` with 304 when unchanged."""
+    async def build():
+        cat = await get_cat(db, cat_id)
+        if not cat:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Cat with id {cat_id} not found"
+            )
+        return serialize(CAT_ADAPTER, cat, [cat_version(cat)])
+
+    async def versions():
+        version = await get_cat_version(db, cat_id)
+        return [version] if version else None
+
+    return await cached_json(request, f"cats:{cat_id}", build, versions)
 
 
 @router.patch("/{cat_id}", response_model=CatResponse)
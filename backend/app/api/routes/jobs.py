@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.api.timing import TimedRoute
+from app.schemas import JobResponse
+from app.services import JobService
+
+router = APIRouter(prefix="/jobs", tags=["jobs"], route_class=TimedRoute)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job_endpoint(job_id: int, db: AsyncSession = Depends(get_db)):
+    """Status, progress and, once finished, the result or error of a background job."""
+    return await JobService.get(db, job_id)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job_endpoint(job_id: int, db: AsyncSession = Depends(get_db)):
+    """Cancel a queued job, or stop a running one at its next progress report.
+    Work it already committed (e.g. imported chunks) stays."""
+    return await JobService.cancel(db, job_id)
@@ -1,12 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Any, List, Literal, Optional
 from app.database import get_db
-from app.schemas import MissionCreate, MissionResponse, TargetUpdate, TargetResponse
-from app.crud import create_mission, get_mission, get_missions, delete_mission, assign_cat_to_mission, update_target
-from app.services import MissionService
+from app.api.caching import cached_json, serialize, serialize_fields, serialize_rows
+from app.api.deps import read_bulk_items, parse_fields, job_accepted
+from app.api.timing import TimedRoute
+from app.schemas import (
+    MissionCreate, MissionResponse, MissionFilters, TargetUpdate, TargetBatchUpdate, TargetResponse, CatResponse,
+    BulkCreateResponse, AutoAssignRequest, AutoAssignResponse, JobResponse, MIN_TARGETS, MAX_TARGETS
+)
+from app.crud import (
+    create_mission, get_mission, get_missions, stream_missions, delete_mission,
+    mission_version, get_mission_version, get_mission_versions, get_mission_rows
+)
+from app.crud.pagination import next_cursor
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.events import event_hub
+from app.services import MissionService, BulkImportService, Exporter, AutoAssignService, JobService
 
-router = APIRouter(prefix="/missions", tags=["missions"])
+router = APIRouter(prefix="/missions", tags=["missions"], route_class=TimedRoute)
+
+MISSION_ADAPTER = TypeAdapter(MissionResponse)
+MISSION_LIST_ADAPTER = TypeAdapter(List[MissionResponse])
+MISSION_FIELDS = tuple(MissionResponse.model_fields)
+NESTED_ADAPTERS = {"targets": TypeAdapter(List[TargetResponse]), "cat": TypeAdapter(Optional[CatResponse])}
 
 
 @router.post("/", response_model=MissionResponse, status_code=status.HTTP_201_CREATED)
@@ -15,22 +35,162 @@ async def create_mission_endpoint(mission_data: MissionCreate, db: AsyncSession
     return await create_mission(db, mission_data)
 
 
+@router.post("/bulk", response_model=BulkCreateResponse, responses={202: {"model": JobResponse}})
+async def bulk_create_missions_endpoint(
+    items: List[Any] = Depends(read_bulk_items),
+    background: bool = Query(False, description="Run as a background job and answer 202 with it"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many missions (each with 1-3 targets) from a JSON array or NDJSON body."""
+    if background:
+        job = await JobService.submit(
+            db, "missions.import", {"items": len(items)},
+            lambda job_db, job: BulkImportService.create_missions(job_db, items, job.progress)
+        )
+        return job_accepted(job)
+    return await BulkImportService.create_missions(db, items)
+
+
+@router.post("/auto-assign", response_model=AutoAssignResponse, responses={202: {"model": JobResponse}})
+async def auto_assign_endpoint(
+    options: AutoAssignRequest = Body(default_factory=AutoAssignRequest),
+    background: bool = Query(False, description="Run as a background job and answer 202 with it"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Match open, unassigned missions to assignable cats in one transaction.
+
+    `greedy` gives each mission, hardest first, the cheapest cat left;
+    `optimal` minimizes the total cost (needs numpy, at most
+    AUTO_ASSIGN_OPTIMAL_MAX missions, see `limit`).
+    """
+    if background:
+        job = await JobService.submit(
+            db, "missions.auto_assign", options.model_dump(),
+            lambda job_db, job: AutoAssignService.auto_assign(job_db, options)
+        )
+        return job_accepted(job)
+    return await AutoAssignService.auto_assign(db, options)
+
+
 @router.get("/", response_model=List[MissionResponse])
-async def list_missions(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    """Get all missions with their targets."""
-    return await get_missions(db, skip=skip, limit=limit)
+async def list_missions(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "-id"] = "id",
+    filters: MissionFilters = Depends(),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of MissionResponse fields"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get all missions with their targets. Supports `cursor` paging, ETags and
+    `fields=` like /cats; targets and the cat are only loaded when requested.
+    """
+    projection = parse_fields(fields, MissionResponse.model_fields)
 
+    async def build():
+        if settings.JSON_FAST_PATH:
+            return await build_from_rows()
+        try:
+            missions = await get_missions(
+                db, skip=skip, limit=limit, cursor=cursor, order_by=order_by, filters=filters, fields=projection
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        cursor_out = next_cursor(missions, limit, order_by)
+        headers = {"X-Next-Cursor": cursor_out} if cursor_out else {}
+        versions = [mission_version(m, projection) for m in missions]
+        if projection is None:
+            return serialize(MISSION_LIST_ADAPTER, missions, versions, headers)
+        return serialize_fields(missions, projection, versions, headers, NESTED_ADAPTERS)
 
-@router.get("/{mission_id}", response_model=MissionResponse)
-async def get_mission_endpoint(mission_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a single mission by ID with all targets."""
-    mission = await get_mission(db, mission_id)
-    if not mission:
+    async def build_from_rows():
+        try:
+            missions, versions = await get_mission_rows(
+                db, skip=skip, limit=limit, cursor=cursor, order_by=order_by, filters=filters, fields=projection
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        cursor_out = next_cursor(missions, limit, order_by)
+        headers = {"X-Next-Cursor": cursor_out} if cursor_out else {}
+        return serialize_rows(missions, projection or MISSION_FIELDS, versions, headers)
+
+    async def versions():
+        try:
+            return await get_mission_versions(
+                db, skip=skip, limit=limit, cursor=cursor, order_by=order_by, filters=filters, fields=projection
+            )
+        except ValueError:
+            return None  # build() reports the bad cursor
+
+    key = await response_cache.list_key(
+        "missions", skip, limit, cursor, order_by, filters.model_dump_json(), projection
+    )
+    return await cached_json(request, key, build, versions)
+
+
+@router.get("/export")
+async def export_missions(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream every mission with its targets inline as NDJSON or CSV from a server-side cursor."""
+    return StreamingResponse(
+        Exporter.missions(stream_missions(db), format),
+        media_type=Exporter.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="missions.{format}"'},
+    )
+
+
+@router.get("/events")
+async def mission_events(last_event_id: Optional[str] = Header(None)):
+    """Server-sent events for mission and target changes made by this worker.
+
+    Event types: mission.created, missions.imported, mission.assigned,
+    missions.auto_assigned, mission.unassigned, target.updated,
+    mission.completed, mission.deleted, and resync when the events after `Last-Event-ID` are no longer available.
+    """
+    try:
+        resume_from = int(last_event_id) if last_event_id is not None else None
+    except ValueError:
+        resume_from = -1  # unknown position: resync
+    try:
+        subscriber = event_hub.subscribe(resume_from)
+    except RuntimeError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Mission with id {mission_id} not found"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
         )
-    return mission
+    return StreamingResponse(
+        event_hub.stream(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{mission_id}", response_model=MissionResponse)
+async def get_mission_endpoint(mission_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """Get a single mission by ID with all targets. Answers `If-None-Match` with 304 when unchanged."""
+    async def build():
+        mission = await get_mission(db, mission_id)
+        if not mission:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Mission with id {mission_id} not found"
+            )
+        return serialize(MISSION_ADAPTER, mission, [mission_version(mission)])
+
+    async def versions():
+        version = await get_mission_version(db, mission_id)
+        return [version] if version else None
+
+    return await cached_json(request, f"missions:{mission_id}", build, versions)
 
 
 @router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -44,8 +204,21 @@ async def delete_mission_endpoint(mission_id: int, db: AsyncSession = Depends(ge
 @router.post("/{mission_id}/assign/{cat_id}", response_model=MissionResponse)
 async def assign_cat_endpoint(mission_id: int, cat_id: int, db: AsyncSession = Depends(get_db)):
     """Assign a cat to a mission."""
-    mission, cat = await MissionService.validate_can_assign_cat(db, mission_id, cat_id)
-    return await assign_cat_to_mission(db, mission, cat_id)
+    return await MissionService.assign_cat(db, mission_id, cat_id)
+
+
+@router.patch("/{mission_id}/targets", response_model=List[TargetResponse])
+async def update_targets_endpoint(
+    mission_id: int,
+    updates: List[TargetBatchUpdate] = Body(..., min_length=MIN_TARGETS, max_length=MAX_TARGETS),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update several targets of a mission at once, e.g. a field report.
+
+    Same rules as the single-target PATCH, checked against one load of the
+    mission's targets and applied all-or-nothing in one transaction.
+    """
+    return await MissionService.apply_target_updates(db, mission_id, updates)
 
 
 @router.patch("/{mission_id}/targets/{target_id}", response_model=TargetResponse)
@@ -56,11 +229,4 @@ async def update_target_endpoint(
     db: AsyncSession = Depends(get_db)
 ):
     """Update target notes and/or completion status. Notes freeze when target/mission is completed."""
-    target = await MissionService.validate_can_update_target(db, mission_id, target_id, update_data)
-    updated_target = await update_target(db, target, update_data)
-    
-    # Check for mission auto-completion
-    mission = await get_mission(db, mission_id)
-    await MissionService.check_mission_completion(db, mission)
-    
-    return updated_target
+    return await MissionService.apply_target_update(db, mission_id, target_id, update_data)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.api.timing import TimedRoute
+from app.schemas import StatsResponse
+from app.services import StatsService
+
+router = APIRouter(prefix="/stats", tags=["stats"], route_class=TimedRoute)
+
+
+@router.get("/", response_model=StatsResponse)
+async def get_stats_endpoint(db: AsyncSession = Depends(get_db)):
+    """Payroll per breed, idle cats, mission completion and target completion by country.
+
+    Aggregated in SQL and memoized for `STATS_CACHE_TTL` seconds, so the figures
+    may trail writes by that much.
+    """
+    return await StatsService.get(db)
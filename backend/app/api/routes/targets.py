@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.database import get_db
+from app.api.deps import job_accepted
+from app.api.timing import TimedRoute
+from app.schemas import TargetSearchHit, JobResponse
+from app.crud import search_targets, rebuild_search_index
+from app.services import JobService
+
+router = APIRouter(prefix="/targets", tags=["targets"], route_class=TimedRoute)
+
+
+@router.get("/search", response_model=List[TargetSearchHit])
+async def search_targets_endpoint(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Full-text search over target names, countries and notes, best matches first.
+
+    Every word must match; end a word with `*` to match it as a prefix. On
+    SQLite, skip + limit may not exceed SEARCH_RANK_WINDOW (422).
+    """
+    try:
+        return await search_targets(db, q, skip=skip, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+
+@router.post("/search/reindex", status_code=status.HTTP_202_ACCEPTED, response_model=JobResponse)
+async def reindex_search_endpoint(db: AsyncSession = Depends(get_db)):
+    """Rebuild and compact the full-text index as a background job."""
+    job = await JobService.submit(db, "search.reindex", None, lambda job_db, job: rebuild_search_index(job_db))
+    return job_accepted(job)
@@ -0,0 +1,85 @@
+"""Maintenance and serving commands, run from backend/:
+
+    python -m app.cli serve [--workers N]       # bootstrap once, then start N uvicorn workers
+    python -m app.cli bootstrap                 # migrations + breed catalogue only
+    python -m app.cli rebuild-search-index
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+
+import uvicorn
+
+from app.core.config import settings
+from app.core.jobs import job_queue
+from app.core.logger import logger, setup_logging, shutdown_logging
+from app.core.migrations import run_migrations
+from app.crud import rebuild_search_index
+from app.database import AsyncSessionLocal, engine
+from app.services import BreedValidator
+
+
+async def bootstrap() -> None:
+    """One-time startup work that must not run in every worker: migrate, fail
+    jobs a previous run left unfinished, warm breeds."""
+    setup_logging()
+    try:
+        await run_migrations(engine)
+        await job_queue.recover()
+        await BreedValidator.warm()
+        logger.info("Bootstrap done")
+    finally:
+        await BreedValidator.aclose()
+        await engine.dispose()
+        shutdown_logging()
+
+
+async def _rebuild_search_index() -> None:
+    async with AsyncSessionLocal() as db:
+        await rebuild_search_index(db)
+    await engine.dispose()
+    print("Search index rebuilt")
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    """Bootstrap in this process, then serve with `workers` uvicorn processes.
+
+    Workers inherit the environment, so they skip migrations and load the
+    breed catalogue from the shared snapshot instead of calling TheCatAPI.
+    """
+    overrides = {"MIGRATE_ON_STARTUP": "false", "WEB_CONCURRENCY": str(workers)}
+    if not settings.BREED_SNAPSHOT_PATH:
+        overrides["BREED_SNAPSHOT_PATH"] = os.path.join(tempfile.gettempdir(), "spy-cat-breeds.json")
+    os.environ.update(overrides)
+    # A single worker runs in this process with the already-loaded settings
+    settings.MIGRATE_ON_STARTUP = False
+    settings.WEB_CONCURRENCY = workers
+    settings.BREED_SNAPSHOT_PATH = os.environ["BREED_SNAPSHOT_PATH"]
+
+    asyncio.run(bootstrap())
+    # The app writes its own access log
+    uvicorn.run("app.main:app", host=host, port=port, workers=workers, access_log=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY)
+    commands.add_parser("bootstrap")
+    commands.add_parser("rebuild-search-index")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args.host, args.port, args.workers)
+    elif args.command == "bootstrap":
+        asyncio.run(bootstrap())
+    else:
+        asyncio.run(_rebuild_search_index())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Protocol
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import register_collector
+
+
+@dataclass
+class CachedResponse:
+    """A serialized JSON response body plus the headers that go with it."""
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def to_bytes(self) -> bytes:
+        return json.dumps(self.headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CachedResponse":
+        headers, _, body = data.partition(b"\n")
+        return cls(body=body, headers=json.loads(headers))
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]: ...
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+    async def delete(self, keys: Iterable[str]) -> None: ...
+    async def incr(self, key: str) -> int: ...
+    async def get_int(self, key: str) -> int: ...
+    async def clear(self) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU with per-entry TTL."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def get_int(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._counters.clear()
+        self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache:
+    """Backend for any client with the redis.asyncio get/set/delete/incr API
+    (Redis, Valkey, KeyDB, or an in-process stand-in in tests)."""
+
+    def __init__(self, client: Any, prefix: str = "spycat:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        return cls(redis.from_url(url))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = [self.prefix + key for key in keys]
+        if keys:
+            await self.client.delete(*keys)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(self.prefix + key)
+
+    async def get_int(self, key: str) -> int:
+        value = await self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    async def clear(self) -> None:
+        # SCAN is O(keyspace); meant for tests and manual flushes
+        async for key in self.client.scan_iter(match=self.prefix + "*"):
+            await self.client.delete(key)
+
+
+class ResponseCache:
+    """Read-through cache of serialized GET responses.
+
+    Detail entries are keyed by id and deleted on write. List entries embed a
+    per-resource generation number that writes bump, so every cached page of
+    that resource is dropped at once without tracking page keys. A read racing
+    a write can re-cache the old value, bounded by CACHE_TTL.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    async def list_key(self, resource: str, *params: Any) -> Optional[str]:
+        """Key for one page of `resource`, tied to its current generation.
+
+        None (bypass the cache) when there is no backend or it cannot be read.
+        """
+        if self.backend is None:
+            return None
+        try:
+            generation = await self.backend.get_int(f"{resource}:gen")
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache get failed: %s", e)
+            return None
+        return f"{resource}:list:{generation}:" + ":".join(str(p) for p in params)
+
+    async def get(self, key: Optional[str]) -> Optional[CachedResponse]:
+        if self.backend is None or key is None:
+            return None
+        try:
+            data = await self.backend.get(key)
+        except Exception as e:  # a broken cache must not break reads
+            self.errors += 1
+            logger.warning("Cache get failed: %s", e)
+            return None
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedResponse.from_bytes(data)
+
+    async def set(self, key: Optional[str], response: CachedResponse) -> None:
+        if self.backend is None or key is None:
+            return
+        try:
+            await self.backend.set(key, response.to_bytes(), self.ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache set failed: %s", e)
+
+    async def fetch(self, key: Optional[str], build: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """Return the cached response for `key`, building and storing it on a miss."""
+        response = await self.get(key)
+        if response is None:
+            response = await build()
+            await self.set(key, response)
+        return response
+
+    async def invalidate(self, resource: str, ids: Iterable[int] = ()) -> None:
+        """Drop cached detail entries for `ids` and every cached list of `resource`."""
+        if self.backend is None:
+            return
+        self.invalidations += 1
+        try:
+            await self.backend.delete(f"{resource}:{i}" for i in ids)
+            await self.backend.incr(f"{resource}:gen")
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache invalidation failed: %s", e)
+
+    async def clear(self) -> None:
+        """Drop every entry and reset the counters (useful for testing)."""
+        self.hits = self.misses = self.invalidations = self.errors = 0
+        if self.backend is not None:
+            await self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        stats = {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations, "errors": self.errors}
+        if isinstance(self.backend, MemoryCache):
+            stats.update(evictions=self.backend.evictions, expirations=self.backend.expirations, size=len(self.backend))
+        return stats
+
+    def render_metrics(self) -> List[str]:
+        lines = ["# TYPE response_cache_events_total counter"]
+        lines.extend(
+            f'response_cache_events_total{{event="{k}"}} {v}' for k, v in self.stats().items() if k != "size"
+        )
+        if isinstance(self.backend, MemoryCache):
+            lines.append("# TYPE response_cache_entries gauge")
+            lines.append(f"response_cache_entries {len(self.backend)}")
+        return lines
+
+
+def _build_backend() -> Optional[CacheBackend]:
+    if settings.CACHE_BACKEND == "none":
+        return None
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache.from_url(settings.CACHE_REDIS_URL)
+    return MemoryCache(settings.CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(_build_backend(), settings.CACHE_TTL)
+register_collector(response_cache.render_metrics)
@@ -1,10 +1,73 @@
 from pydantic_settings import BaseSettings
-from typing import ClassVar
+from typing import ClassVar, List, Literal, Optional
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Spy Cat Agency API"
     DATABASE_URL: str = "sqlite+aiosqlite:///./spy_cat_agency.db"
+    MIGRATE_ON_STARTUP: bool = True
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    ACCESS_LOG_LEVEL: str = "INFO"
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0  # share of fast, successful requests logged
+    ACCESS_LOG_SLOW_MS: float = 500.0  # requests at least this slow are always logged
+    METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+    # Browser origins allowed to call the API (JSON list in the environment)
+    CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
+    CORS_MAX_AGE: int = 7200  # seconds a browser may reuse a preflight answer (Chromium caps at 2h)
+    # Worker processes for `python -m app.cli serve` (uvicorn reads the same variable)
+    WEB_CONCURRENCY: int = 1
+    # Pooling (PostgreSQL); SQLite uses SQLAlchemy's defaults
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    # Connections for all workers together; when set, each worker's pool gets its share
+    DB_MAX_CONNECTIONS: Optional[int] = None
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 256  # asyncpg prepared statements per connection
+    DB_QUERY_CACHE_SIZE: int = 500  # SQLAlchemy compiled statement cache
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL"] = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     cat_api_url: str = "https://api.thecatapi.com/v1/breeds"
+    BREED_CACHE_TTL: int = 24 * 60 * 60
+    BREED_REFRESH_RETRY: int = 60
+    BREED_FETCH_TIMEOUT: float = 10.0
+    BREED_SNAPSHOT_PATH: Optional[str] = None
+    BULK_CHUNK_SIZE: int = 1000
+    BULK_MAX_ITEMS: int = 50000
+    # Response cache for GET /cats and /missions; use redis with more than one worker
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_TTL: float = 30.0
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    # GET /missions/events
+    EVENTS_QUEUE_SIZE: int = 100  # per subscriber; a client this far behind is disconnected
+    EVENTS_REPLAY_SIZE: int = 1000  # recent events kept for Last-Event-ID resume
+    EVENTS_MAX_SUBSCRIBERS: int = 10000
+    EVENTS_HEARTBEAT: float = 15.0
+    SEARCH_RANK_WINDOW: int = 1000  # newest name matches, and newest matches overall, ranked by GET /targets/search
+    # Response compression, in order of preference; zstd needs `zstandard` (or Python 3.14)
+    # and br needs `brotli`, encodings whose package is missing are skipped. [] turns it off
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_MIN_SIZE: int = 1024  # smaller bodies are sent as they are
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    # Opt in to building GET /cats and /missions lists from SQL rows and dumping them
+    # directly (orjson when installed) instead of through ORM objects and response schemas
+    JSON_FAST_PATH: bool = False
+    # POST /missions/auto-assign: cost = |experience - years wanted| + salary weight * salary
+    AUTO_ASSIGN_YEARS_PER_TARGET: float = 2.0  # experience a mission wants per open target
+    AUTO_ASSIGN_SALARY_WEIGHT: float = 0.001  # years of experience mismatch one unit of salary is worth
+    AUTO_ASSIGN_OPTIMAL_MAX: int = 20000  # missions per strategy=optimal run (time grows quadratically)
+    # Background jobs (?background=true, POST /targets/search/reindex), per worker process
+    JOBS_WORKERS: int = 2  # jobs running at once
+    JOBS_QUEUE_SIZE: int = 100  # jobs waiting; further submissions get 503
+    JOBS_SHUTDOWN_TIMEOUT: float = 30.0  # seconds queued and running jobs get to finish on shutdown
+    STATS_CACHE_TTL: float = 5.0  # GET /stats memo per process; 0 aggregates on every request
     
     model_config = {"case_sensitive": False, "env_file": ".env"}
 
@@ -0,0 +1,148 @@
+import asyncio
+import itertools
+import json
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.core.metrics import register_collector
+
+
+@dataclass
+class Event:
+    id: int
+    type: str
+    data: Dict[str, Any]
+
+    @cached_property
+    def frame(self) -> bytes:
+        """The server-sent event frame, rendered once however many subscribers get it."""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n".encode()
+
+
+# Queued by the hub's heartbeat task into idle subscribers' queues
+_KEEPALIVE = object()
+
+
+class Subscriber:
+    """One listener's bounded queue. A None entry tells the stream to end."""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        # Make room for the sentinel; the client resumes from the replay buffer
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventHub:
+    """In-process fan-out of change events to any number of subscribers.
+
+    publish() never blocks or awaits: each subscriber has its own bounded queue
+    and one that falls behind is disconnected rather than slowing the writer or
+    the other subscribers. Recent events are kept so a reconnecting client can
+    resume from Last-Event-ID. An idle subscriber costs only its empty queue:
+    keepalives come from one shared task instead of a timer per connection.
+    """
+
+    def __init__(self, queue_size: int, replay_size: int, max_subscribers: int, heartbeat: float = 15.0):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.heartbeat = heartbeat
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._subscribers: Set[Subscriber] = set()
+        self._recent: Deque[Event] = deque(maxlen=replay_size)
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscriber:
+        """Register a subscriber, preloaded with the events after `last_event_id`.
+
+        Raises RuntimeError when the hub is full.
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            raise RuntimeError("Too many event subscribers")
+        subscriber = Subscriber(self.queue_size)
+        if last_event_id is not None:
+            latest = self._recent[-1].id if self._recent else 0
+            oldest = self._recent[0].id if self._recent else 1
+            missed = [event for event in self._recent if event.id > last_event_id]
+            if not oldest - 1 <= last_event_id <= latest or len(missed) >= self.queue_size:
+                # Missed events are gone, too many, or from before a restart: the client must refetch
+                missed = [Event(latest, "resync", {})]
+            for event in missed:
+                subscriber.queue.put_nowait(event)
+        self._subscribers.add(subscriber)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
+        return subscriber
+
+    async def _send_heartbeats(self) -> None:
+        while self._subscribers:
+            await asyncio.sleep(self.heartbeat)
+            for subscriber in list(self._subscribers):
+                if subscriber.queue.empty():
+                    subscriber.queue.put_nowait(_KEEPALIVE)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def publish(self, type: str, **data: Any) -> Event:
+        event = Event(next(self._ids), type, data)
+        self._recent.append(event)
+        self.published += 1
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self.unsubscribe(subscriber)
+                subscriber.close()
+        return event
+
+    def close(self) -> None:
+        """End every open stream (on shutdown)."""
+        for subscriber in list(self._subscribers):
+            self.unsubscribe(subscriber)
+            subscriber.close()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def stream(self, subscriber: Subscriber) -> AsyncIterator[bytes]:
+        """SSE frames for `subscriber`, with a comment line when it has been idle for a heartbeat."""
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                item = await subscriber.queue.get()
+                if item is None:
+                    return
+                yield b": keepalive\n\n" if item is _KEEPALIVE else item.frame
+        finally:
+            self.unsubscribe(subscriber)
+
+    def render_metrics(self) -> List[str]:
+        return [
+            "# TYPE events_subscribers gauge",
+            f"events_subscribers {len(self._subscribers)}",
+            "# TYPE events_published_total counter",
+            f"events_published_total {self.published}",
+            "# TYPE events_dropped_subscribers_total counter",
+            f"events_dropped_subscribers_total {self.dropped}",
+        ]
+
+
+event_hub = EventHub(
+    settings.EVENTS_QUEUE_SIZE, settings.EVENTS_REPLAY_SIZE, settings.EVENTS_MAX_SUBSCRIBERS,
+    settings.EVENTS_HEARTBEAT,
+)
+register_collector(event_hub.render_metrics)
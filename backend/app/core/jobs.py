@@ -0,0 +1,186 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import register_collector
+from app.crud import create_job, start_job, update_job_progress, finish_job, abandon_jobs
+from app.database import AsyncSessionLocal
+from app.models import Job
+
+
+class JobCancelled(Exception):
+    """Raised by JobContext.progress() to stop a job at a safe point."""
+
+
+class JobContext:
+    """Handed to a running job. Progress reports are where a job can be
+    stopped: on a cancel request (from any worker process) or on shutdown."""
+
+    def __init__(self, job_id: int, queue: "JobQueue"):
+        self.job_id = job_id
+        self._queue = queue
+
+    async def progress(self, done: int, total: Optional[int] = None) -> None:
+        """Record progress; raises JobCancelled when the job should stop."""
+        if self._queue.stopping:
+            raise JobCancelled("Server shut down while the job ran")
+        async with self._queue.session_factory() as db:
+            wanted = await update_job_progress(db, self.job_id, done, total)
+        if not wanted:
+            raise JobCancelled("Cancelled while running")
+
+
+# What a job runs: gets its own session and context, returns a JSON-able result or a model
+JobFunction = Callable[[AsyncSession, JobContext], Awaitable[Any]]
+
+
+class JobQueue:
+    """Bounded in-process worker pool for jobs recorded in the jobs table.
+
+    submit() records the job and queues its function. Instead of waiting, it
+    raises RuntimeError once `queue_size` jobs are waiting, so a burst of
+    submissions is turned away rather than piling up. At most `workers` jobs
+    run at a time, each on its own session. The function lives in this
+    process, so a job runs where it was queued; its row is what every worker
+    answers GET /jobs/{id} from. Workers start and drain with the app's
+    lifespan.
+
+    Jobs are never interrupted mid-statement (SQLite would keep the aborted
+    transaction's lock): they stop at their next progress report.
+    """
+
+    def __init__(self, workers: int, queue_size: int, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.session_factory = session_factory
+        self.stopping = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._running: Set[int] = set()
+        self._waiting = 0
+        self.rejected = 0
+        self.finished = {"succeeded": 0, "failed": 0, "cancelled": 0}
+
+    def start(self) -> None:
+        """Start the workers on the running event loop."""
+        if self._tasks:
+            return
+        self.stopping = False
+        self._queue = asyncio.Queue()
+        self._waiting = 0
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(max(1, self.workers))]
+
+    async def submit(self, db: AsyncSession, type: str, params: Optional[Dict[str, Any]], run: JobFunction) -> Job:
+        """Record a job and queue `run`. Raises RuntimeError when the queue is full or stopped."""
+        if not self._tasks:
+            raise RuntimeError("Job queue is not running")
+        if self._waiting >= self.queue_size:
+            self.rejected += 1
+            raise RuntimeError(f"Job queue is full ({self.queue_size} jobs waiting); retry later")
+        self._waiting += 1  # taken before the insert awaits, so concurrent submits see it
+        try:
+            job = await create_job(db, type, params)
+        except BaseException:
+            self._waiting -= 1
+            raise
+        self._queue.put_nowait((job.id, run))
+        return job
+
+    async def _work(self) -> None:
+        while not self.stopping:
+            job_id, run = await self._queue.get()
+            self._waiting -= 1
+            self._running.add(job_id)
+            try:
+                await self._run(job_id, run)
+            except Exception as e:
+                # Starting or recording the job failed (a locked or lost database):
+                # keep this worker alive and don't leave the row queued or running
+                logger.exception("Job %s could not be run", job_id)
+                await self._abandon(job_id, f"Job could not be run: {e}")
+            finally:
+                self._running.discard(job_id)
+                self._queue.task_done()
+
+    async def _run(self, job_id: int, run: JobFunction) -> None:
+        result, error = None, None
+        async with self.session_factory() as db:
+            if not await start_job(db, job_id):
+                return  # cancelled while it waited
+            try:
+                result = await run(db, JobContext(job_id, self))
+                status = "succeeded"
+            except JobCancelled as e:
+                status, error = "cancelled", str(e)
+            except Exception as e:
+                status, error = "failed", str(getattr(e, "detail", None) or e)
+                logger.warning("Job %s failed: %s", job_id, error, exc_info=not hasattr(e, "detail"))
+        if isinstance(result, BaseModel):
+            result = result.model_dump(mode="json")
+        async with self.session_factory() as db:
+            await finish_job(db, job_id, status, result, error)
+        self.finished[status] += 1
+
+    async def _abandon(self, job_id: int, error: str) -> None:
+        """Best-effort: mark a job failed; recover() handles it if even this fails."""
+        try:
+            async with self.session_factory() as db:
+                if await abandon_jobs(db, "failed", error, [job_id]):
+                    self.finished["failed"] += 1
+        except Exception:
+            logger.exception("Could not mark job %s as failed", job_id)
+
+    async def stop(self, timeout: float) -> None:
+        """Refuse new jobs and give queued and running ones `timeout` seconds
+        to finish. Then running jobs stop at their next progress report, with
+        `timeout` seconds more to get there; jobs that never started are
+        marked cancelled. Whatever still runs after that is cancelled outright
+        and failed by recover() on the next startup."""
+        if not self._tasks:
+            return
+        tasks, self._tasks = self._tasks, []
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopping %d running jobs and dropping %d queued ones", len(self._running), self._waiting)
+        self.stopping = True
+        _, still_running = await asyncio.wait(tasks, timeout=timeout if self._running else 0)
+        for task in still_running:
+            task.cancel()  # idle workers, or jobs that never report progress
+        await asyncio.gather(*tasks, return_exceptions=True)
+        never_started: List[int] = []
+        while not self._queue.empty():
+            never_started.append(self._queue.get_nowait()[0])
+        if never_started:
+            async with self.session_factory() as db:
+                await abandon_jobs(db, "cancelled", "Server shut down before the job started", never_started)
+
+    async def recover(self) -> int:
+        """Fail the jobs a previous run left queued or running, since their work
+        died with it. One-time startup only: other live workers' jobs look the same."""
+        async with self.session_factory() as db:
+            count = await abandon_jobs(db, "failed", "Interrupted by a server restart")
+        if count:
+            logger.warning("Marked %d interrupted jobs as failed", count)
+        return count
+
+    def render_metrics(self) -> List[str]:
+        lines = [
+            "# TYPE jobs_waiting gauge",
+            f"jobs_waiting {self._waiting}",
+            "# TYPE jobs_running gauge",
+            f"jobs_running {len(self._running)}",
+            "# TYPE jobs_rejected_total counter",
+            f"jobs_rejected_total {self.rejected}",
+            "# TYPE jobs_finished_total counter",
+        ]
+        lines += [f'jobs_finished_total{{status="{status}"}} {count}' for status, count in self.finished.items()]
+        return lines
+
+
+job_queue = JobQueue(settings.JOBS_WORKERS, settings.JOBS_QUEUE_SIZE)
+register_collector(job_queue.render_metrics)
@@ -1,15 +1,116 @@
+import copy
+import json
 import logging
+import queue
+import random
 import sys
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps records with the current request ID. Attached to the QueueHandler so
+    it runs in the logging task, before the record crosses to the writer thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        payload.update((k, v) for k, v in vars(record).items() if k not in _RECORD_ATTRS)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+_traceback_formatter = logging.Formatter()
+
+
+class TracebackQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback in its own field.
+
+    The stock prepare() folds it into the message text and drops exc_info,
+    which can't be pickled or outlive the frame anyway. Here it is rendered
+    into exc_text instead, so JsonFormatter emits it as `exc_info` and the
+    plain formatter still appends it after the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener: QueueListener | None = None
+
 
 def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    """Route all records through a queue to a background thread that writes to stdout.
+
+    The event loop only pays for enqueueing; formatting and the blocking write
+    happen on the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s")
+        )
+
+    queue_handler = TracebackQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.LOG_LEVEL)
+
+    _listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
 
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    access_logger.setLevel(settings.ACCESS_LOG_LEVEL)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def should_log_access(status_code: int, duration: float) -> bool:
+    """Errors and slow requests are always logged; the rest is sampled."""
+    if status_code >= 500 or duration * 1000 >= settings.ACCESS_LOG_SLOW_MS:
+        return True
+    rate = settings.ACCESS_LOG_SAMPLE_RATE
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
 
 logger = logging.getLogger("spy_cat_agency")
+access_logger = logging.getLogger("spy_cat_agency.access")
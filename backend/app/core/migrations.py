@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logger import logger
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+# Schema that the pre-migration create_all() startup produced
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    return config
+
+
+def _upgrade(connection: Connection) -> None:
+    config = alembic_config(connection)
+    tables = inspect(connection).get_table_names()
+    if "alembic_version" not in tables and "cats" in tables:
+        logger.info("Adopting existing unversioned database at revision %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+async def run_migrations(engine: AsyncEngine) -> None:
+    """Upgrade the database to the latest Alembic revision."""
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade)
@@ -0,0 +1,19 @@
+from typing import Any
+
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # optional; pydantic-core's encoder is the fallback
+    orjson = None
+
+
+def json_dumps(value: Any) -> bytes:
+    """Compact JSON bytes of plain data (dicts, lists, strings, numbers, bools, None).
+
+    For bodies assembled from SQL rows rather than validated through a
+    response schema. Uses orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return to_json(value)
@@ -1,11 +1,27 @@
-from app.crud.cat import create_cat, get_cat, get_cats, update_cat, delete_cat
+from app.crud.cat import (
+    create_cat, insert_cats, get_cat, get_cats, stream_cats, update_cat, delete_cat,
+    cat_version, get_cat_version, get_cat_versions, get_cat_rows, cat_row_version
+)
 from app.crud.mission import (
-    create_mission, get_mission, get_missions, delete_mission,
-    assign_cat_to_mission, update_target
+    create_mission, insert_missions, get_mission, get_missions, stream_missions, delete_mission,
+    assign_cat_to_mission, get_assignment_candidates, assign_cats_to_missions,
+    update_target, update_targets, invalidate_mission,
+    mission_version, get_mission_version, get_mission_versions, get_mission_rows
+)
+from app.crud.stats import get_stats
+from app.crud.job import (
+    create_job, get_job, start_job, update_job_progress, finish_job, cancel_job, abandon_jobs
 )
+from app.crud.search import search_targets, rebuild_search_index
 
 __all__ = [
-    "create_cat", "get_cat", "get_cats", "update_cat", "delete_cat",
-    "create_mission", "get_mission", "get_missions", "delete_mission",
-    "assign_cat_to_mission", "update_target"
+    "create_cat", "insert_cats", "get_cat", "get_cats", "stream_cats", "update_cat", "delete_cat",
+    "cat_version", "get_cat_version", "get_cat_versions", "get_cat_rows", "cat_row_version",
+    "create_mission", "insert_missions", "get_mission", "get_missions", "stream_missions",
+    "delete_mission", "assign_cat_to_mission", "get_assignment_candidates", "assign_cats_to_missions",
+    "update_target", "update_targets",
+    "invalidate_mission", "mission_version", "get_mission_version", "get_mission_versions",
+    "get_mission_rows",
+    "get_stats", "search_targets", "rebuild_search_index",
+    "create_job", "get_job", "start_job", "update_job_progress", "finish_job", "cancel_job", "abandon_jobs"
 ]
@@ -1,9 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy.orm import load_only
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from app.models import Cat
-from app.schemas import CatCreate, CatUpdate
+from app.core.cache import response_cache
+from app.core.events import event_hub
+from app.models import Cat, Mission
+from app.schemas import CatCreate, CatUpdate, CatFilters, CatResponse
+from app.crud.pagination import apply_keyset, sort_column
+from app.crud.utils import insert_returning_ids
 
 
 async def create_cat(db: AsyncSession, cat_data: CatCreate) -> Cat:
@@ -17,30 +22,155 @@ async def create_cat(db: AsyncSession, cat_data: CatCreate) -> Cat:
     db.add(cat)
     await db.commit()
     await db.refresh(cat)
+    await response_cache.invalidate("cats")
     return cat
 
 
+async def insert_cats(db: AsyncSession, cats: List[CatCreate]) -> List[int]:
+    """Insert many cats in one executemany statement; returns ids in input order.
+
+    Does not commit, so the caller controls the transaction.
+    """
+    return await insert_returning_ids(db, Cat, [cat.model_dump() for cat in cats])
+
+
 async def get_cat(db: AsyncSession, cat_id: int) -> Optional[Cat]:
     """Get a cat by ID."""
     result = await db.execute(select(Cat).filter(Cat.id == cat_id))
     return result.scalars().first()
 
 
-async def get_cats(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Cat]:
-    """Get all cats with pagination."""
-    result = await db.execute(select(Cat).offset(skip).limit(limit))
+def _page(query, skip: int, limit: int, cursor: Optional[str], order_by: str, filters: Optional[CatFilters]):
+    if filters is not None:
+        if filters.breed is not None:
+            query = query.filter(Cat.breed == filters.breed)
+        if filters.min_salary is not None:
+            query = query.filter(Cat.salary >= filters.min_salary)
+        if filters.max_salary is not None:
+            query = query.filter(Cat.salary <= filters.max_salary)
+    query = apply_keyset(query, Cat, order_by, cursor)
+    if cursor is None and skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+async def get_cats(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[CatFilters] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Cat]:
+    """Get all cats with pagination.
+
+    When `cursor` is given the page is fetched by keyset seek on (order_by, id)
+    and `skip` is ignored. With `fields` only those columns are loaded, plus
+    the id, version and sort column that paging and ETags need.
+    """
+    query = select(Cat)
+    if fields is not None:
+        columns = {*fields, "version", sort_column(order_by)}
+        query = query.options(load_only(*(getattr(Cat, name) for name in columns)))
+    result = await db.execute(_page(query, skip, limit, cursor, order_by, filters))
     return list(result.scalars().all())
 
 
+def cat_version(cat: Cat) -> Tuple:
+    """What a cat's representation depends on; matches the rows of get_cat_versions."""
+    return (cat.id, cat.version)
+
+
+async def get_cat_rows(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[CatFilters] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """The page get_cats() would return, as plain dicts instead of ORM objects.
+
+    Each row has the CatResponse fields (or only `fields`) plus the id, version
+    and sort column.
+    """
+    names = list(dict.fromkeys([*(fields or CatResponse.model_fields), "id", "version", sort_column(order_by)]))
+    query = select(*(getattr(Cat, name) for name in names))
+    result = await db.execute(_page(query, skip, limit, cursor, order_by, filters))
+    return [dict(zip(names, row)) for row in result]
+
+
+def cat_row_version(row: Mapping[str, Any]) -> Tuple:
+    """cat_version() of a get_cat_rows() row."""
+    return (row["id"], row["version"])
+
+
+async def get_cat_version(db: AsyncSession, cat_id: int) -> Optional[Tuple]:
+    """cat_version() of one cat without loading the row, or None if it does not exist."""
+    result = await db.execute(select(Cat.id, Cat.version).where(Cat.id == cat_id))
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def get_cat_versions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[CatFilters] = None,
+) -> List[Tuple]:
+    """cat_version() of every cat on the page get_cats() would return."""
+    result = await db.execute(_page(select(Cat.id, Cat.version), skip, limit, cursor, order_by, filters))
+    return [tuple(row) for row in result]
+
+
+async def stream_cats(db: AsyncSession, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+    """Yield every cat as a plain dict from a server-side cursor, in id order."""
+    result = await db.stream(
+        select(Cat.id, Cat.name, Cat.years_of_experience, Cat.breed, Cat.salary)
+        .order_by(Cat.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for row in result.mappings():
+        yield dict(row)
+
+
+async def _invalidate_cat(cat_id: int, mission_id: Optional[int]) -> None:
+    """Drop cached responses showing this cat, including its mission's (which embeds it)."""
+    await response_cache.invalidate("cats", [cat_id])
+    if mission_id is not None:
+        await response_cache.invalidate("missions", [mission_id])
+
+
 async def update_cat(db: AsyncSession, cat: Cat, cat_update: CatUpdate) -> Cat:
     """Update cat salary."""
     cat.salary = cat_update.salary
+    cat.version = Cat.version + 1
     await db.commit()
-    await db.refresh(cat)
+    # Nothing is generated server-side, so the row is not re-read; the query
+    # below only finds the mission whose cached response embeds this cat
+    mission_id = None
+    if response_cache.backend is not None:
+        result = await db.execute(select(Mission.id).where(Mission.cat_id == cat.id))
+        mission_id = result.scalar_one_or_none()
+    await _invalidate_cat(cat.id, mission_id)
     return cat
 
 
 async def delete_cat(db: AsyncSession, cat: Cat) -> None:
     """Delete a cat."""
+    # The flush loads the mission anyway to unlink it; loading it first lets us invalidate it
+    mission = await db.run_sync(lambda _: cat.mission)
+    mission_id = None
+    if mission is not None:
+        mission_id = mission.id
+        # Unlinking the cat changes the mission; folded into the same UPDATE
+        mission.version = Mission.version + 1
     await db.delete(cat)
     await db.commit()
+    await _invalidate_cat(cat.id, mission_id)
+    if mission_id is not None:
+        event_hub.publish("mission.unassigned", mission_id=mission_id, cat_id=cat.id)
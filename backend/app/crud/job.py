@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Job
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def create_job(db: AsyncSession, type: str, params: Optional[Dict[str, Any]] = None) -> Job:
+    """Record a queued job."""
+    job = Job(type=type, status="queued", params=params, created_at=_now())
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: int) -> Optional[Job]:
+    """Get a job by ID, as currently stored (other processes update it)."""
+    result = await db.execute(
+        select(Job).where(Job.id == job_id).execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+
+async def start_job(db: AsyncSession, job_id: int) -> bool:
+    """Move a queued job to running; False when it was cancelled meanwhile."""
+    result = await db.execute(
+        update(Job).where(Job.id == job_id, Job.status == "queued").values(status="running", started_at=_now())
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def update_job_progress(db: AsyncSession, job_id: int, progress: int, total: Optional[int] = None) -> bool:
+    """Store a running job's progress; False when its cancellation was requested."""
+    values: Dict[str, Any] = {"progress": progress}
+    if total is not None:
+        values["total"] = total
+    result = await db.execute(
+        update(Job).where(Job.id == job_id, Job.cancel_requested.is_(False)).values(**values)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def finish_job(
+    db: AsyncSession, job_id: int, status: str, result: Any = None, error: Optional[str] = None
+) -> None:
+    """Record how a running job ended: succeeded, failed or cancelled."""
+    await db.execute(
+        update(Job).where(Job.id == job_id, Job.status == "running")
+        .values(status=status, result=result, error=error, finished_at=_now())
+    )
+    await db.commit()
+
+
+async def cancel_job(db: AsyncSession, job_id: int) -> Optional[Job]:
+    """Cancel a queued job outright, or flag a running one for its process to stop.
+
+    Both are conditional UPDATEs, so a job that finishes meanwhile keeps its
+    outcome. Returns the job as stored afterwards, None when it does not exist.
+    """
+    queued = await db.execute(
+        update(Job).where(Job.id == job_id, Job.status == "queued")
+        .values(status="cancelled", error="Cancelled before it started", finished_at=_now())
+    )
+    if queued.rowcount == 0:
+        await db.execute(update(Job).where(Job.id == job_id, Job.status == "running").values(cancel_requested=True))
+    await db.commit()
+    return await get_job(db, job_id)
+
+
+async def abandon_jobs(db: AsyncSession, status: str, error: str, job_ids: Optional[Sequence[int]] = None) -> int:
+    """End queued or running jobs whose work is gone (shutdown, restart) with
+    `status` and `error`: the given ones, or every one when `job_ids` is None."""
+    statement = update(Job).where(Job.status.in_(ACTIVE_STATUSES))
+    if job_ids is not None:
+        statement = statement.where(Job.id.in_(job_ids))
+    result = await db.execute(statement.values(status=status, error=error, finished_at=_now()))
+    await db.commit()
+    return result.rowcount
@@ -1,9 +1,24 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, insert, update, exists, func, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, joinedload, aliased, load_only
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from app.models import Mission, Target
-from app.schemas import MissionCreate, TargetUpdate
+from app.core.cache import response_cache
+from app.core.events import event_hub
+from app.models import Cat, Mission, Target
+from app.schemas import MissionCreate, MissionFilters, TargetUpdate, CatResponse, TargetResponse
+from app.crud.pagination import apply_keyset
+from app.crud.utils import insert_returning_ids
+
+
+def _mission_load_options():
+    """Eager-load options so MissionResponse never touches a lazy relationship.
+
+    Targets come in one extra SELECT ... WHERE mission_id IN (...) and the cat
+    is joined into the main query, so a page costs two queries regardless of size.
+    """
+    return (selectinload(Mission.targets), joinedload(Mission.cat))
 
 
 async def create_mission(db: AsyncSession, mission_data: MissionCreate) -> Mission:
@@ -23,42 +38,365 @@ async def create_mission(db: AsyncSession, mission_data: MissionCreate) -> Missi
         db.add(target)
     
     await db.commit()
-    await db.refresh(mission)
-    return mission
+    await response_cache.invalidate("missions")
+    event_hub.publish("mission.created", mission_id=mission.id)
+    return await get_mission(db, mission.id)
+
+
+async def insert_missions(db: AsyncSession, missions: List[MissionCreate]) -> List[int]:
+    """Insert many missions and their targets with two executemany statements.
+
+    Returns mission ids in input order. Does not commit.
+    """
+    mission_ids = await insert_returning_ids(db, Mission, [{"is_completed": False} for _ in missions])
+
+    target_rows = [
+        {
+            "mission_id": mission_id,
+            "name": target_data.name,
+            "country": target_data.country,
+            "notes": "",
+            "is_completed": False,
+        }
+        for mission_id, mission_data in zip(mission_ids, missions)
+        for target_data in mission_data.targets
+    ]
+    await db.execute(insert(Target), target_rows)
+    return mission_ids
 
 
 async def get_mission(db: AsyncSession, mission_id: int) -> Optional[Mission]:
-    result = await db.execute(select(Mission).filter(Mission.id == mission_id))
+    """Get a mission by ID with its targets and cat loaded."""
+    result = await db.execute(
+        select(Mission)
+        .options(*_mission_load_options())
+        .filter(Mission.id == mission_id)
+        .execution_options(populate_existing=True)
+    )
     return result.scalars().first()
 
 
-async def get_missions(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Mission]:
-    """Get all missions with pagination."""
-    result = await db.execute(select(Mission).offset(skip).limit(limit))
+def _page(query, skip: int, limit: int, cursor: Optional[str], order_by: str, filters: Optional[MissionFilters]):
+    if filters is not None:
+        if filters.is_completed is not None:
+            query = query.filter(Mission.is_completed.is_(filters.is_completed))
+        if filters.assigned is not None:
+            query = query.filter(Mission.cat_id.is_not(None) if filters.assigned else Mission.cat_id.is_(None))
+        if filters.country is not None:
+            query = query.filter(
+                exists().where(Target.mission_id == Mission.id, Target.country == filters.country)
+            )
+    query = apply_keyset(query, Mission, order_by, cursor)
+    if cursor is None and skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def _projection_options(fields: Sequence[str]):
+    """Load only the requested columns, and only the relationships that were asked for."""
+    options = [load_only(Mission.version, *(getattr(Mission, f) for f in fields if f in ("cat_id", "is_completed")))]
+    if "targets" in fields:
+        options.append(selectinload(Mission.targets))
+    if "cat" in fields:
+        options.append(joinedload(Mission.cat))
+    return options
+
+
+async def get_missions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[MissionFilters] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Mission]:
+    """Get all missions with pagination (keyset on id when `cursor` is given).
+
+    With `fields`, relationships that are not listed are not loaded at all.
+    """
+    options = _mission_load_options() if fields is None else _projection_options(fields)
+    result = await db.execute(_page(select(Mission).options(*options), skip, limit, cursor, order_by, filters))
     return list(result.scalars().all())
 
 
+_CAT_FIELDS = tuple(CatResponse.model_fields)
+_TARGET_FIELDS = tuple(TargetResponse.model_fields)
+_IN_CHUNK = 500  # mission ids per targets query, as selectinload batches them
+
+
+async def get_mission_rows(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[MissionFilters] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[Dict[str, Any]], List[Tuple]]:
+    """The page get_missions() would return as plain dicts shaped like
+    MissionResponse, plus the mission_version(fields=fields) of each.
+
+    Same two queries as the ORM loader (the page with its cat joined in, then
+    its targets), but rows go straight into dicts, so there is no identity map
+    and no relationship bookkeeping. With `fields`, the cat and targets are
+    only read when listed.
+    """
+    with_cat = fields is None or "cat" in fields
+    with_targets = fields is None or "targets" in fields
+    columns = [Mission.id, Mission.version, Mission.cat_id, Mission.is_completed]
+    if with_cat:
+        columns.extend(getattr(Cat, name) for name in _CAT_FIELDS)
+        columns.append(Cat.version)
+    query = select(*columns)
+    if with_cat:
+        query = query.outerjoin(Cat, Cat.id == Mission.cat_id)
+    rows = (await db.execute(_page(query, skip, limit, cursor, order_by, filters))).all()
+
+    targets: Dict[int, List[Dict[str, Any]]] = {row[0]: [] for row in rows}
+    target_versions = dict.fromkeys(targets, 0)
+    if with_targets:
+        mission_ids = list(targets)
+        for start in range(0, len(mission_ids), _IN_CHUNK):
+            result = await db.execute(
+                select(Target.version, *(getattr(Target, name) for name in _TARGET_FIELDS))
+                .where(Target.mission_id.in_(mission_ids[start:start + _IN_CHUNK]))
+                .order_by(Target.mission_id, Target.id)
+            )
+            for version, *values in result:
+                target = dict(zip(_TARGET_FIELDS, values))
+                targets[target["mission_id"]].append(target)
+                target_versions[target["mission_id"]] += version
+
+    missions, versions = [], []
+    for row in rows:
+        mission_id, version, cat_id, is_completed = row[:4]
+        mission = {"id": mission_id, "cat_id": cat_id, "is_completed": is_completed}
+        parts = [mission_id, version]
+        if with_cat:
+            cat_values = row[4:4 + len(_CAT_FIELDS)]
+            has_cat = row[-1] is not None
+            mission["cat"] = dict(zip(_CAT_FIELDS, cat_values)) if has_cat else None
+            parts.append(row[-1])
+        if with_targets:
+            mission["targets"] = targets[mission_id]
+            parts.append(target_versions[mission_id])
+        missions.append(mission)
+        versions.append(tuple(parts))
+    return missions, versions
+
+
+def mission_version(mission: Mission, fields: Optional[Sequence[str]] = None) -> Tuple:
+    """What a mission's representation depends on: its own row and, when they
+    are part of it, its cat's and its targets'.
+
+    Matches the rows of get_mission_versions. The mission's version also moves
+    when its cat is assigned or unlinked. Target versions only ever go up, so
+    their sum changes whenever any target does.
+    """
+    parts = [mission.id, mission.version]
+    if fields is None or "cat" in fields:
+        parts.append(mission.cat.version if mission.cat is not None else None)
+    if fields is None or "targets" in fields:
+        parts.append(sum(target.version for target in mission.targets))
+    return tuple(parts)
+
+
+def _mission_version_query(fields: Optional[Sequence[str]] = None):
+    columns = [Mission.id, Mission.version]
+    if fields is None or "cat" in fields:
+        columns.append(Cat.version)
+    if fields is None or "targets" in fields:
+        columns.append(
+            select(func.coalesce(func.sum(Target.version), 0))
+            .where(Target.mission_id == Mission.id)
+            .scalar_subquery()
+        )
+    query = select(*columns)
+    if fields is None or "cat" in fields:
+        query = query.outerjoin(Cat, Cat.id == Mission.cat_id)
+    return query
+
+
+async def get_mission_version(db: AsyncSession, mission_id: int) -> Optional[Tuple]:
+    """mission_version() of one mission in a single small query, or None if it does not exist."""
+    result = await db.execute(_mission_version_query().where(Mission.id == mission_id))
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def get_mission_versions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    filters: Optional[MissionFilters] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Tuple]:
+    """mission_version(fields=fields) of every mission on the page get_missions() would return."""
+    result = await db.execute(_page(_mission_version_query(fields), skip, limit, cursor, order_by, filters))
+    return [tuple(row) for row in result]
+
+
+async def stream_missions(db: AsyncSession, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+    """Yield every mission with its targets inline, from one streamed outer join.
+
+    Rows arrive ordered by mission id, so only the mission being assembled is
+    held in memory.
+    """
+    result = await db.stream(
+        select(
+            Mission.id, Mission.cat_id, Mission.is_completed,
+            Target.id.label("target_id"), Target.name, Target.country,
+            Target.notes, Target.is_completed.label("target_is_completed"),
+        )
+        .outerjoin(Target, Target.mission_id == Mission.id)
+        .order_by(Mission.id, Target.id)
+        .execution_options(yield_per=batch_size)
+    )
+    current = None
+    async for row in result.mappings():
+        if current is None or current["id"] != row["id"]:
+            if current is not None:
+                yield current
+            current = {
+                "id": row["id"],
+                "cat_id": row["cat_id"],
+                "is_completed": row["is_completed"],
+                "targets": [],
+            }
+        if row["target_id"] is not None:
+            current["targets"].append({
+                "id": row["target_id"],
+                "mission_id": row["id"],
+                "name": row["name"],
+                "country": row["country"],
+                "notes": row["notes"],
+                "is_completed": row["target_is_completed"],
+            })
+    if current is not None:
+        yield current
+
+
 async def delete_mission(db: AsyncSession, mission: Mission) -> None:
     """Delete a mission (targets cascade)."""
     await db.delete(mission)
     await db.commit()
+    await invalidate_mission(mission.id)
+    event_hub.publish("mission.deleted", mission_id=mission.id)
+
 
+async def assign_cat_to_mission(db: AsyncSession, mission_id: int, cat_id: int) -> Optional[Mission]:
+    """Assign a cat to a mission with one conditional UPDATE.
 
-async def assign_cat_to_mission(db: AsyncSession, mission: Mission, cat_id: int) -> Mission:
-    """Assign a cat to a mission."""
-    mission.cat_id = cat_id
+    The mission must be open and unassigned, the cat must exist and have no
+    other mission. Returns None when any of these does not hold, so concurrent
+    assignments cannot both succeed.
+    """
+    other = aliased(Mission)
+    result = await db.execute(
+        update(Mission)
+        .where(
+            Mission.id == mission_id,
+            Mission.cat_id.is_(None),
+            Mission.is_completed.is_not(True),
+            exists(select(Cat.id).where(Cat.id == cat_id)),
+            ~exists(select(other.id).where(other.cat_id == cat_id)),
+        )
+        .values(cat_id=cat_id, version=Mission.version + 1)
+        .returning(Mission.id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
+        return None
     await db.commit()
-    await db.refresh(mission)
-    return mission
+    await invalidate_mission(mission_id)
+    event_hub.publish("mission.assigned", mission_id=mission_id, cat_id=cat_id)
+    return await get_mission(db, mission_id)
 
 
-async def update_target(db: AsyncSession, target: Target, update_data: TargetUpdate) -> Target:
-    """Update target notes and/or completion status."""
-    if update_data.notes is not None:
-        target.notes = update_data.notes
-    if update_data.is_completed is not None:
-        target.is_completed = update_data.is_completed
-    
+async def get_assignment_candidates(db: AsyncSession) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int, float]]]:
+    """Open, unassigned missions as (id, open targets) and cats that never had a
+    mission as (id, years_of_experience, salary), both in id order.
+
+    A cat keeps its (unique) missions.cat_id after the mission completes, so
+    only cats without any mission row can be assigned. On PostgreSQL the
+    missions are locked (SKIP LOCKED) until the caller's transaction ends.
+    """
+    open_targets = (
+        select(func.count(Target.id))
+        .where(Target.mission_id == Mission.id, Target.is_completed.is_not(True))
+        .scalar_subquery()
+    )
+    missions = await db.execute(
+        select(Mission.id, open_targets)
+        .where(Mission.cat_id.is_(None), Mission.is_completed.is_not(True))
+        .order_by(Mission.id)
+        .with_for_update(skip_locked=True, of=Mission)
+    )
+    cats = await db.execute(
+        select(Cat.id, Cat.years_of_experience, Cat.salary)
+        .where(~exists(select(Mission.id).where(Mission.cat_id == Cat.id)))
+        .order_by(Cat.id)
+    )
+    return [tuple(row) for row in missions], [tuple(row) for row in cats]
+
+
+async def assign_cats_to_missions(db: AsyncSession, pairs: Sequence[Tuple[int, int]]) -> bool:
+    """Assign many (mission_id, cat_id) pairs in one transaction.
+
+    One executemany of assign_cat_to_mission's conditional UPDATE: each mission
+    must still be open and unassigned, and the unique cat_id rejects a cat
+    that was taken meanwhile. Returns False, with nothing written, when any
+    pair no longer holds.
+    """
+    statement = (
+        update(Mission.__table__)
+        .where(Mission.id == bindparam("m_id"), Mission.cat_id.is_(None), Mission.is_completed.is_not(True))
+        .values(cat_id=bindparam("c_id"), version=Mission.version + 1)
+    )
+    connection = await db.connection()
+    try:
+        result = await connection.execute(statement, [{"m_id": m, "c_id": c} for m, c in pairs])
+    except IntegrityError:
+        await db.rollback()
+        return False
+    # PostgreSQL cannot count executemany rows, but its missions are locked by get_assignment_candidates
+    if connection.dialect.supports_sane_multi_rowcount and result.rowcount != len(pairs):
+        await db.rollback()
+        return False
     await db.commit()
-    await db.refresh(target)
+    await response_cache.invalidate("missions", [m for m, _ in pairs])
+    event_hub.publish("missions.auto_assigned", assignments=[list(pair) for pair in pairs])
+    return True
+
+
+async def update_target(db: AsyncSession, target: Target, update_data: TargetUpdate) -> Target:
+    """Update target notes and/or completion status.
+
+    Flushes but does not commit, so the caller can finish the mission
+    completion check in the same transaction. Once it has committed, the caller
+    must also drop the mission's cached responses (invalidate_mission) and
+    publish the change event.
+    """
+    await update_targets(db, [(target, update_data)])
     return target
+
+
+async def update_targets(db: AsyncSession, updates: Sequence[Tuple[Target, TargetUpdate]]) -> None:
+    """Apply several target updates with a single flush; see update_target."""
+    for target, update_data in updates:
+        if update_data.notes is not None:
+            target.notes = update_data.notes
+        if update_data.is_completed is not None:
+            target.is_completed = update_data.is_completed
+        target.version = Target.version + 1
+
+    await db.flush()
+
+
+async def invalidate_mission(mission_id: int) -> None:
+    """Drop the cached responses of a mission after a committed change to it or its targets."""
+    await response_cache.invalidate("missions", [mission_id])
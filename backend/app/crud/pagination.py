@@ -0,0 +1,64 @@
+import base64
+import json
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(order_by: str, value: Any, last_id: int) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    payload = json.dumps([order_by, value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple[Any, int]:
+    """Decode a cursor and raise ValueError if it is malformed or for another ordering."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if field != order_by or not isinstance(last_id, int):
+        raise ValueError(f"Cursor does not match ordering '{order_by}'")
+    return value, last_id
+
+
+def sort_column(order_by: str) -> str:
+    """Column name of an ordering; a leading "-" means descending."""
+    return order_by.lstrip("-")
+
+
+def apply_keyset(query: Select, model, order_by: str, cursor: Optional[str]) -> Select:
+    """Order by (order_by, id) and seek past the cursor instead of using OFFSET.
+
+    `order_by` may be prefixed with "-" to sort descending; id then descends too,
+    so the seek stays a single row-value comparison.
+    """
+    descending = order_by.startswith("-")
+    column = getattr(model, sort_column(order_by))
+    if sort_column(order_by) == "id":
+        query = query.order_by(model.id.desc() if descending else model.id)
+        if cursor is not None:
+            _, last_id = decode_cursor(cursor, order_by)
+            query = query.filter(model.id < last_id if descending else model.id > last_id)
+        return query
+
+    if descending:
+        query = query.order_by(column.desc(), model.id.desc())
+    else:
+        query = query.order_by(column, model.id)
+    if cursor is not None:
+        value, last_id = decode_cursor(cursor, order_by)
+        key, seek = tuple_(column, model.id), tuple_(value, last_id)
+        query = query.filter(key < seek if descending else key > seek)
+    return query
+
+
+def next_cursor(items: Sequence[Any], limit: int, order_by: str = "id") -> Optional[str]:
+    """Cursor for the page after `items` (objects or dicts), or None if this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, Mapping):
+        return encode_cursor(order_by, last[sort_column(order_by)], last["id"])
+    return encode_cursor(order_by, getattr(last, sort_column(order_by)), last.id)
@@ -0,0 +1,200 @@
+import re
+import unicodedata
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.search import SEARCH_NAME_TABLE, SEARCH_NAME_VECTOR, SEARCH_TABLE, SEARCH_VECTOR
+
+# Relative weight of a hit in each column, and the BM25 saturation parameters
+COLUMN_WEIGHTS = {"name": 10.0, "country": 5.0, "notes": 1.0}
+K1, B = 1.2, 0.75
+SNIPPET_WORDS = 12
+
+_WORD = re.compile(r"\w+")
+
+# The candidates ranked on both backends: the newest :window matches with every
+# word in the name, and the newest :window matches anywhere. Each index is read
+# newest first and stops at the window, so a word found in millions of targets
+# costs no more than a rare one, and an old name match still gets ranked.
+_SQLITE_CANDIDATES = text(f"""
+    SELECT id, mission_id, name, country, notes, is_completed FROM targets
+    WHERE id IN (
+        SELECT * FROM (SELECT rowid FROM {SEARCH_NAME_TABLE} WHERE {SEARCH_NAME_TABLE} MATCH :query
+                       ORDER BY rowid DESC LIMIT :window)
+        UNION ALL
+        SELECT * FROM (SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query
+                       ORDER BY rowid DESC LIMIT :window)
+    )
+""")
+
+_POSTGRES_CANDIDATES = text(f"""
+    SELECT id, mission_id, name, country, notes, is_completed FROM targets
+    WHERE id IN (
+        (SELECT id FROM targets WHERE {SEARCH_NAME_VECTOR} @@ to_tsquery('simple', :query)
+         ORDER BY id DESC LIMIT :window)
+        UNION ALL
+        (SELECT id FROM targets WHERE {SEARCH_VECTOR} @@ to_tsquery('simple', :query)
+         ORDER BY id DESC LIMIT :window)
+    )
+""")
+
+# PostgreSQL has statistics for whole words but only guesses how many names a
+# prefix matches, and a wrong guess walks every row looking for the newest
+# name matches. Names matching a prefix are few, so their index is read instead.
+_POSTGRES_PREFIX_CANDIDATES = text(f"""
+    WITH names AS MATERIALIZED (
+        SELECT id FROM targets WHERE {SEARCH_NAME_VECTOR} @@ to_tsquery('simple', :query)
+    )
+    SELECT id, mission_id, name, country, notes, is_completed FROM targets
+    WHERE id IN (
+        (SELECT id FROM names ORDER BY id DESC LIMIT :window)
+        UNION ALL
+        (SELECT id FROM targets WHERE {SEARCH_VECTOR} @@ to_tsquery('simple', :query)
+         ORDER BY id DESC LIMIT :window)
+    )
+""")
+
+
+class Term(NamedTuple):
+    word: str
+    prefix: bool
+
+    def matches(self, token: str) -> bool:
+        return token.startswith(self.word) if self.prefix else token == self.word
+
+    def pattern(self) -> re.Pattern:
+        """Matches the term as a whole token of folded text."""
+        suffix = r"\w*" if self.prefix else ""
+        return re.compile(rf"\b{re.escape(self.word)}{suffix}\b")
+
+
+def normalize(text: str) -> str:
+    """Fold case and diacritics the way the FTS5 unicode61 tokenizer does."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def parse_query(q: str) -> List[Term]:
+    """Words of a user query; a trailing * makes a word a prefix. Other syntax is dropped."""
+    return [Term(normalize(m.group(1)), m.group(2) == "*") for m in re.finditer(r"(\w+)(\*?)", q)]
+
+
+def _sqlite_match(terms: Sequence[Term]) -> str:
+    return " ".join(f'"{t.word}"' + ("*" if t.prefix else "") for t in terms)
+
+
+def _tsquery(terms: Sequence[Term]) -> str:
+    return " & ".join(t.word + (":*" if t.prefix else "") for t in terms)
+
+
+def _rank(rows: Sequence[Row], terms: Sequence[Term]) -> List[float]:
+    """Column-weighted BM25 without the IDF factor, one score per row.
+
+    Every candidate contains every term, so IDF would only reweigh terms
+    against each other; computing it costs FTS5 a pass over each term's whole
+    doclist, which dominates queries for common words. Lengths are in
+    characters, which is close enough for normalization and needs no tokenizing.
+    """
+    patterns = [term.pattern() for term in terms]
+    scores = [0.0] * len(rows)
+    for column, weight in COLUMN_WEIGHTS.items():
+        texts = [normalize(getattr(row, column) or "") for row in rows]
+        average = max(1.0, sum(map(len, texts)) / len(texts))
+        norms = [K1 * (1 - B + B * len(text) / average) for text in texts]
+        for pattern in patterns:
+            counts = [len(pattern.findall(text)) for text in texts]
+            scores = [
+                score + weight * tf * (K1 + 1) / (tf + norm) if tf else score
+                for score, tf, norm in zip(scores, counts, norms)
+            ]
+    return scores
+
+
+def _snippet(row: Dict[str, Any], terms: Sequence[Term]) -> str:
+    """Up to SNIPPET_WORDS words around the first hit, hits in [brackets].
+
+    Taken from the notes when they match, otherwise from the name or country.
+    """
+    for column in ("notes", "name", "country"):
+        value = row[column] or ""
+        words = list(_WORD.finditer(value))
+        hits = [i for i, m in enumerate(words) if any(t.matches(normalize(m.group())) for t in terms)]
+        if not hits:
+            continue
+        first = max(0, min(hits[0] - 2, len(words) - SNIPPET_WORDS))
+        shown = words[first:first + SNIPPET_WORDS]
+        parts, position = [], shown[0].start()
+        for i, m in enumerate(shown, start=first):
+            parts.append(value[position:m.start()])
+            parts.append(f"[{m.group()}]" if i in hits else m.group())
+            position = m.end()
+        prefix = "…" if first > 0 else ""
+        suffix = "…" if first + SNIPPET_WORDS < len(words) else ""
+        return prefix + "".join(parts) + suffix
+    return ""
+
+
+async def _ranked_page(db: AsyncSession, terms: List[Term], skip: int, limit: int) -> List[Dict[str, Any]]:
+    if db.get_bind().dialect.name == "postgresql":
+        # A cached generic plan would read every query the same way
+        await db.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+        prefixed = any(term.prefix for term in terms)
+        candidates = _POSTGRES_PREFIX_CANDIDATES if prefixed else _POSTGRES_CANDIDATES
+        query = _tsquery(terms)
+    else:
+        candidates, query = _SQLITE_CANDIDATES, _sqlite_match(terms)
+    result = await db.execute(candidates, {"query": query, "window": settings.SEARCH_RANK_WINDOW})
+    rows = result.all()
+    if not rows:
+        return []
+
+    scores = _rank(rows, terms)
+    order = sorted(range(len(rows)), key=lambda i: (-scores[i], -rows[i].id))
+    page = []
+    for i in order[skip:skip + limit]:
+        hit = dict(rows[i]._mapping, rank=scores[i])
+        hit["snippet"] = _snippet(hit, terms)
+        page.append(hit)
+    return page
+
+
+async def search_targets(db: AsyncSession, q: str, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+    """Targets matching every word of `q` in name, country or notes, best first.
+
+    Only the newest SEARCH_RANK_WINDOW name matches and the newest
+    SEARCH_RANK_WINDOW matches overall are ranked, with the same column-weighted
+    BM25 on every backend. Raises ValueError when `q` has no searchable words,
+    or when the page ends past that window (it would come back cut short
+    without saying so).
+    """
+    terms = parse_query(q)
+    if not terms:
+        raise ValueError("Search query has no words")
+    if skip + limit > settings.SEARCH_RANK_WINDOW:
+        raise ValueError(
+            f"Only the best {settings.SEARCH_RANK_WINDOW} of the newest matches can be paged through "
+            f"(skip + limit); refine the query"
+        )
+    return await _ranked_page(db, terms, skip, limit)
+
+
+async def rebuild_search_index(db: AsyncSession) -> None:
+    """Rebuild the full-text indexes from the targets table and compact them.
+
+    On PostgreSQL this also refreshes the planner's per-word statistics, which
+    decide between walking the newest rows and reading the index.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(text("REINDEX INDEX ix_targets_search"))
+        await db.execute(text("REINDEX INDEX ix_targets_search_name"))
+        await db.execute(text("ANALYZE targets"))
+    else:
+        for table in (SEARCH_TABLE, SEARCH_NAME_TABLE):
+            await db.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
+            await db.execute(text(f"INSERT INTO {table}({table}) VALUES ('optimize')"))
+    await db.commit()
@@ -0,0 +1,63 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, func, literal, null, or_, select, union_all
+from typing import Any, Dict
+
+from app.models import Cat, Mission, Target
+
+
+def _count_true(condition) -> Any:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+async def get_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Dashboard aggregates in two GROUP BY statements, without loading any rows.
+
+    One groups cats by breed (joined to their mission for idleness), the other
+    groups targets by country and carries the mission totals as an extra row.
+    """
+    breeds = (await db.execute(
+        select(
+            Cat.breed,
+            func.count(Cat.id),
+            _count_true(or_(Mission.id.is_(None), Mission.is_completed)),
+            func.coalesce(func.sum(Cat.salary), 0),
+        )
+        .outerjoin(Mission, Mission.cat_id == Cat.id)
+        .group_by(Cat.breed)
+        .order_by(Cat.breed)
+    )).all()
+
+    by_country = select(
+        literal("country"), Target.country, func.count(Target.id), _count_true(Target.is_completed)
+    ).group_by(Target.country)
+    totals = select(
+        literal("missions"), null(), func.count(Mission.id), _count_true(Mission.is_completed)
+    )
+    rows = (await db.execute(union_all(by_country, totals))).all()
+
+    missions, completed_missions = next((total, done) for kind, _, total, done in rows if kind == "missions")
+    countries = sorted(
+        (
+            {
+                "country": country,
+                "targets": total,
+                "completed_targets": done,
+                "completion_rate": done / total,
+            }
+            for kind, country, total, done in rows if kind == "country"
+        ),
+        key=lambda row: row["country"],
+    )
+    return {
+        "cats": sum(row[1] for row in breeds),
+        "idle_cats": sum(row[2] for row in breeds),
+        "payroll": float(sum(row[3] for row in breeds)),
+        "missions": missions,
+        "completed_missions": completed_missions,
+        "completion_rate": completed_missions / missions if missions else 0.0,
+        "breeds": [
+            {"breed": breed, "cats": cats, "idle_cats": idle, "payroll": float(payroll)}
+            for breed, cats, idle, payroll in breeds
+        ],
+        "countries": countries,
+    }
@@ -0,0 +1,16 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def insert_returning_ids(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> List[int]:
+    """Batched INSERT ... RETURNING id with ids in the order of `rows`."""
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite cannot batch RETURNING with sort_by_parameter_order and falls back
+        # to one statement per row. Rowids of a multi-row INSERT are assigned in
+        # row order, so sorting the returned ids restores input order.
+        result = await db.execute(insert(model).returning(model.id), rows)
+        return sorted(result.scalars().all())
+    result = await db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return list(result.scalars().all())
@@ -1,15 +1,80 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Tuple
 
 from app.core.config import settings
 
+
+def worker_pool_size() -> Tuple[int, int]:
+    """(pool_size, max_overflow) for this process.
+
+    Every worker has its own pool, so with DB_MAX_CONNECTIONS set the budget
+    is split across WEB_CONCURRENCY workers instead of each one opening up to
+    DB_POOL_SIZE + DB_MAX_OVERFLOW connections.
+    """
+    if not settings.DB_MAX_CONNECTIONS:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    share = max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+    pool_size = min(settings.DB_POOL_SIZE, share)
+    return pool_size, share - pool_size
+
+
+def _engine_options(url) -> Dict[str, Any]:
+    """Backend-specific create_async_engine() arguments from Settings."""
+    options: Dict[str, Any] = {"echo": False, "query_cache_size": settings.DB_QUERY_CACHE_SIZE}
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        return options
+
+    pool_size, max_overflow = worker_pool_size()
+    options.update(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    if settings.SQLITE_WAL:
+        # In-memory databases silently stay in "memory" journal mode
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+
+
+def build_engine(database_url: str | None = None, **overrides: Any) -> AsyncEngine:
+    """Create an async engine for SQLite (aiosqlite) or PostgreSQL (asyncpg).
+
+    Pool sizing, recycling and pre-ping come from Settings for server databases;
+    SQLite connections get WAL/synchronous/mmap pragmas on connect.
+    """
+    url = make_url(database_url or settings.DATABASE_URL)
+    if url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in url.query:
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+
+    options = _engine_options(url)
+    if "poolclass" in overrides:
+        # Custom pools (NullPool, StaticPool) reject the sizing arguments
+        options = {k: v for k, v in options.items() if not k.startswith(("pool_", "max_overflow"))}
+    async_engine = create_async_engine(url, **{**options, **overrides})
+    if url.get_backend_name() == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return async_engine
+
+
 # Async Engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Still needed for SQLite
-    echo=False
-)
+engine = build_engine()
 
 # Async Session Factory
 AsyncSessionLocal = sessionmaker(
@@ -1,12 +1,19 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import time
 
-from app.database import engine, Base
-from app.api import cats_router, missions_router
+from app.database import engine
+from app.api import cats_router, missions_router, stats_router, targets_router, jobs_router
+from app.api.compression import CompressionMiddleware
+from app.api.middleware import RequestContextMiddleware
 from app.core.config import settings
-from app.core.logger import setup_logging, logger
+from app.core.logger import setup_logging, shutdown_logging, logger
+from app.core.migrations import run_migrations
+from app.core.metrics import render_metrics
+from app.core.events import event_hub
+from app.core.jobs import job_queue
+from app.services import BreedValidator
 from app.core.exceptions import (
     global_exception_handler,
     http_exception_handler,
@@ -21,11 +28,19 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     logger.info("Starting up...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if settings.MIGRATE_ON_STARTUP:
+        await run_migrations(engine)
+        await job_queue.recover()
+    # Serve breeds from the snapshot right away; a stale snapshot refreshes in the background
+    await BreedValidator.get_valid_breeds()
+    job_queue.start()
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await job_queue.stop(settings.JOBS_SHUTDOWN_TIMEOUT)
+    event_hub.close()
+    await BreedValidator.aclose()
+    shutdown_logging()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -39,31 +54,47 @@ app.add_exception_handler(Exception, global_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
-# Request Logging Middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    logger.info(
-        f"{request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.4f}s"
-    )
-    return response
+# Compression runs inside the request middleware, so its time is part of the request's
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=settings.COMPRESSION_ENCODINGS,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    levels={
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_QUALITY,
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+    },
+)
+
+# Request id, timings, metrics and access log (plain ASGI, streaming-safe)
+app.add_middleware(RequestContextMiddleware)
 
-# CORS middleware for frontend
+# CORS for the frontend; preflight answers are cached by the browser for CORS_MAX_AGE
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"], # Allow all for demo purposes or specific origins
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Content-Type", "If-None-Match", "Last-Event-ID", "X-Request-ID"],
+    expose_headers=["ETag", "Server-Timing", "X-Next-Cursor", "X-Request-ID"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Include routers
 app.include_router(cats_router)
 app.include_router(missions_router)
+app.include_router(stats_router)
+app.include_router(targets_router)
+app.include_router(jobs_router)
 
 
 @app.get("/")
 async def root():
     return {"message": "Welcome to Spy Cat Agency API", "docs": "/docs"}
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics: latency histograms per route, SQL and breed cache counters."""
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -1,5 +1,7 @@
 from app.models.cat import Cat
 from app.models.mission import Mission
 from app.models.target import Target
+from app.models.job import Job
+from app.models import search  # noqa: F401  (full-text index DDL for targets)
 
-__all__ = ["Cat", "Mission", "Target"]
+__all__ = ["Cat", "Mission", "Target", "Job"]
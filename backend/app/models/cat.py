@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -6,11 +6,22 @@ from app.database import Base
 
 class Cat(Base):
     __tablename__ = "cats"
+    __table_args__ = (
+        Index("ix_cats_breed", "breed"),
+        # Keyset pagination by salary / experience seeks on (column, id)
+        Index("ix_cats_salary_id", "salary", "id"),
+        Index("ix_cats_years_of_experience_id", "years_of_experience", "id"),
+        # Ids are never reused (SQLite would hand out a deleted max id again),
+        # so an ETag built from (id, version) can't match a different row
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     years_of_experience = Column(Integer, nullable=False)
     breed = Column(String, nullable=False)
     salary = Column(Float, nullable=False)
+    # Bumped by every write in app/crud; feeds the ETags of GET responses
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     mission = relationship("Mission", back_populates="cat", uselist=False)
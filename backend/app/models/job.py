@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, JSON, Index, false
+
+from app.database import Base
+
+
+class Job(Base):
+    """A background job (app/core/jobs.py). The row is its status as seen by
+    every worker process; the work itself stays in the process that queued it."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status", "status"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    type = Column(String, nullable=False)
+    # queued -> running -> succeeded | failed | cancelled (queued -> cancelled too)
+    status = Column(String, nullable=False, default="queued")
+    params = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    progress = Column(Integer, nullable=False, default=0, server_default="0")
+    total = Column(Integer, nullable=True)
+    # Set for a running job; the process running it stops at its next progress report
+    cancel_requested = Column(Boolean, nullable=False, default=False, server_default=false())
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -6,10 +6,15 @@ from app.database import Base
 
 class Mission(Base):
     __tablename__ = "missions"
+    __table_args__ = (
+        Index("ix_missions_is_completed_cat_id", "is_completed", "cat_id"),
+        {"sqlite_autoincrement": True},  # ids are never reused, see Cat
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     cat_id = Column(Integer, ForeignKey("cats.id"), nullable=True, unique=True)
     is_completed = Column(Boolean, default=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     cat = relationship("Cat", back_populates="mission")
     targets = relationship("Target", back_populates="mission", cascade="all, delete-orphan")
@@ -0,0 +1,94 @@
+"""Full-text indexes over targets (name, country, notes) for GET /targets/search.
+
+Each backend has two: one over all three columns and a small one over names
+alone, so the newest name matches can be found without walking every notes
+match of a common word.
+
+SQLite: external-content FTS5 tables kept in sync by triggers, so every write
+path (ORM, bulk executemany, cascade deletes) updates them. PostgreSQL:
+generated, stored tsvector columns with GIN indexes, one weighted by column
+and one for the name; neither needs syncing. They are columns rather than
+expression indexes so the planner has per-word statistics and a scan never
+re-tokenizes. Both backends tokenize without stemming ('simple', like FTS5's
+unicode61), so they match the same words.
+The indexes are outside Base.metadata, so they are created here for
+create_all() and by migrations 0005 and 0008 for migrated databases.
+"""
+from sqlalchemy import event
+
+from app.models.target import Target
+
+SEARCH_TABLE = "targets_fts"
+SEARCH_NAME_TABLE = "targets_fts_name"
+SEARCH_VECTOR = "search_vector"
+SEARCH_NAME_VECTOR = "name_vector"
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', name), 'A') || setweight(to_tsvector('simple', country), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+)
+POSTGRES_NAME_DOCUMENT = "to_tsvector('simple', name)"
+
+SQLITE_CREATE = [
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "name, country, notes, content='targets', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {SEARCH_TABLE}_ai AFTER INSERT ON targets BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+    f"CREATE TRIGGER {SEARCH_TABLE}_ad AFTER DELETE ON targets BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    "END",
+    # Only text changes touch the index; completion and version bumps do not
+    f"CREATE TRIGGER {SEARCH_TABLE}_au AFTER UPDATE OF name, country, notes ON targets BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+    f"CREATE VIRTUAL TABLE {SEARCH_NAME_TABLE} USING fts5("
+    "name, content='targets', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {SEARCH_NAME_TABLE}_ai AFTER INSERT ON targets BEGIN "
+    f"INSERT INTO {SEARCH_NAME_TABLE}(rowid, name) VALUES (new.id, new.name); "
+    "END",
+    f"CREATE TRIGGER {SEARCH_NAME_TABLE}_ad AFTER DELETE ON targets BEGIN "
+    f"INSERT INTO {SEARCH_NAME_TABLE}({SEARCH_NAME_TABLE}, rowid, name) VALUES ('delete', old.id, old.name); "
+    "END",
+    f"CREATE TRIGGER {SEARCH_NAME_TABLE}_au AFTER UPDATE OF name ON targets BEGIN "
+    f"INSERT INTO {SEARCH_NAME_TABLE}({SEARCH_NAME_TABLE}, rowid, name) VALUES ('delete', old.id, old.name); "
+    f"INSERT INTO {SEARCH_NAME_TABLE}(rowid, name) VALUES (new.id, new.name); "
+    "END",
+]
+SQLITE_DROP = [f"DROP TABLE IF EXISTS {SEARCH_TABLE}", f"DROP TABLE IF EXISTS {SEARCH_NAME_TABLE}"]
+
+POSTGRES_CREATE = [
+    f"ALTER TABLE targets ADD COLUMN {SEARCH_VECTOR} tsvector GENERATED ALWAYS AS ({POSTGRES_DOCUMENT}) STORED",
+    f"CREATE INDEX ix_targets_search ON targets USING gin ({SEARCH_VECTOR})",
+    f"ALTER TABLE targets ADD COLUMN {SEARCH_NAME_VECTOR} tsvector "
+    f"GENERATED ALWAYS AS ({POSTGRES_NAME_DOCUMENT}) STORED",
+    f"CREATE INDEX ix_targets_search_name ON targets USING gin ({SEARCH_NAME_VECTOR})",
+]
+POSTGRES_DROP = ["DROP INDEX IF EXISTS ix_targets_search_name", "DROP INDEX IF EXISTS ix_targets_search"]
+
+
+def _run(statements_by_dialect, connection) -> None:
+    for statement in statements_by_dialect.get(connection.dialect.name, []):
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Target.__table__, "after_create")
+def _create_search_index(target, connection, **kw) -> None:
+    _run({"sqlite": SQLITE_CREATE, "postgresql": POSTGRES_CREATE}, connection)
+
+
+@event.listens_for(Target.__table__, "before_drop")
+def _drop_search_index(target, connection, **kw) -> None:
+    _run({"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}, connection)
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Alembic autogenerate filter: the FTS5 tables (and their shadow tables),
+    the generated tsvector columns and the GIN indexes are not models."""
+    if type_ == "table":
+        return not name.startswith(SEARCH_TABLE)
+    if type_ == "index":
+        return not name.startswith("ix_targets_search")
+    return not (type_ == "column" and name in (SEARCH_VECTOR, SEARCH_NAME_VECTOR))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -6,6 +6,13 @@ from app.database import Base
 
 class Target(Base):
     __tablename__ = "targets"
+    __table_args__ = (
+        # Serves selectinload(Mission.targets) and the NOT EXISTS completion check
+        Index("ix_targets_mission_id_is_completed", "mission_id", "is_completed"),
+        # GET /stats groups by country without touching the table
+        Index("ix_targets_country_is_completed", "country", "is_completed"),
+        {"sqlite_autoincrement": True},  # ids are never reused, see Cat
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
@@ -13,5 +20,6 @@ class Target(Base):
     country = Column(String, nullable=False)
     notes = Column(Text, default="")
     is_completed = Column(Boolean, default=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     mission = relationship("Mission", back_populates="targets")
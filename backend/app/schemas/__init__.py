@@ -1,9 +1,17 @@
-from app.schemas.cat import CatCreate, CatUpdate, CatResponse
-from app.schemas.target import TargetCreate, TargetUpdate, TargetResponse
-from app.schemas.mission import MissionCreate, MissionResponse
+from app.schemas.cat import CatCreate, CatUpdate, CatResponse, CatFilters
+from app.schemas.target import TargetCreate, TargetUpdate, TargetBatchUpdate, TargetResponse, TargetSearchHit
+from app.schemas.mission import MissionCreate, MissionResponse, MissionFilters, MIN_TARGETS, MAX_TARGETS
+from app.schemas.bulk import BulkItemResult, BulkCreateResponse
+from app.schemas.stats import BreedStats, CountryStats, StatsResponse
+from app.schemas.assignment import AutoAssignRequest, Assignment, AutoAssignResponse
+from app.schemas.job import JobResponse
 
 __all__ = [
-    "CatCreate", "CatUpdate", "CatResponse",
-    "TargetCreate", "TargetUpdate", "TargetResponse",
-    "MissionCreate", "MissionResponse",
+    "CatCreate", "CatUpdate", "CatResponse", "CatFilters",
+    "TargetCreate", "TargetUpdate", "TargetBatchUpdate", "TargetResponse", "TargetSearchHit",
+    "MissionCreate", "MissionResponse", "MissionFilters", "MIN_TARGETS", "MAX_TARGETS",
+    "BulkItemResult", "BulkCreateResponse",
+    "BreedStats", "CountryStats", "StatsResponse",
+    "AutoAssignRequest", "Assignment", "AutoAssignResponse",
+    "JobResponse",
 ]
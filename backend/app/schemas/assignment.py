@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+
+
+class AutoAssignRequest(BaseModel):
+    strategy: Literal["greedy", "optimal"] = Field(
+        "greedy", description="greedy: hardest mission first takes the cheapest assignable cat; optimal: lowest total cost"
+    )
+    limit: Optional[int] = Field(None, ge=1, description="Assign at most this many missions, hardest first")
+
+
+class Assignment(BaseModel):
+    mission_id: int
+    cat_id: int
+    cost: float
+
+
+class AutoAssignResponse(BaseModel):
+    """Outcome of POST /missions/auto-assign.
+
+    assignable_cats counts cats that never had a mission: missions.cat_id is
+    unique and stays set once a mission completes, so only those can be
+    assigned. GET /stats's idle_cats also counts cats whose mission is completed.
+    """
+    strategy: Literal["greedy", "optimal"]
+    assigned: int
+    open_missions: int
+    assignable_cats: int
+    total_cost: float
+    assignments: List[Assignment]
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import Optional
 
 
 class CatBase(BaseModel):
@@ -20,3 +21,10 @@ class CatResponse(CatBase):
     id: int
 
     model_config = {"from_attributes": True}
+
+
+class CatFilters(BaseModel):
+    """Query-string filters for GET /cats."""
+    breed: Optional[str] = None
+    min_salary: Optional[float] = Field(None, ge=0)
+    max_salary: Optional[float] = Field(None, ge=0)
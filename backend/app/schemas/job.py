@@ -0,0 +1,21 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Any, Dict, Literal, Optional
+
+
+class JobResponse(BaseModel):
+    id: int
+    type: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    params: Optional[Dict[str, Any]] = None
+    progress: int
+    total: Optional[int] = None
+    # The operation's usual response body once it has succeeded
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    cancel_requested: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -4,15 +4,19 @@ from typing import List, Optional
 from app.schemas.target import TargetCreate, TargetResponse
 from app.schemas.cat import CatResponse
 
+# How many targets a mission has
+MIN_TARGETS = 1
+MAX_TARGETS = 3
+
 
 class MissionCreate(BaseModel):
-    targets: List[TargetCreate] = Field(..., min_length=1, max_length=3)
+    targets: List[TargetCreate] = Field(..., min_length=MIN_TARGETS, max_length=MAX_TARGETS)
 
     @field_validator('targets')
     @classmethod
     def validate_targets_count(cls, v):
-        if len(v) < 1 or len(v) > 3:
-            raise ValueError('Mission must have between 1 and 3 targets')
+        if len(v) < MIN_TARGETS or len(v) > MAX_TARGETS:
+            raise ValueError(f'Mission must have between {MIN_TARGETS} and {MAX_TARGETS} targets')
         return v
 
 
@@ -24,3 +28,10 @@ class MissionResponse(BaseModel):
     cat: Optional[CatResponse] = None
 
     model_config = {"from_attributes": True}
+
+
+class MissionFilters(BaseModel):
+    """Query-string filters for GET /missions."""
+    is_completed: Optional[bool] = None
+    assigned: Optional[bool] = Field(None, description="Only missions with (true) or without (false) a cat")
+    country: Optional[str] = Field(None, description="Only missions with a target in this country")
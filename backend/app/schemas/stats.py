@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class BreedStats(BaseModel):
+    breed: str
+    cats: int
+    idle_cats: int
+    payroll: float
+
+
+class CountryStats(BaseModel):
+    country: str
+    targets: int
+    completed_targets: int
+    completion_rate: float
+
+
+class StatsResponse(BaseModel):
+    """Dashboard aggregates for GET /stats.
+
+    A cat is idle when it has no mission or its mission is completed. Only
+    cats with no mission can be auto-assigned (AutoAssignResponse.assignable_cats).
+    """
+    cats: int
+    idle_cats: int
+    payroll: float
+    missions: int
+    completed_missions: int
+    completion_rate: float
+    breeds: List[BreedStats]
+    countries: List[CountryStats]
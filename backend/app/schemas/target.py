@@ -23,3 +23,17 @@ class TargetResponse(TargetBase):
     is_completed: bool
 
     model_config = {"from_attributes": True}
+
+
+class TargetSearchHit(TargetBase):
+    """A GET /targets/search result; `snippet` brackets the matched words."""
+    id: int
+    mission_id: int
+    is_completed: bool
+    snippet: str
+    rank: float
+
+
+class TargetBatchUpdate(TargetUpdate):
+    """One item of PATCH /missions/{id}/targets: the TargetUpdate for target `id`."""
+    id: int
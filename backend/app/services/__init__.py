@@ -1,4 +1,9 @@
 from app.services.breed_validator import BreedValidator
 from app.services.mission_service import MissionService
+from app.services.bulk_import import BulkImportService
+from app.services.exporter import Exporter
+from app.services.stats import StatsService
+from app.services.auto_assign import AutoAssignService
+from app.services.jobs import JobService
 
-__all__ = ["BreedValidator", "MissionService"]
+__all__ = ["BreedValidator", "MissionService", "BulkImportService", "Exporter", "StatsService", "AutoAssignService", "JobService"]
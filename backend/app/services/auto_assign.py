@@ -0,0 +1,201 @@
+import asyncio
+import math
+from typing import Dict, List, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import get_assignment_candidates, assign_cats_to_missions
+from app.schemas import AutoAssignRequest, Assignment, AutoAssignResponse
+
+# (mission id, years of experience wanted) and (cat id, years of experience, salary)
+MissionNeed = Tuple[int, float]
+IdleCat = Tuple[int, int, float]
+
+
+def _match_levels(cost, demand: List[int]):
+    """Min-cost assignment of cats to experience levels: level l takes
+    demand[l] distinct cats, and cost[l, c] (NumPy, levels x cats) is what
+    cat c costs there. Returns each cat's level, -1 for unassigned.
+
+    The Hungarian method's successive shortest augmenting paths, run on the
+    levels rather than on single missions, since missions of one level are
+    interchangeable. A path lets level l0 take a cat from l1, l1 one from l2,
+    ..., and the last level a free cat; Bellman-Ford over the few level nodes
+    finds the cheapest such path for every mission added.
+    """
+    import numpy as np
+
+    levels, cats = cost.shape
+    owner = np.full(cats, -1)
+    remaining = list(demand)
+    # Each level's cats from cheapest up; a taken cat is never free again
+    cheapest = [iter(np.argsort(cost[level], kind="stable").tolist()) for level in range(levels)]
+    next_free = [next(order) for order in cheapest]
+    # steal[l][k]: extra cost, and which cat, of level l taking a cat from level k
+    steal = [[(math.inf, -1)] * levels for _ in range(levels)]
+
+    for _ in range(sum(demand)):
+        dist = [0.0 if remaining[level] else math.inf for level in range(levels)]
+        pred = [-1] * levels
+        for _ in range(levels - 1):
+            changed = False
+            for l in range(levels):
+                if dist[l] == math.inf:
+                    continue
+                for k in range(levels):
+                    candidate = dist[l] + steal[l][k][0]
+                    if candidate < dist[k] - 1e-9:  # the margin keeps rounding from forming cycles
+                        dist[k], pred[k] = candidate, l
+                        changed = True
+            if not changed:
+                break
+        last = min(range(levels), key=lambda level: dist[level] + cost[level, next_free[level]])
+
+        free_cat = next_free[last]
+        owner[free_cat] = last
+        path = [last]
+        while pred[path[-1]] != -1:
+            taker = pred[path[-1]]
+            owner[steal[taker][path[-1]][1]] = taker
+            path.append(taker)
+        remaining[path[-1]] -= 1
+
+        for level in range(levels):
+            while next_free[level] is not None and owner[next_free[level]] != -1:
+                next_free[level] = next(cheapest[level], None)
+        for k in path:
+            members = np.flatnonzero(owner == k)
+            gain = cost[:, members] - cost[k, members]
+            best = gain.argmin(axis=1)
+            for l in range(levels):
+                steal[l][k] = (float(gain[l, best[l]]), int(members[best[l]])) if l != k else (math.inf, -1)
+    return owner
+
+
+class AutoAssignService:
+    """Batch matching of open missions to assignable cats (POST /missions/auto-assign).
+
+    A mission wants AUTO_ASSIGN_YEARS_PER_TARGET years of experience per open
+    target. Putting a cat on it costs |the cat's experience - years wanted|
+    plus AUTO_ASSIGN_SALARY_WEIGHT * salary, so under- and over-qualified cats
+    are penalised alike and among equal fits the cheaper cat wins. Missions
+    are served hardest first: with fewer assignable cats than open missions, the
+    easiest missions stay open.
+    """
+
+    @staticmethod
+    def cost(experience: float, salary: float, wanted: float) -> float:
+        return abs(experience - wanted) + settings.AUTO_ASSIGN_SALARY_WEIGHT * salary
+
+    @classmethod
+    def plan_greedy(cls, missions: Sequence[MissionNeed], cats: Sequence[IdleCat]) -> List[Tuple[int, int, float]]:
+        """Each mission, in the given order, takes the cheapest remaining cat.
+
+        Missions wanting the same experience rank cats identically, so each
+        such group takes its cats from one sort instead of scanning every cat
+        per mission: O(levels * cats log cats) for any number of missions.
+        """
+        groups: Dict[float, List[int]] = {}
+        for mission_id, wanted in missions:
+            groups.setdefault(wanted, []).append(mission_id)
+        taken = bytearray(len(cats))
+        plan = []
+        for wanted, mission_ids in groups.items():
+            costs = [cls.cost(experience, salary, wanted) for _, experience, salary in cats]
+            pending = iter(mission_ids)
+            remaining = len(mission_ids)
+            for index in sorted(range(len(cats)), key=costs.__getitem__):
+                if not remaining:
+                    break
+                if taken[index]:
+                    continue
+                taken[index] = 1
+                remaining -= 1
+                plan.append((next(pending), cats[index][0], costs[index]))
+        return plan
+
+    @staticmethod
+    def plan_optimal(missions: Sequence[MissionNeed], cats: Sequence[IdleCat]) -> List[Tuple[int, int, float]]:
+        """The matching of `missions` to distinct cats with the lowest total cost.
+
+        Costs are computed in NumPy per experience level wanted (levels x cats)
+        rather than per mission. Only the len(missions) cheapest cats at each
+        level can be needed, since any other cat in a matching can be swapped
+        for an unused one of those at no extra cost, so the rest are dropped
+        before matching.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("strategy=optimal requires numpy")
+        if not missions:
+            return []
+
+        groups: Dict[float, List[int]] = {}
+        for mission_id, wanted in missions:
+            groups.setdefault(wanted, []).append(mission_id)
+        levels = np.array(list(groups), dtype=float)
+        experience = np.array([cat[1] for cat in cats], dtype=float)
+        salary_cost = settings.AUTO_ASSIGN_SALARY_WEIGHT * np.array([cat[2] for cat in cats], dtype=float)
+        cost = np.abs(experience[None, :] - levels[:, None]) + salary_cost[None, :]
+        candidates = np.unique(np.argsort(cost, axis=1, kind="stable")[:, :len(missions)])
+        cost = cost[:, candidates]
+
+        owner = _match_levels(cost, [len(mission_ids) for mission_ids in groups.values()])
+        plan = []
+        for level, mission_ids in enumerate(groups.values()):
+            members = np.flatnonzero(owner == level)  # candidates are in cat id order
+            plan.extend(
+                (mission_id, cats[candidates[member]][0], float(cost[level, member]))
+                for mission_id, member in zip(mission_ids, members.tolist())
+            )
+        return plan
+
+    @classmethod
+    async def auto_assign(cls, db: AsyncSession, options: AutoAssignRequest) -> AutoAssignResponse:
+        """Plan and commit assignments for every open, unassigned mission (or the
+        `limit` hardest) in one transaction."""
+        missions, cats = await get_assignment_candidates(db)
+        per_target = settings.AUTO_ASSIGN_YEARS_PER_TARGET
+        # Hardest first; sorted() is stable, so ties stay in id order
+        needs = sorted(((mission_id, open_targets * per_target) for mission_id, open_targets in missions),
+                       key=lambda need: -need[1])
+        batch = needs[:min(len(cats), options.limit or len(needs))]
+
+        if options.strategy == "optimal" and len(batch) > settings.AUTO_ASSIGN_OPTIMAL_MAX:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"strategy=optimal handles at most {settings.AUTO_ASSIGN_OPTIMAL_MAX} missions per run; "
+                       f"pass a limit or use greedy"
+            )
+        planner = cls.plan_optimal if options.strategy == "optimal" else cls.plan_greedy
+        try:
+            # CPU-bound on large batches; keep the event loop serving other requests
+            plan = await asyncio.to_thread(planner, batch, cats)
+        except RuntimeError as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
+
+        if not plan:
+            await db.rollback()
+        elif not await assign_cats_to_missions(db, [(mission_id, cat_id) for mission_id, cat_id, _ in plan]):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Missions or cats were assigned concurrently; retry"
+            )
+
+        plan.sort()
+        return AutoAssignResponse(
+            strategy=options.strategy,
+            assigned=len(plan),
+            open_missions=len(missions),
+            assignable_cats=len(cats),
+            total_cost=round(sum(cost for _, _, cost in plan), 6),
+            assignments=[Assignment(mission_id=m, cat_id=c, cost=round(cost, 6)) for m, c, cost in plan],
+        )
@@ -1,46 +1,263 @@
+import asyncio
+import contextlib
+import json
 import os
+import time
 import httpx
-from typing import Set
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, every worker may refresh
+    fcntl = None
 from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import register_collector, timed
+
+BUNDLED_SNAPSHOT = Path(__file__).resolve().parent.parent / "data" / "breeds.json"
+
 
 class BreedValidator:
-    """Validates cat breeds against TheCatAPI with caching."""
-    
+    """Validates cat breeds against TheCatAPI with caching.
+
+    The breed set is served from memory and refreshed in the background once it
+    is older than BREED_CACHE_TTL (stale-while-revalidate). Concurrent refreshes
+    share one request, and a snapshot on disk (or the one bundled with the app)
+    is used when TheCatAPI cannot be reached.
+
+    With several worker processes the snapshot at BREED_SNAPSHOT_PATH is shared:
+    a worker whose cache went stale first adopts a fresher snapshot written by
+    another worker, and a lock file lets only one worker at a time call TheCatAPI.
+    """
+
     _breeds_cache: Set[str] | None = None
-    
+    _fetched_at: float = 0.0
+    _retry_after: float = 0.0
+    _refresh_task: asyncio.Task | None = None
+    _client: httpx.AsyncClient | None = None
+    _stats: Dict[str, int] = {
+        "hits": 0, "stale_hits": 0, "misses": 0,
+        "refreshes": 0, "refresh_failures": 0, "snapshot_loads": 0, "shared_snapshot_loads": 0,
+    }
+
     @classmethod
-    async def get_valid_breeds(cls) -> Set[str]:
-        if cls._breeds_cache is not None:
-            return cls._breeds_cache
-        
+    def get_client(cls) -> httpx.AsyncClient:
+        """Shared pooled client for TheCatAPI."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=settings.BREED_FETCH_TIMEOUT,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=2),
+            )
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Cancel any in-flight refresh and close the shared client."""
+        if cls._refresh_task is not None and not cls._refresh_task.done():
+            cls._refresh_task.cancel()
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def prime(cls, breeds: Iterable[str], fetched_at: float | None = None) -> None:
+        """Replace the cached breed set (fetched_at defaults to now)."""
+        cls._breeds_cache = set(breeds)
+        cls._fetched_at = time.time() if fetched_at is None else fetched_at
+
+    @staticmethod
+    def _read_snapshot(path) -> Optional[Tuple[List[str], float]]:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(settings.cat_api_url, timeout=10)
+            with open(path) as f:
+                data = json.load(f)
+            return list(data["breeds"]), float(data.get("fetched_at", 0))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def load_snapshot(cls) -> bool:
+        """Fill the cache from BREED_SNAPSHOT_PATH or the bundled snapshot. No network."""
+        candidates = [BUNDLED_SNAPSHOT]
+        if settings.BREED_SNAPSHOT_PATH:
+            candidates.insert(0, Path(settings.BREED_SNAPSHOT_PATH))
+
+        for path in candidates:
+            snapshot = cls._read_snapshot(path)
+            if snapshot is None:
+                continue
+            cls.prime(*snapshot)
+            cls._stats["snapshot_loads"] += 1
+            logger.info("Loaded %d breeds from snapshot %s", len(cls._breeds_cache), path)
+            return True
+        return False
+
+    @classmethod
+    def _adopt_shared_snapshot(cls) -> bool:
+        """Take the shared snapshot if another process refreshed it since our fetch."""
+        if not settings.BREED_SNAPSHOT_PATH:
+            return False
+        snapshot = cls._read_snapshot(settings.BREED_SNAPSHOT_PATH)
+        if snapshot is None:
+            return False
+        breeds, fetched_at = snapshot
+        if fetched_at <= cls._fetched_at or time.time() - fetched_at >= settings.BREED_CACHE_TTL:
+            return False
+        cls.prime(breeds, fetched_at)
+        cls._stats["shared_snapshot_loads"] += 1
+        return True
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _refresh_lock() -> Iterator[bool]:
+        """Non-blocking lock next to the shared snapshot; yields whether it was acquired."""
+        if not settings.BREED_SNAPSHOT_PATH or fcntl is None:
+            yield True
+            return
+        try:
+            lock_file = open(f"{settings.BREED_SNAPSHOT_PATH}.lock", "a")
+        except OSError:
+            yield True
+            return
+        with lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @classmethod
+    def _save_snapshot(cls) -> None:
+        if not settings.BREED_SNAPSHOT_PATH:
+            return
+        path = settings.BREED_SNAPSHOT_PATH
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"fetched_at": cls._fetched_at, "breeds": sorted(cls._breeds_cache)}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write breed snapshot %s: %s", path, e)
+
+    @classmethod
+    async def _fetch(cls) -> Set[str]:
+        if cls._adopt_shared_snapshot():
+            return cls._breeds_cache
+        with cls._refresh_lock() as acquired:
+            if not acquired and cls._breeds_cache is not None:
+                # Another worker is fetching; adopt its snapshot on a later request
+                cls._retry_after = time.time() + settings.BREED_REFRESH_RETRY
+                return cls._breeds_cache
+            if acquired and cls._adopt_shared_snapshot():
+                return cls._breeds_cache
+            try:
+                response = await cls.get_client().get(settings.cat_api_url)
                 response.raise_for_status()
                 breeds_data = response.json()
-                cls._breeds_cache = {breed["name"] for breed in breeds_data}
-                return cls._breeds_cache
-        except httpx.HTTPError as e:
-            raise RuntimeError(f"Failed to fetch breeds from TheCatAPI: {e}")
-    
+                breeds = {breed["name"] for breed in breeds_data}
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+                cls._stats["refresh_failures"] += 1
+                cls._retry_after = time.time() + settings.BREED_REFRESH_RETRY
+                raise RuntimeError(f"Failed to fetch breeds from TheCatAPI: {e}")
+
+            cls._stats["refreshes"] += 1
+            cls.prime(breeds)
+            cls._save_snapshot()
+        return breeds
+
+    @classmethod
+    def _on_refresh_done(cls, task: asyncio.Task) -> None:
+        if cls._refresh_task is task:
+            cls._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Breed refresh failed: %s", task.exception())
+
+    @classmethod
+    def refresh(cls) -> asyncio.Task:
+        """Start a refresh, or join the one already in flight (single-flight)."""
+        if cls._refresh_task is None or cls._refresh_task.done():
+            cls._refresh_task = asyncio.create_task(cls._fetch())
+            cls._refresh_task.add_done_callback(cls._on_refresh_done)
+        return cls._refresh_task
+
+    @classmethod
+    async def get_valid_breeds(cls) -> Set[str]:
+        if cls._breeds_cache is None:
+            cls.load_snapshot()
+
+        if cls._breeds_cache is None:
+            cls._stats["misses"] += 1
+            # Shield so a cancelled request does not cancel the fetch other waiters share
+            with timed("breed_api"):
+                return await asyncio.shield(cls.refresh())
+
+        now = time.time()
+        if now - cls._fetched_at < settings.BREED_CACHE_TTL:
+            cls._stats["hits"] += 1
+        else:
+            cls._stats["stale_hits"] += 1
+            if now >= cls._retry_after:
+                cls.refresh()
+        return cls._breeds_cache
+
+    @classmethod
+    async def warm(cls) -> None:
+        """Put a fresh catalogue in memory and in the shared snapshot.
+
+        Run once before worker processes start, so that none of them calls
+        TheCatAPI at startup. If TheCatAPI is down the loaded snapshot is kept.
+        """
+        await cls.get_valid_breeds()
+        if time.time() - cls._fetched_at >= settings.BREED_CACHE_TTL:
+            try:
+                await cls.refresh()
+            except RuntimeError as e:
+                logger.warning("Serving breeds from the snapshot: %s", e)
+        cls._save_snapshot()
+
     @classmethod
     async def is_valid_breed(cls, breed_name: str) -> bool:
         """Check if breed name exists in TheCatAPI."""
         valid_breeds = await cls.get_valid_breeds()
         return breed_name in valid_breeds
-    
+
     @classmethod
     async def validate_breed(cls, breed_name: str) -> None:
         """Validate breed and raise ValueError if invalid."""
         if not await cls.is_valid_breed(breed_name):
-            # We don't fetch all breeds again for the error message to avoid spamming 
+            # We don't fetch all breeds again for the error message to avoid spamming
             # if cache was just populated.
             raise ValueError(
                 f"Invalid breed: '{breed_name}'. "
                 f"Must be one of the valid breeds from TheCatAPI."
             )
-    
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """Cache hit/miss/refresh counters."""
+        return {**cls._stats, "size": len(cls._breeds_cache or ()), "age_seconds": int(time.time() - cls._fetched_at)}
+
+    @classmethod
+    def render_metrics(cls) -> List[str]:
+        """Cache counters in Prometheus text format."""
+        lines = ["# TYPE breed_cache_events_total counter"]
+        lines.extend(f'breed_cache_events_total{{event="{k}"}} {v}' for k, v in cls._stats.items())
+        lines.append("# TYPE breed_cache_age_seconds gauge")
+        lines.append(f"breed_cache_age_seconds {time.time() - cls._fetched_at:.0f}")
+        return lines
+
     @classmethod
     def clear_cache(cls) -> None:
         """Clear the breeds cache (useful for testing)."""
         cls._breeds_cache = None
+        cls._fetched_at = 0.0
+        cls._retry_after = 0.0
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+
+register_collector(BreedValidator.render_metrics)
@@ -0,0 +1,140 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.events import event_hub
+from app.crud import insert_cats, insert_missions
+from app.schemas import CatCreate, MissionCreate, BulkItemResult, BulkCreateResponse
+from app.services.breed_validator import BreedValidator
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Called with (items inserted so far, items to insert) after each chunk
+Progress = Callable[[int, int], Awaitable[None]]
+
+
+class BulkImportService:
+    """Chunked bulk inserts with per-item error reporting."""
+
+    @staticmethod
+    def parse_payload(body: bytes, content_type: str) -> List[Any]:
+        """Split a JSON array or NDJSON body into raw items.
+
+        NDJSON lines that are not valid JSON are returned as ValueError instances
+        so they can be reported per item instead of failing the whole request.
+        """
+        if content_type.split(";")[0].strip().lower() in NDJSON_CONTENT_TYPES:
+            items: List[Any] = []
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    items.append(json.loads(line))
+                except ValueError as e:
+                    items.append(ValueError(f"Invalid JSON: {e}"))
+            return items
+
+        try:
+            items = json.loads(body)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(items, list):
+            raise ValueError("Request body must be a JSON array")
+        return items
+
+    @staticmethod
+    def validate_items(
+        raw_items: List[Any], schema: Type[BaseModel]
+    ) -> Tuple[List[Tuple[int, BaseModel]], List[BulkItemResult]]:
+        valid = []
+        errors = []
+        for index, raw in enumerate(raw_items):
+            if isinstance(raw, ValueError):
+                errors.append(BulkItemResult(index=index, status="error", error=str(raw)))
+                continue
+            try:
+                valid.append((index, schema.model_validate(raw)))
+            except ValidationError as e:
+                message = "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                )
+                errors.append(BulkItemResult(index=index, status="error", error=message))
+        return valid, errors
+
+    @staticmethod
+    async def _insert_chunked(
+        db: AsyncSession, items: List[Tuple[int, BaseModel]], insert_fn, progress: Optional[Progress] = None
+    ) -> List[BulkItemResult]:
+        """Insert valid items chunk by chunk, committing each chunk on its own."""
+        results = []
+        chunk_size = max(1, settings.BULK_CHUNK_SIZE)
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            try:
+                ids = await insert_fn(db, [model for _, model in chunk])
+                await db.commit()
+            except SQLAlchemyError as e:
+                await db.rollback()
+                error = f"Database error: {e.__class__.__name__}"
+                results.extend(BulkItemResult(index=index, status="error", error=error) for index, _ in chunk)
+            else:
+                results.extend(
+                    BulkItemResult(index=index, status="created", id=new_id)
+                    for (index, _), new_id in zip(chunk, ids)
+                )
+            if progress is not None:
+                await progress(start + len(chunk), len(items))
+        return results
+
+    @staticmethod
+    def _build_response(results: List[BulkItemResult]) -> BulkCreateResponse:
+        results.sort(key=lambda r: r.index)
+        created = sum(1 for r in results if r.status == "created")
+        return BulkCreateResponse(created=created, failed=len(results) - created, results=results)
+
+    @classmethod
+    async def create_cats(
+        cls, db: AsyncSession, raw_items: List[Any], progress: Optional[Progress] = None
+    ) -> BulkCreateResponse:
+        """Validate and insert cats. Breeds are checked against one fetch of the breed set."""
+        valid, results = await asyncio.to_thread(cls.validate_items, raw_items, CatCreate)
+
+        if valid:
+            valid_breeds = await BreedValidator.get_valid_breeds()
+            accepted = []
+            for index, cat in valid:
+                if cat.breed in valid_breeds:
+                    accepted.append((index, cat))
+                else:
+                    results.append(BulkItemResult(
+                        index=index, status="error", error=f"Invalid breed: '{cat.breed}'"
+                    ))
+            try:
+                results.extend(await cls._insert_chunked(db, accepted, insert_cats, progress))
+            finally:
+                # Chunks committed before a failure or cancellation stay
+                await response_cache.invalidate("cats")
+
+        return cls._build_response(results)
+
+    @classmethod
+    async def create_missions(
+        cls, db: AsyncSession, raw_items: List[Any], progress: Optional[Progress] = None
+    ) -> BulkCreateResponse:
+        """Validate and insert missions with their targets."""
+        valid, results = await asyncio.to_thread(cls.validate_items, raw_items, MissionCreate)
+        try:
+            created = await cls._insert_chunked(db, valid, insert_missions, progress)
+        finally:
+            await response_cache.invalidate("missions")
+        results.extend(created)
+        mission_ids = [r.id for r in created if r.status == "created"]
+        if mission_ids:
+            event_hub.publish("missions.imported", mission_ids=mission_ids)
+        return cls._build_response(results)
@@ -0,0 +1,73 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Callable, Dict, List, Sequence, Union
+
+from app.core.serialization import json_dumps
+
+CAT_CSV_COLUMNS = ["id", "name", "years_of_experience", "breed", "salary"]
+MISSION_CSV_COLUMNS = [
+    "mission_id", "cat_id", "mission_is_completed",
+    "target_id", "target_name", "country", "notes", "target_is_completed",
+]
+
+
+def _mission_csv_rows(mission: Dict[str, Any]) -> List[List[Any]]:
+    """Flatten a mission into one CSV row per target (or one row with no target)."""
+    head = [mission["id"], mission["cat_id"], mission["is_completed"]]
+    if not mission["targets"]:
+        return [head + [None] * 5]
+    return [
+        head + [t["id"], t["name"], t["country"], t["notes"], t["is_completed"]]
+        for t in mission["targets"]
+    ]
+
+
+class Exporter:
+    """Encodes streamed rows as NDJSON or CSV in bounded chunks."""
+
+    MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+    @staticmethod
+    async def ndjson(rows: AsyncIterator[Dict[str, Any]], chunk_rows: int = 500) -> AsyncIterator[bytes]:
+        buffer: List[bytes] = []
+        async for row in rows:
+            buffer.append(json_dumps(row))
+            if len(buffer) >= chunk_rows:
+                yield b"\n".join(buffer) + b"\n"
+                buffer.clear()
+        if buffer:
+            yield b"\n".join(buffer) + b"\n"
+
+    @staticmethod
+    async def csv(
+        rows: AsyncIterator[Dict[str, Any]],
+        columns: Sequence[str],
+        to_rows: Callable[[Dict[str, Any]], List[List[Any]]],
+        chunk_rows: int = 500,
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        pending = 0
+        async for row in rows:
+            writer.writerows(to_rows(row))
+            pending += 1
+            if pending >= chunk_rows:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @classmethod
+    def cats(cls, rows: AsyncIterator[Dict[str, Any]], fmt: str) -> AsyncIterator[Union[str, bytes]]:
+        if fmt == "csv":
+            return cls.csv(rows, CAT_CSV_COLUMNS, lambda cat: [[cat[c] for c in CAT_CSV_COLUMNS]])
+        return cls.ndjson(rows)
+
+    @classmethod
+    def missions(cls, rows: AsyncIterator[Dict[str, Any]], fmt: str) -> AsyncIterator[Union[str, bytes]]:
+        if fmt == "csv":
+            return cls.csv(rows, MISSION_CSV_COLUMNS, _mission_csv_rows)
+        return cls.ndjson(rows)
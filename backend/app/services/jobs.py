@@ -0,0 +1,54 @@
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, Optional
+
+from app.core.jobs import JobFunction, job_queue
+from app.crud import get_job, cancel_job
+from app.models import Job
+from app.schemas import JobResponse
+
+# Seconds a client turned away by a full queue is asked to wait
+RETRY_AFTER = 5
+
+
+class JobService:
+    """Submitting, reading and cancelling background jobs (app/core/jobs.py)."""
+
+    @staticmethod
+    async def submit(db: AsyncSession, type: str, params: Optional[Dict[str, Any]], run: JobFunction) -> JobResponse:
+        try:
+            job = await job_queue.submit(db, type, params, run)
+        except RuntimeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": str(RETRY_AFTER)}
+            )
+        return JobResponse.model_validate(job)
+
+    @staticmethod
+    async def get(db: AsyncSession, job_id: int) -> Job:
+        job = await get_job(db, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with id {job_id} not found"
+            )
+        return job
+
+    @staticmethod
+    async def cancel(db: AsyncSession, job_id: int) -> Job:
+        """Cancel a queued job, or ask a running one to stop at its next
+        progress report (imports report after every chunk)."""
+        job = await cancel_job(db, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with id {job_id} not found"
+            )
+        if job.status in ("succeeded", "failed"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Job {job_id} already {job.status}"
+            )
+        return job
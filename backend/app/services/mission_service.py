@@ -1,59 +1,89 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, exists, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from fastapi import HTTPException, status
+from typing import List, Sequence, Tuple
 
+from app.core.events import event_hub
 from app.models import Mission, Target, Cat
-from app.schemas import TargetUpdate
+from app.schemas import TargetUpdate, TargetBatchUpdate
+from app.crud import assign_cat_to_mission, update_target, update_targets, invalidate_mission
 
 
 class MissionService:
     """Business logic for mission operations."""
     
     @staticmethod
-    async def validate_can_assign_cat(db: AsyncSession, mission_id: int, cat_id: int) -> tuple[Mission, Cat]:
-        """Validate that a cat can be assigned to a mission."""
-        result = await db.execute(select(Mission).filter(Mission.id == mission_id))
-        mission = result.scalars().first()
+    async def validate_can_assign_cat(db: AsyncSession, mission_id: int, cat_id: int) -> None:
+        """Validate that a cat can be assigned to a mission, using a single SELECT."""
+        other = aliased(Mission)
+        result = await db.execute(
+            select(
+                Mission.id,
+                Mission.is_completed,
+                Mission.cat_id,
+                select(Cat.id).where(Cat.id == cat_id).scalar_subquery().label("cat_exists"),
+                select(other.id).where(other.cat_id == cat_id).limit(1).scalar_subquery().label("existing_mission_id"),
+            ).filter(Mission.id == mission_id)
+        )
+        row = result.first()
         
-        if not mission:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Mission with id {mission_id} not found"
             )
         
-        if mission.is_completed:
+        if row.is_completed:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Cannot assign cat to completed mission"
             )
         
-        if mission.cat_id is not None:
+        if row.cat_id is not None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Mission already has a cat assigned"
             )
         
-        result_cat = await db.execute(select(Cat).filter(Cat.id == cat_id))
-        cat = result_cat.scalars().first()
-        
-        if not cat:
+        if row.cat_exists is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Cat with id {cat_id} not found"
             )
         
-        # Check if cat already has a mission
-        result_existing = await db.execute(select(Mission).filter(Mission.cat_id == cat_id))
-        existing_mission = result_existing.scalars().first()
+        if row.existing_mission_id is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Cat already assigned to mission {row.existing_mission_id}"
+            )
+    
+    @classmethod
+    async def assign_cat(cls, db: AsyncSession, mission_id: int, cat_id: int) -> Mission:
+        """Atomically assign a cat to a mission.
+
+        The conditional UPDATE is the source of truth; the validation query only
+        runs after it matched nothing, to explain why.
+        """
+        try:
+            mission = await assign_cat_to_mission(db, mission_id, cat_id)
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Cat or mission was assigned concurrently"
+            )
         
-        if existing_mission:
+        if mission is None:
+            await cls.validate_can_assign_cat(db, mission_id, cat_id)
+            # Everything checks out now, so a concurrent request changed state in between
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"Cat already assigned to mission {existing_mission.id}"
+                detail="Cat or mission was assigned concurrently"
             )
         
-        return mission, cat
+        return mission
     
     @staticmethod
     async def validate_can_delete_mission(db: AsyncSession, mission_id: int) -> Mission:
@@ -75,66 +105,166 @@ class MissionService:
         
         return mission
     
-    @staticmethod
+    @classmethod
     async def validate_can_update_target(
+        cls,
         db: AsyncSession, 
         mission_id: int, 
         target_id: int, 
         update_data: TargetUpdate
     ) -> Target:
-        result = await db.execute(select(Mission).filter(Mission.id == mission_id))
-        mission = result.scalars().first()
+        """Load the target and its mission's state in one query and check the update is allowed."""
+        result = await db.execute(
+            select(Mission.is_completed, Target)
+            .outerjoin(Target, and_(Target.mission_id == Mission.id, Target.id == target_id))
+            .filter(Mission.id == mission_id)
+        )
+        row = result.first()
         
-        if not mission:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Mission with id {mission_id} not found"
             )
         
-        result_target = await db.execute(
-            select(Target).filter(
-                Target.id == target_id, 
-                Target.mission_id == mission_id
-            )
-        )
-        target = result_target.scalars().first()
-        
+        mission_completed, target = row
         if not target:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Target with id {target_id} not found in mission {mission_id}"
             )
         
-        # Check if notes can be updated
+        cls.check_notes_allowed(target, mission_completed, update_data)
+        return target
+    
+    @staticmethod
+    def check_notes_allowed(target: Target, mission_completed: bool, update_data: TargetUpdate) -> None:
+        """Notes freeze once the target or its mission is completed."""
         if update_data.notes is not None:
             if target.is_completed:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="Cannot update notes: target is already completed"
                 )
-            if mission.is_completed:
+            if mission_completed:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="Cannot update notes: mission is already completed"
                 )
+    
+    @classmethod
+    async def validate_can_update_targets(
+        cls,
+        db: AsyncSession,
+        mission_id: int,
+        updates: Sequence[TargetBatchUpdate]
+    ) -> List[Tuple[Target, TargetBatchUpdate]]:
+        """Check a batch of target updates against one load of the mission's targets.
+
+        Every item is checked against the state before the batch, as if it were
+        sent on its own; the first failing item rejects the whole batch.
+        """
+        seen = set()
+        for update_data in updates:
+            if update_data.id in seen:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Target with id {update_data.id} appears more than once"
+                )
+            seen.add(update_data.id)
+
+        result = await db.execute(
+            select(Mission.is_completed, Target)
+            .outerjoin(Target, Target.mission_id == Mission.id)
+            .filter(Mission.id == mission_id)
+        )
+        rows = result.all()
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Mission with id {mission_id} not found"
+            )
         
-        return target
+        mission_completed = rows[0].is_completed
+        targets = {target.id: target for _, target in rows if target is not None}
+        checked = []
+        for update_data in updates:
+            target = targets.get(update_data.id)
+            if target is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Target with id {update_data.id} not found in mission {mission_id}"
+                )
+            cls.check_notes_allowed(target, mission_completed, update_data)
+            checked.append((target, update_data))
+        return checked
     
     @staticmethod
-    async def check_mission_completion(db: AsyncSession, mission: Mission) -> bool:
-        
+    async def check_mission_completion(db: AsyncSession, mission_id: int) -> bool:
+        """Mark the mission completed if none of its targets is incomplete.
+
+        Runs as one conditional UPDATE with NOT EXISTS instead of loading the
+        targets. Does not commit.
+        """
         result = await db.execute(
-            select(Mission)
-            .options(selectinload(Mission.targets))
-            .filter(Mission.id == mission.id)
+            update(Mission)
+            .where(
+                Mission.id == mission_id,
+                Mission.is_completed.is_not(True),
+                ~exists().where(Target.mission_id == Mission.id, Target.is_completed.is_not(True)),
+            )
+            .values(is_completed=True, version=Mission.version + 1)
+            .returning(Mission.id)
+            .execution_options(synchronize_session=False)
         )
-        loaded_mission = result.scalars().first()
-        
-        all_completed = all(target.is_completed for target in loaded_mission.targets)
-        
-        if all_completed and not loaded_mission.is_completed:
-            loaded_mission.is_completed = True
-            await db.commit()
-            return True
-        
-        return False
+        return result.scalar_one_or_none() is not None
+    
+    @classmethod
+    async def apply_target_update(
+        cls,
+        db: AsyncSession,
+        mission_id: int,
+        target_id: int,
+        update_data: TargetUpdate
+    ) -> Target:
+        """Validate and apply a target update, auto-completing the mission, in one transaction."""
+        target = await cls.validate_can_update_target(db, mission_id, target_id, update_data)
+        await update_target(db, target, update_data)
+        # Only completing a target can complete its mission
+        mission_completed = bool(update_data.is_completed) and await cls.check_mission_completion(db, mission_id)
+        await db.commit()
+        await invalidate_mission(mission_id)
+        event_hub.publish(
+            "target.updated", mission_id=mission_id, target_id=target_id,
+            notes=target.notes, is_completed=target.is_completed,
+        )
+        if mission_completed:
+            event_hub.publish("mission.completed", mission_id=mission_id)
+        return target
+    
+    @classmethod
+    async def apply_target_updates(
+        cls,
+        db: AsyncSession,
+        mission_id: int,
+        updates: Sequence[TargetBatchUpdate]
+    ) -> List[Target]:
+        """Validate and apply several target updates in one transaction.
+
+        The mission's targets are loaded once, all updates are flushed together
+        and the completion check runs once, however many targets were completed.
+        """
+        checked = await cls.validate_can_update_targets(db, mission_id, updates)
+        await update_targets(db, checked)
+        completes_target = any(update_data.is_completed for update_data in updates)
+        mission_completed = completes_target and await cls.check_mission_completion(db, mission_id)
+        await db.commit()
+        await invalidate_mission(mission_id)
+        for target, _ in checked:
+            event_hub.publish(
+                "target.updated", mission_id=mission_id, target_id=target.id,
+                notes=target.notes, is_completed=target.is_completed,
+            )
+        if mission_completed:
+            event_hub.publish("mission.completed", mission_id=mission_id)
+        return [target for target, _ in checked]
@@ -0,0 +1,45 @@
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import get_stats
+from app.schemas import StatsResponse
+
+
+class StatsService:
+    """Dashboard aggregates, memoized for STATS_CACHE_TTL seconds.
+
+    Concurrent requests for an expired memo share one aggregation.
+    """
+
+    _memo: Optional[StatsResponse] = None
+    _computed_at: float = 0.0
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def _fresh(cls) -> Optional[StatsResponse]:
+        if cls._memo is not None and time.monotonic() - cls._computed_at < settings.STATS_CACHE_TTL:
+            return cls._memo
+        return None
+
+    @classmethod
+    async def get(cls, db: AsyncSession) -> StatsResponse:
+        if settings.STATS_CACHE_TTL <= 0:
+            return StatsResponse(**await get_stats(db))
+        if (memo := cls._fresh()) is not None:
+            return memo
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if (memo := cls._fresh()) is None:
+                memo = StatsResponse(**await get_stats(db))
+                cls._memo, cls._computed_at = memo, time.monotonic()
+            return memo
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._memo = None
+        cls._computed_at = 0.0
@@ -0,0 +1,100 @@
+"""POST /missions/auto-assign against assigning missions one call at a time.
+
+Seeds --cats idle cats and --missions open missions (three targets each, about
+a quarter of the targets completed so missions want different experience) and
+reports, through the in-process app:
+
+  manual    POST /missions/{id}/assign/{cat_id} for --manual-calls missions,
+            extrapolated to all of them
+  greedy    one auto-assign run over every mission
+  greedy/N  auto-assign with limit=N, for N in --limits
+  optimal/N the same with strategy=optimal (skipped without numpy)
+
+with wall time, SQL statements and the total cost of the assignments made.
+Assignments are cleared between runs.
+
+Usage (from backend/):
+    python -m benchmarks.bench_auto_assign [--cats 100000] [--missions 100000] [--limits 2000 20000]
+"""
+import argparse
+import asyncio
+import importlib.util
+import time
+
+from benchmarks.harness import StatementCounter, seed
+
+import httpx  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+async def reset() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("UPDATE missions SET cat_id = NULL"))
+
+
+def report(name: str, elapsed: float, statements: int, assigned: int, cost=None) -> None:
+    cost_column = f"  cost {cost:>12,.1f}" if cost is not None else ""
+    print(f"{name:<14} {elapsed:9.2f} s  {statements:>8,} statements  {assigned:>7,} assigned{cost_column}")
+
+
+async def auto_assign(client: httpx.AsyncClient, name: str, options: dict) -> None:
+    await reset()
+    counter = StatementCounter()
+    start = time.perf_counter()
+    response = await client.post("/missions/auto-assign", json=options)
+    elapsed = time.perf_counter() - start
+    counter.close()
+    assert response.status_code == 200, response.text
+    body = response.json()
+    report(name, elapsed, counter.count, body["assigned"], body["total_cost"])
+
+
+async def manual(client: httpx.AsyncClient, calls: int, missions: int) -> None:
+    await reset()
+    counter = StatementCounter()
+    start = time.perf_counter()
+    for mission_id in range(1, calls + 1):
+        response = await client.post(f"/missions/{mission_id}/assign/{mission_id}")
+        assert response.status_code == 200, response.text
+    elapsed = time.perf_counter() - start
+    counter.close()
+    report(f"manual/{calls}", elapsed, counter.count, calls)
+    scale = missions / calls
+    report("  extrapolated", elapsed * scale, round(counter.count * scale), missions)
+
+
+async def run(args) -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None
+    ) as client:
+        await manual(client, args.manual_calls, args.missions)
+        await auto_assign(client, "greedy", {})
+        for limit in args.limits:
+            await auto_assign(client, f"greedy/{limit}", {"limit": limit})
+            if importlib.util.find_spec("numpy"):
+                await auto_assign(client, f"optimal/{limit}", {"strategy": "optimal", "limit": limit})
+
+
+async def prepare(args) -> None:
+    await seed(cats=args.cats, missions=args.missions, assigned=0)
+    async with engine.begin() as conn:
+        await conn.execute(text("UPDATE targets SET is_completed = 1 WHERE (mission_id * 7 + id) % 4 = 0"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cats", type=int, default=100000)
+    parser.add_argument("--missions", type=int, default=100000)
+    parser.add_argument("--manual-calls", type=int, default=1000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[2000, 20000])
+    args = parser.parse_args()
+
+    asyncio.run(prepare(args))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Bytes on the wire and CPU cost of response compression by payload size.
+
+Seeds as many missions as the largest of --sizes (three targets each, half
+with a cat) and, for
+GET /missions/?limit=N (N in --sizes) and the streamed /missions/export,
+reports for every codec that is installed (gzip always; br with `brotli`,
+zstd with `zstandard` or Python 3.14):
+
+  size   compressed size in one shot
+  ratio  uncompressed / size
+  wire   bytes the client downloads through the app with that Accept-Encoding
+         (configured level only; the export is flushed chunk by chunk)
+  cpu    CPU time to compress the body once, in one shot (median of --repeat)
+
+gzip is measured at every level in --gzip-levels; br and zstd at their
+COMPRESSION_* settings. The response cache is on, so the numbers isolate
+compression from building the body.
+
+Usage (from backend/):
+    python -m benchmarks.bench_compression [--sizes 10 100 1000 10000] [--gzip-levels 1 6 9]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks.harness import seed
+
+import httpx  # noqa: E402
+
+from app.api.compression import CODECS, available_encodings  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def cpu_ms(encoding: str, level: int, body: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        CODECS[encoding](level).compress(body, final=True)
+        timings.append(time.process_time() - start)
+    return statistics.median(timings) * 1000
+
+
+async def wire_bytes(client: httpx.AsyncClient, path: str, encoding: str) -> int:
+    async with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        assert response.status_code == 200, response.status_code
+        async for _ in response.aiter_raw():
+            pass
+        assert response.headers.get("Content-Encoding", "identity") in (encoding, "identity")
+        return response.num_bytes_downloaded
+
+
+async def run(sizes, gzip_levels, repeat: int) -> None:
+    configs = [("gzip", level) for level in gzip_levels]
+    configs += [
+        (encoding, level) for encoding, level in (("br", settings.COMPRESSION_BROTLI_QUALITY),
+                                                  ("zstd", settings.COMPRESSION_ZSTD_LEVEL))
+        if available_encodings([encoding])
+    ]
+    paths = [f"/missions/?limit={size}" for size in sizes] + ["/missions/export"]
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for path in paths:
+            body = (await client.get(path, headers={"Accept-Encoding": "identity"})).content
+            print(f"{path:<24} {len(body):>10,} bytes")
+            for encoding, level in configs:
+                settings_level = {"gzip": settings.COMPRESSION_GZIP_LEVEL}.get(encoding)
+                # The app compresses at the configured level; other gzip levels are codec-only
+                wire = await wire_bytes(client, path, encoding) if settings_level in (None, level) else None
+                compressed = len(CODECS[encoding](level).compress(body, final=True))
+                print(
+                    f"    {encoding:<4} {level:>2}  size {compressed:>10,}  ratio {len(body) / compressed:5.1f}  "
+                    f"wire {format(wire, ',') if wire is not None else '-':>10}  "
+                    f"cpu {cpu_ms(encoding, level, body, repeat):8.2f} ms"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--gzip-levels", type=int, nargs="+", default=[1, settings.COMPRESSION_GZIP_LEVEL, 9])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(seed(cats=max(args.sizes), missions=max(args.sizes), assigned=max(args.sizes) // 2))
+    asyncio.run(run(args.sizes, args.gzip_levels, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Cost of idle SSE subscribers and of publishing to them.
+
+Opens --subscribers streams on the in-process event hub (the same generator
+GET /missions/events serves), each consumed by its own task as a connection
+would be, then reports memory per idle subscriber and how long one publish()
+and the delivery of that event to every subscriber take.
+
+Usage (from backend/):
+    python -m benchmarks.bench_events [--subscribers 5000] [--events 100]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from app.core.events import EventHub
+
+
+async def run(args) -> None:
+    hub = EventHub(queue_size=100, replay_size=1000, max_subscribers=args.subscribers, heartbeat=args.heartbeat)
+    delivered = 0
+    all_delivered = asyncio.Event()
+
+    async def connection(subscriber):
+        nonlocal delivered
+        async for frame in hub.stream(subscriber):
+            if frame.startswith(b"id:"):
+                delivered += 1
+                if delivered == args.subscribers:
+                    all_delivered.set()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(connection(hub.subscribe())) for _ in range(args.subscribers)]
+    await asyncio.sleep(0.1)  # let every stream reach its idle wait
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / args.subscribers
+    tracemalloc.stop()
+
+    publish_times, fanout_times = [], []
+    for i in range(args.events):
+        delivered = 0
+        all_delivered.clear()
+        start = time.perf_counter()
+        hub.publish("target.updated", mission_id=1, target_id=i)
+        publish_times.append(time.perf_counter() - start)
+        await all_delivered.wait()
+        fanout_times.append(time.perf_counter() - start)
+
+    hub.close()
+    await asyncio.gather(*tasks)
+
+    print(f"subscribers            {args.subscribers}")
+    print(f"memory per idle stream {per_subscriber / 1024:.1f} KiB")
+    print(f"publish() p50          {statistics.median(publish_times) * 1000:.2f} ms")
+    print(f"delivered to all p50   {statistics.median(fanout_times) * 1000:.2f} ms")
+    print(f"dropped subscribers    {hub.dropped}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--heartbeat", type=float, default=15.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Per-request cost of the access log under stdout backpressure.
+
+Sends sequential GET / requests through the in-process app with the access log
+written to a sink that takes --write-latency-ms per write (a slow terminal, a
+full pipe to a log shipper), and compares:
+
+  off        access log disabled (floor)
+  sync       StreamHandler on the event loop thread (the previous setup)
+  queue      QueueHandler -> background QueueListener, JSON formatted
+  queue-10%  as above with ACCESS_LOG_SAMPLE_RATE=0.1
+
+Usage (from backend/):
+    python -m benchmarks.bench_logging [--requests 2000] [--write-latency-ms 0.2]
+"""
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import sys
+import time
+
+from benchmarks.harness import summarize
+
+import httpx  # noqa: E402
+
+from app.core import logger as logging_module  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+class SlowSink(io.TextIOBase):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.latency)
+        self.lines += text.count("\n")
+        return len(text)
+
+
+def configure(mode: str, sink: SlowSink) -> None:
+    root = logging.getLogger()
+    logging_module.shutdown_logging()
+    root.handlers = []
+    settings.ACCESS_LOG_SAMPLE_RATE = 0.1 if mode == "queue-10%" else 1.0
+
+    if mode == "off":
+        logging_module.access_logger.setLevel(logging.WARNING)
+    elif mode == "sync":
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        logging_module.access_logger.setLevel(logging.INFO)
+    else:
+        sys.stdout = sink
+        try:
+            logging_module.setup_logging()
+        finally:
+            sys.stdout = sys.__stdout__
+    # The benchmark's own client would otherwise log every request too
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+async def measure(requests: int) -> dict:
+    latencies = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/")
+        started = time.perf_counter()
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get("/")
+            latencies.append(time.perf_counter() - start)
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--write-latency-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    floor = None
+    for mode in ("off", "sync", "queue", "queue-10%"):
+        sink = SlowSink(args.write_latency_ms / 1000)
+        configure(mode, sink)
+        result = asyncio.run(measure(args.requests))
+        logging_module.shutdown_logging()
+        floor = floor or result["mean_ms"]
+        print(
+            f"{mode:<10} mean {result['mean_ms']:>7.3f} ms  p99 {result['p99_ms']:>7.3f} ms  "
+            f"overhead {result['mean_ms'] - floor:>+7.3f} ms/request  lines written {sink.lines}"
+        )
+
+
+if __name__ == "__main__":
+    main()
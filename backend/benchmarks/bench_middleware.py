@@ -0,0 +1,104 @@
+"""Per-request overhead of the middleware stack on GET /.
+
+Sends sequential GET / requests through in-process variants of the app and
+compares:
+
+  none         routes and exception handlers only (floor)
+  cors         CORSMiddleware only
+  base-http    the previous @app.middleware("http") log_requests + CORS
+  asgi         the app as shipped: RequestContextMiddleware + CORS
+
+The access log is left unconfigured so only the middleware itself is measured
+(see bench_logging for the log pipeline).
+
+Usage (from backend/):
+    python -m benchmarks.bench_middleware [--requests 5000] [--rounds 3]
+"""
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+from benchmarks.harness import summarize
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.logger import access_logger, request_id_var, should_log_access  # noqa: E402
+from app.core.metrics import observe_request, start_request  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+async def legacy_log_requests(request: Request, call_next):
+    """log_requests as it was before RequestContextMiddleware."""
+    timings = start_request()
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+    request_id_var.set(request_id)
+    response = await call_next(request)
+    process_time = time.perf_counter() - timings.start
+    route = request.scope.get("route")
+    observe_request(
+        request.method, route.path if route else "unmatched", response.status_code, process_time, timings
+    )
+    if settings.SERVER_TIMING_ENABLED:
+        response.headers["Server-Timing"] = timings.server_timing(process_time)
+    response.headers["X-Request-ID"] = request_id
+    if should_log_access(response.status_code, process_time) and access_logger.isEnabledFor(logging.INFO):
+        access_logger.info("%s %s %s", request.method, request.url.path, response.status_code)
+    return response
+
+
+def build(variant: str) -> FastAPI:
+    if variant == "asgi":
+        built = app
+    else:
+        built = FastAPI()
+        built.router.routes.extend(app.router.routes)
+        built.exception_handlers.update(app.exception_handlers)
+        if variant == "base-http":
+            built.add_middleware(BaseHTTPMiddleware, dispatch=legacy_log_requests)
+        if variant != "none":
+            built.user_middleware.insert(0, *[m for m in app.user_middleware if m.cls is CORSMiddleware])
+    return built
+
+
+async def measure(target: FastAPI, requests: int) -> dict:
+    latencies = []
+    headers = {"Origin": settings.CORS_ORIGINS[0]}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/", headers=headers)
+        started = time.perf_counter()
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get("/", headers=headers)
+            latencies.append(time.perf_counter() - start)
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3, help="best of N runs per variant")
+    args = parser.parse_args()
+
+    variants = {name: build(name) for name in ("none", "cors", "base-http", "asgi")}
+    floor = None
+    for name, target in variants.items():
+        result = min(
+            (asyncio.run(measure(target, args.requests)) for _ in range(args.rounds)), key=lambda r: r["mean_ms"]
+        )
+        floor = floor or result["mean_ms"]
+        print(
+            f"{name:<10} mean {result['mean_ms']:>7.3f} ms  p99 {result['p99_ms']:>7.3f} ms  "
+            f"{result['rps']:>7.0f} rps  overhead {(result['mean_ms'] - floor) * 1000:>+6.0f} us/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
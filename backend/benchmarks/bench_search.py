@@ -0,0 +1,85 @@
+"""GET /targets/search latency at millions of targets.
+
+Seeds --missions missions with three targets each (3M targets by default; the
+seed takes several minutes because every insert feeds the FTS5 triggers). Notes
+are 12 words drawn from a Zipf-like vocabulary, so the queries range from a word
+in 0.03% of the notes to one in 75% of them. The index is then rebuilt and
+optimized with the same code as `python -m app.cli rebuild-search-index`, and
+each query is sent --repeat times through the ASGI app. A LIKE '%word%' scan is
+timed for comparison.
+
+Usage (from backend/):
+    python -m benchmarks.bench_search [--missions 1000000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks.harness import seed
+
+import httpx  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.crud import rebuild_search_index  # noqa: E402
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+# Word i is drawn with probability proportional to 1 / (i + 1)
+WEIGHTS = [1 / (i + 1) for i in range(len(VOCABULARY))]
+
+QUERIES = {
+    "0.03% word": "word4999",
+    "6% word": "word20",
+    "75% word": "word0",
+    "two words": "word1 word2",
+    "three words": "word0 word1 word2",
+    "prefix": "word499*",
+    "wide prefix": "word49*",
+    "target name": "Target 123456",
+}
+
+
+def make_notes(rng: random.Random):
+    def notes(mission_id: int, j: int) -> str:
+        return " ".join(rng.choices(VOCABULARY, WEIGHTS, k=12))
+    return notes
+
+
+async def run(args) -> None:
+    start = time.perf_counter()
+    await seed(cats=0, missions=args.missions, assigned=0, notes=make_notes(random.Random(7)))
+    print(f"seeded {args.missions * 3} targets in {time.perf_counter() - start:.1f} s")
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await rebuild_search_index(db)
+    print(f"rebuilt the search index in {time.perf_counter() - start:.1f} s")
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        for label, q in QUERIES.items():
+            times = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                response = await client.get("/targets/search", params={"q": q, "limit": 20})
+                times.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+            print(f"{label:<12} {q!r:<20} median {statistics.median(times) * 1000:8.2f} ms   "
+                  f"hits on page {len(response.json())}")
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        await db.execute(text("SELECT count(*) FROM targets WHERE notes LIKE '%word4999%'"))
+        print(f"LIKE full scan 'word4999'         {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""List endpoint cost by payload size: ORM + response schema vs SQL rows dumped directly.
+
+Seeds --size cats and missions (three targets each, half of them with a cat)
+and times GET /cats/?limit=N and /missions/?limit=N through the in-process app
+with the response cache off, for N in --sizes, in three modes:
+
+  schema       JSON_FAST_PATH=false: ORM objects validated into CatResponse /
+               MissionResponse, then dumped by pydantic
+  rows         JSON_FAST_PATH=true with pydantic-core's encoder (no orjson)
+  rows+orjson  JSON_FAST_PATH=true with orjson (skipped when not installed)
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization [--sizes 100 1000 10000] [--repeat 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ["CACHE_BACKEND"] = "none"
+
+from benchmarks.harness import seed  # noqa: E402
+
+import httpx  # noqa: E402
+
+from app.core import serialization  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+ORJSON = serialization.orjson
+
+
+def configure(mode: str) -> None:
+    settings.JSON_FAST_PATH = mode != "schema"
+    serialization.orjson = ORJSON if mode == "rows+orjson" else None
+
+
+async def measure(client: httpx.AsyncClient, path: str, repeat: int) -> tuple:
+    await client.get(path)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.get(path)
+        timings.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.text
+    return statistics.median(timings) * 1000, len(response.content)
+
+
+async def run(sizes, repeat: int) -> None:
+    modes = ["schema", "rows"] + (["rows+orjson"] if ORJSON is not None else [])
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for resource in ("cats", "missions"):
+            for size in sizes:
+                path = f"/{resource}/?limit={size}"
+                results = {}
+                for mode in modes:
+                    configure(mode)
+                    results[mode], body = await measure(client, path, repeat)
+                line = "  ".join(f"{mode} {ms:8.2f} ms" for mode, ms in results.items())
+                best = min(results.values())
+                print(f"{path:<24} {body / 1024:8.0f} KiB  {line}  x{results['schema'] / best:4.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    size = max(args.sizes)
+    asyncio.run(seed(cats=size, missions=size, assigned=size // 2))
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
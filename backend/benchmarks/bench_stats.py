@@ -0,0 +1,99 @@
+"""GET /stats aggregation at dashboard scale.
+
+Seeds --missions missions with three targets each (1M targets by default) and
+--cats cats, then times:
+
+  naive   what the dashboard did before: load every cat and every mission with
+          its targets through the ORM and aggregate in Python (--naive only;
+          it needs several GB of memory at full size)
+  sql     the two GROUP BY statements behind GET /stats (crud.get_stats)
+  memo    GET /stats end to end while the STATS_CACHE_TTL memo is fresh
+
+Usage (from backend/):
+    python -m benchmarks.bench_stats [--missions 333334] [--cats 100000] [--repeat 5] [--naive]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+from benchmarks.harness import StatementCounter, seed
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from app.crud import get_stats  # noqa: E402
+from app.database import AsyncSessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Cat, Mission  # noqa: E402
+
+
+async def naive_stats() -> dict:
+    async with AsyncSessionLocal() as db:
+        cats = (await db.execute(select(Cat))).scalars().all()
+        missions = (await db.execute(select(Mission).options(selectinload(Mission.targets)))).scalars().all()
+    busy = {m.cat_id for m in missions if m.cat_id is not None and not m.is_completed}
+    payroll = defaultdict(float)
+    for cat in cats:
+        payroll[cat.breed] += cat.salary
+    countries = defaultdict(lambda: [0, 0])
+    for mission in missions:
+        for target in mission.targets:
+            countries[target.country][0] += 1
+            countries[target.country][1] += bool(target.is_completed)
+    return {
+        "payroll": payroll,
+        "idle_cats": sum(cat.id not in busy for cat in cats),
+        "completed": sum(bool(m.is_completed) for m in missions),
+        "countries": countries,
+    }
+
+
+async def sql_stats() -> dict:
+    async with AsyncSessionLocal() as db:
+        return await get_stats(db)
+
+
+async def timed(label: str, fn, repeat: int) -> None:
+    counter = StatementCounter()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        times.append(time.perf_counter() - start)
+    counter.close()
+    print(f"{label:<6} median {statistics.median(times) * 1000:9.2f} ms   "
+          f"statements/run {counter.count / repeat:.0f}")
+
+
+async def run(args) -> None:
+    start = time.perf_counter()
+    await seed(cats=args.cats, missions=args.missions, assigned=min(args.cats, args.missions) // 2)
+    print(f"seeded {args.missions * 3} targets in {time.perf_counter() - start:.1f} s")
+
+    if args.naive:
+        await timed("naive", naive_stats, 1)
+    await timed("sql", sql_stats, args.repeat)
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        await client.get("/stats/")  # fills the memo
+
+        async def memo():
+            assert (await client.get("/stats/")).status_code == 200
+
+        await timed("memo", memo, args.repeat * 100)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--missions", type=int, default=333334)
+    parser.add_argument("--cats", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--naive", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
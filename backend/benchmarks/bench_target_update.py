@@ -0,0 +1,83 @@
+"""Round trips and latency of PATCH /missions/{id}/targets/{target_id}.
+
+Usage (from backend/):
+    python -m benchmarks.bench_target_update [--missions 200] [--batch]
+
+Every mission's three targets are completed one after another, so a third of
+the updates also auto-complete their mission. With --batch each mission's
+three updates are sent as one PATCH /missions/{id}/targets instead.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.database import Base, get_db
+from app.main import app
+from app.models import Mission, Target
+
+
+async def run(missions: int, batch: bool) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        for i in range(missions):
+            mission = Mission(is_completed=False)
+            mission.targets = [
+                Target(name=f"T{i}-{j}", country="UA", notes="", is_completed=False) for j in range(3)
+            ]
+            session.add(mission)
+        await session.commit()
+
+    async def override_get_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    counts = {"statements": 0, "commits": 0}
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda *args: counts.__setitem__("statements", counts["statements"] + 1))
+    event.listen(engine.sync_engine, "commit",
+                 lambda *args: counts.__setitem__("commits", counts["commits"] + 1))
+
+    latencies = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for mission_id in range(1, missions + 1):
+            target_ids = range((mission_id - 1) * 3 + 1, mission_id * 3 + 1)
+            if batch:
+                requests = [(f"/missions/{mission_id}/targets",
+                             [{"id": t, "notes": "seen", "is_completed": True} for t in target_ids])]
+            else:
+                requests = [(f"/missions/{mission_id}/targets/{t}", {"notes": "seen", "is_completed": True})
+                            for t in target_ids]
+            for path, body in requests:
+                start = time.perf_counter()
+                response = await client.patch(path, json=body)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+
+    updates = missions * 3
+    print(f"target updates:       {updates} in {len(latencies)} requests")
+    print(f"statements / update:  {counts['statements'] / updates:.2f}")
+    print(f"commits / update:     {counts['commits'] / updates:.2f}")
+    print(f"time per mission:     {sum(latencies) / missions * 1000:.2f} ms")
+    print(f"p95 request latency:  {sorted(latencies)[int(len(latencies) * 0.95)] * 1000:.2f} ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--missions", type=int, default=200)
+    parser.add_argument("--batch", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.missions, args.batch))
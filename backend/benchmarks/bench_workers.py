@@ -0,0 +1,116 @@
+"""Requests per second of `python -m app.cli serve` with 1..N worker processes.
+
+Seeds a throwaway SQLite database and a fresh breed snapshot, then for each
+--workers count starts the real serve command (bootstrap once, uvicorn
+workers) and drives it over TCP from --clients separate client processes, so
+the load generator is not limited to one core either. The response cache is
+off so every request reaches the database and the serializer.
+
+Usage (from backend/):
+    python -m benchmarks.bench_workers [--workers 1 2 4] [--duration 10] [--clients 4]
+
+Scaling is bounded by the cores left over for the clients; run it on a machine
+with at least twice as many cores as the largest worker count.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import List
+
+from benchmarks.harness import BENCH_DIR, BREEDS, seed, summarize
+
+import httpx  # noqa: E402
+
+PATHS = ["/cats/?limit=20", "/missions/{id}", "/cats/{id}"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _client(base_url: str, duration: float, concurrency: int, max_id: int) -> List[float]:
+    rng = random.Random(os.getpid())
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        async def loop():
+            while time.perf_counter() < deadline:
+                path = rng.choice(PATHS).format(id=rng.randint(1, max_id))
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return latencies
+
+
+def _client_process(args) -> List[float]:
+    return asyncio.run(_client(*args))
+
+
+def _start_server(workers: int, port: int, env: dict) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.cli", "serve", "--workers", str(workers), "--port", str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 1) // 2))
+    parser.add_argument("--concurrency", type=int, default=16, help="connections per client process")
+    parser.add_argument("--cats", type=int, default=10000)
+    args = parser.parse_args()
+
+    asyncio.run(seed(cats=args.cats, missions=args.cats, assigned=args.cats // 2))
+    snapshot = os.path.join(BENCH_DIR, "breeds.json")
+    with open(snapshot, "w") as f:
+        json.dump({"fetched_at": time.time(), "breeds": BREEDS}, f)
+    env = {
+        **os.environ, "BREED_SNAPSHOT_PATH": snapshot, "CACHE_BACKEND": "none",
+        "LOG_LEVEL": "WARNING", "ACCESS_LOG_SAMPLE_RATE": "0", "ACCESS_LOG_SLOW_MS": "1e9",
+    }
+
+    print(f"cores {os.cpu_count()}, client processes {args.clients} x {args.concurrency} connections")
+    baseline = None
+    for workers in args.workers:
+        port = _free_port()
+        server = _start_server(workers, port, env)
+        try:
+            jobs = [(f"http://127.0.0.1:{port}", args.duration, args.concurrency, args.cats)] * args.clients
+            start = time.perf_counter()
+            with multiprocessing.Pool(args.clients) as pool:
+                latencies = [value for chunk in pool.map(_client_process, jobs) for value in chunk]
+            stats = summarize(latencies, time.perf_counter() - start)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        baseline = baseline or stats["rps"]
+        print(f"workers {workers:>2}   {stats['rps']:8.1f} rps   x{stats['rps'] / baseline:4.2f}   "
+              f"p50 {stats['p50_ms']:6.2f} ms   p95 {stats['p95_ms']:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Shared helpers for the benchmark scripts: an isolated database, seeding,
+SQL statement counting and latency statistics.
+
+Import this module before anything from `app` so the app's engine points at
+the benchmark database instead of the development one.
+"""
+import os
+import statistics
+import tempfile
+from typing import Callable, Dict, List, Optional, Sequence
+
+BENCH_DIR = tempfile.mkdtemp(prefix="spy-cat-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(BENCH_DIR, 'bench.db')}")
+os.environ.setdefault("MIGRATE_ON_STARTUP", "false")
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.core.migrations import run_migrations  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.models import Cat, Mission, Target  # noqa: E402
+from app.services import BreedValidator  # noqa: E402
+
+BREEDS = ["Siamese", "Maine Coon", "Bengal", "Sphynx", "Persian"]
+COUNTRIES = ["UA", "PL", "DE", "FR", "GB", "US", "JP"]
+
+
+def stub_cat_api() -> None:
+    """Serve breed validation from memory so no request reaches TheCatAPI."""
+    BreedValidator.prime(BREEDS)
+
+
+async def seed(
+    cats: int, missions: int, assigned: int, targets_per_mission: int = 3, chunk: int = 5000,
+    notes: Optional[Callable[[int, int], str]] = None,
+) -> None:
+    """Create the schema and insert rows with executemany.
+
+    Cats 1..assigned are assigned to missions 1..assigned; the rest are idle.
+    Target ids are (mission_id - 1) * targets_per_mission + 1 ... for each mission.
+    `notes(mission_id, j)` fills target notes (empty by default).
+    """
+    await run_migrations(engine)
+    async with engine.begin() as conn:
+        for start in range(0, cats, chunk):
+            await conn.execute(insert(Cat), [
+                {
+                    "name": f"Agent {i}",
+                    "years_of_experience": i % 20,
+                    "breed": BREEDS[i % len(BREEDS)],
+                    "salary": 1000 + (i * 37) % 9000,
+                }
+                for i in range(start, min(cats, start + chunk))
+            ])
+        for start in range(0, missions, chunk):
+            ids = range(start + 1, min(missions, start + chunk) + 1)
+            await conn.execute(insert(Mission), [
+                {"id": m, "cat_id": m if m <= assigned else None, "is_completed": False} for m in ids
+            ])
+            await conn.execute(insert(Target), [
+                {
+                    "mission_id": m,
+                    "name": f"Target {m}-{j}",
+                    "country": COUNTRIES[(m + j) % len(COUNTRIES)],
+                    "notes": notes(m, j) if notes else "",
+                    "is_completed": False,
+                }
+                for m in ids for j in range(targets_per_mission)
+            ])
+
+
+class StatementCounter:
+    """Counts SQL statements executed on the app engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def close(self) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """Latency percentiles in milliseconds plus throughput."""
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.mean(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
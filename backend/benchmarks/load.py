@@ -0,0 +1,236 @@
+"""Latency/throughput benchmark across every route in cats.py and missions.py.
+
+Seeds a throwaway SQLite database, stubs TheCatAPI, then drives the real ASGI
+app with concurrent clients, one route at a time, and reports p50/p95/p99
+latency, requests per second and SQL statements per request.
+
+Usage (from backend/):
+    python -m benchmarks.load                              # in-process (httpx ASGI transport)
+    python -m benchmarks.load --server                     # through uvicorn over TCP
+    python -m benchmarks.load --save benchmarks/baselines/local.json
+    python -m benchmarks.load --compare benchmarks/baselines/local.json
+
+--compare exits with status 1 when a route's p95 latency regresses by more than
+--tolerance, or when it starts issuing more SQL statements per request.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.harness import StatementCounter, seed, stub_cat_api, summarize
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@dataclass
+class Route:
+    name: str
+    method: str
+    path: Callable[[int], str]
+    body: Optional[Callable[[int], Any]] = None
+    expect: int = 200
+    # Fraction of --requests to send; full-table exports are far heavier than the rest
+    share: float = 1.0
+
+
+def build_routes(args) -> List[Route]:
+    """Request factories; `i` is the request's sequence number within its route."""
+    rng = random.Random(42)
+    # Idle cats and unassigned missions past the regular ranges are consumed by
+    # the assign and delete scenarios, one per request.
+    spare_cat = args.cats + 1
+    spare_mission = args.missions + 1
+    n = args.requests
+
+    def any_cat(i):
+        return rng.randint(1, args.cats)
+
+    def any_mission(i):
+        return rng.randint(1, args.missions)
+
+    def any_target(i):
+        mission = any_mission(i)
+        return f"/missions/{mission}/targets/{(mission - 1) * 3 + 1 + i % 3}"
+
+    new_cat = {"name": "Bench", "years_of_experience": 3, "breed": "Bengal", "salary": 4200}
+    new_mission = {"targets": [{"name": "A", "country": "UA"}, {"name": "B", "country": "PL"}]}
+
+    return [
+        Route("GET /", "GET", lambda i: "/"),
+        Route("GET /cats/", "GET", lambda i: f"/cats/?limit={args.page}"),
+        Route("GET /cats/?cursor", "GET", lambda i: f"/cats/?limit={args.page}&order_by=salary"),
+        Route("GET /cats/{id}", "GET", lambda i: f"/cats/{any_cat(i)}"),
+        # Ten popular ids: mostly response cache hits
+        Route("GET /cats/{id} hot", "GET", lambda i: f"/cats/{1 + i % 10}"),
+        Route("POST /cats/", "POST", lambda i: "/cats/", lambda i: new_cat, 201),
+        Route("POST /cats/bulk", "POST", lambda i: "/cats/bulk", lambda i: [new_cat] * args.bulk),
+        Route("PATCH /cats/{id}", "PATCH", lambda i: f"/cats/{any_cat(i)}", lambda i: {"salary": 5000 + i}),
+        Route("GET /cats/export", "GET", lambda i: "/cats/export", share=0.1),
+        Route("GET /missions/", "GET", lambda i: f"/missions/?limit={args.page}"),
+        Route("GET /missions/{id}", "GET", lambda i: f"/missions/{any_mission(i)}"),
+        Route("GET /missions/{id} hot", "GET", lambda i: f"/missions/{1 + i % 10}"),
+        Route("POST /missions/", "POST", lambda i: "/missions/", lambda i: new_mission, 201),
+        Route("POST /missions/bulk", "POST", lambda i: "/missions/bulk", lambda i: [new_mission] * args.bulk),
+        Route("GET /missions/export", "GET", lambda i: "/missions/export", share=0.1),
+        Route("PATCH /missions/{id}/targets/{id}", "PATCH", any_target, lambda i: {"notes": f"report {i}"}),
+        Route(
+            "POST /missions/{id}/assign/{cat_id}", "POST",
+            lambda i: f"/missions/{spare_mission + i}/assign/{spare_cat + i}",
+        ),
+        Route("DELETE /missions/{id}", "DELETE", lambda i: f"/missions/{spare_mission + n + i}", expect=204),
+        Route("DELETE /cats/{id}", "DELETE", lambda i: f"/cats/{spare_cat + n + i}", expect=204),
+    ]
+
+
+async def run_route(client: httpx.AsyncClient, route: Route, requests: int, concurrency: int) -> Dict[str, Any]:
+    sequence = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while (i := next(sequence)) < requests:
+            kwargs = {"json": route.body(i)} if route.body else {}
+            start = time.perf_counter()
+            response = await client.request(route.method, route.path(i), **kwargs)
+            await response.aread()
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != route.expect:
+                errors += 1
+
+    counter = StatementCounter()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    counter.close()
+
+    result = summarize(latencies, elapsed)
+    result["sql_per_request"] = round(counter.count / requests, 2)
+    result["errors"] = errors
+    return result
+
+
+async def run(args) -> Dict[str, Any]:
+    routes = build_routes(args)
+    if args.routes:
+        routes = [r for r in routes if any(pattern in r.name for pattern in args.routes)]
+
+    # Spare rows for the assign and delete scenarios (see build_routes)
+    spares = 2 * args.requests
+    await seed(
+        cats=args.cats + spares,
+        missions=args.missions + spares,
+        assigned=args.missions // 2,
+    )
+    stub_cat_api()
+
+    server = None
+    if args.server:
+        config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        server = uvicorn.Server(config)
+        serve_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        client = httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    results = {}
+    async with client:
+        for route in routes:
+            # A short warm-up so compiled-statement caches are populated
+            await client.request("GET", "/")
+            requests = max(1, int(args.requests * route.share))
+            results[route.name] = await run_route(client, route, requests, args.concurrency)
+            print(_format_row(route.name, results[route.name]), flush=True)
+
+    if server is not None:
+        server.should_exit = True
+        await serve_task
+
+    return {
+        "meta": {
+            "mode": "uvicorn" if args.server else "asgi",
+            "cats": args.cats,
+            "missions": args.missions,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+        },
+        "routes": results,
+    }
+
+
+def _format_row(name: str, r: Dict[str, Any]) -> str:
+    return (
+        f"{name:<40} {r['rps']:>8.1f} rps  p50 {r['p50_ms']:>8.2f}  p95 {r['p95_ms']:>8.2f}  "
+        f"p99 {r['p99_ms']:>8.2f} ms  sql/req {r['sql_per_request']:>6.2f}  errors {r['errors']}"
+    )
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions of `current` against `baseline`, as human-readable lines."""
+    regressions = []
+    for name, base in baseline["routes"].items():
+        now = current["routes"].get(name)
+        if now is None:
+            continue
+        # Ignore sub-millisecond jitter on very fast routes
+        if now["p95_ms"] > base["p95_ms"] * (1 + tolerance) and now["p95_ms"] - base["p95_ms"] > 1:
+            regressions.append(f"{name}: p95 {base['p95_ms']} ms -> {now['p95_ms']} ms")
+        if now["sql_per_request"] > base["sql_per_request"] + 0.01:
+            regressions.append(
+                f"{name}: SQL statements/request {base['sql_per_request']} -> {now['sql_per_request']}"
+            )
+        if now["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {now['errors']}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cats", type=int, default=1000)
+    parser.add_argument("--missions", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page", type=int, default=100, help="page size for list routes")
+    parser.add_argument("--bulk", type=int, default=100, help="items per bulk request")
+    parser.add_argument("--server", action="store_true", help="serve through uvicorn over TCP")
+    parser.add_argument("--routes", nargs="*", help="only run routes whose name contains one of these")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Initial schema, as previously created by Base.metadata.create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("years_of_experience", sa.Integer(), nullable=False),
+        sa.Column("breed", sa.String(), nullable=False),
+        sa.Column("salary", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_cats_id", "cats", ["id"])
+
+    op.create_table(
+        "missions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cat_id", sa.Integer(), nullable=True),
+        sa.Column("is_completed", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(["cat_id"], ["cats.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cat_id"),
+    )
+    op.create_index("ix_missions_id", "missions", ["id"])
+
+    op.create_table(
+        "targets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("mission_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("country", sa.String(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("is_completed", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(["mission_id"], ["missions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_targets_id", "targets", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_targets_id", table_name="targets")
+    op.drop_table("targets")
+    op.drop_index("ix_missions_id", table_name="missions")
+    op.drop_table("missions")
+    op.drop_index("ix_cats_id", table_name="cats")
+    op.drop_table("cats")
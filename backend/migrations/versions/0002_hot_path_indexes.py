@@ -0,0 +1,28 @@
+"""Indexes for the lookups in crud and MissionService
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_cats_breed", "cats", ["breed"])
+    op.create_index("ix_cats_salary_id", "cats", ["salary", "id"])
+    op.create_index("ix_cats_years_of_experience_id", "cats", ["years_of_experience", "id"])
+    op.create_index("ix_missions_is_completed_cat_id", "missions", ["is_completed", "cat_id"])
+    op.create_index("ix_targets_mission_id_is_completed", "targets", ["mission_id", "is_completed"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_targets_mission_id_is_completed", table_name="targets")
+    op.drop_index("ix_missions_is_completed_cat_id", table_name="missions")
+    op.drop_index("ix_cats_years_of_experience_id", table_name="cats")
+    op.drop_index("ix_cats_salary_id", table_name="cats")
+    op.drop_index("ix_cats_breed", table_name="cats")
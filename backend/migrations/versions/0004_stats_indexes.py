@@ -0,0 +1,20 @@
+"""Covering index for the per-country target aggregates of GET /stats
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_targets_country_is_completed", "targets", ["country", "is_completed"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_targets_country_is_completed", table_name="targets")
@@ -0,0 +1,58 @@
+"""Full-text search over target name, country and notes
+
+SQLite gets an external-content FTS5 table kept in sync by triggers and
+backfilled here; PostgreSQL a GIN expression index.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE targets_fts USING fts5("
+    "name, country, notes, content='targets', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER targets_fts_ai AFTER INSERT ON targets BEGIN "
+    "INSERT INTO targets_fts(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+    "CREATE TRIGGER targets_fts_ad AFTER DELETE ON targets BEGIN "
+    "INSERT INTO targets_fts(targets_fts, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    "END",
+    "CREATE TRIGGER targets_fts_au AFTER UPDATE OF name, country, notes ON targets BEGIN "
+    "INSERT INTO targets_fts(targets_fts, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    "INSERT INTO targets_fts(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+    "INSERT INTO targets_fts(targets_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER targets_fts_au",
+    "DROP TRIGGER targets_fts_ad",
+    "DROP TRIGGER targets_fts_ai",
+    "DROP TABLE targets_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "CREATE INDEX ix_targets_search ON targets USING gin "
+    "((to_tsvector('english', name || ' ' || country || ' ' || coalesce(notes, ''))))",
+]
+POSTGRES_DOWNGRADE = ["DROP INDEX ix_targets_search"]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _run({"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE})
+
+
+def downgrade() -> None:
+    _run({"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRES_DOWNGRADE})
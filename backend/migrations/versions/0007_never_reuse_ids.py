@@ -0,0 +1,57 @@
+"""Never reuse cat, mission and target ids on SQLite
+
+Without AUTOINCREMENT SQLite gives a new row the id of the deleted highest
+one, and a (id, version) ETag of the deleted row would match it. Adding
+AUTOINCREMENT means rebuilding the tables, which drops the full-text
+triggers on targets, so they are created again. PostgreSQL sequences never
+reuse ids; nothing changes there.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+TABLES = ("cats", "missions", "targets")
+
+# As created by 0005
+SEARCH_TRIGGERS = [
+    "CREATE TRIGGER targets_fts_ai AFTER INSERT ON targets BEGIN "
+    "INSERT INTO targets_fts(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+    "CREATE TRIGGER targets_fts_ad AFTER DELETE ON targets BEGIN "
+    "INSERT INTO targets_fts(targets_fts, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    "END",
+    "CREATE TRIGGER targets_fts_au AFTER UPDATE OF name, country, notes ON targets BEGIN "
+    "INSERT INTO targets_fts(targets_fts, rowid, name, country, notes) "
+    "VALUES ('delete', old.id, old.name, old.country, old.notes); "
+    "INSERT INTO targets_fts(rowid, name, country, notes) VALUES (new.id, new.name, new.country, new.notes); "
+    "END",
+]
+
+
+def _rebuild(autoincrement: bool) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table in TABLES:
+        with op.batch_alter_table(
+            table, recreate="always", table_kwargs={"sqlite_autoincrement": autoincrement}
+        ):
+            pass
+    # The rows keep their ids, so the external-content index is still in sync
+    for statement in SEARCH_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _rebuild(True)
+
+
+def downgrade() -> None:
+    _rebuild(False)
@@ -0,0 +1,73 @@
+"""Bounded, backend-neutral search candidates
+
+Both backends gain a names-only index, so search can rank the newest name
+matches next to the newest matches overall. SQLite gets a second
+external-content FTS5 table with its triggers, backfilled here. PostgreSQL
+replaces the expression index with stored tsvector columns and GIN indexes:
+one weighted by column (name A, country B, notes C) and one for the name.
+Its tokenizer moves from 'english' to 'simple' (no stemming), like FTS5's
+unicode61.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE targets_fts_name USING fts5("
+    "name, content='targets', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER targets_fts_name_ai AFTER INSERT ON targets BEGIN "
+    "INSERT INTO targets_fts_name(rowid, name) VALUES (new.id, new.name); "
+    "END",
+    "CREATE TRIGGER targets_fts_name_ad AFTER DELETE ON targets BEGIN "
+    "INSERT INTO targets_fts_name(targets_fts_name, rowid, name) VALUES ('delete', old.id, old.name); "
+    "END",
+    "CREATE TRIGGER targets_fts_name_au AFTER UPDATE OF name ON targets BEGIN "
+    "INSERT INTO targets_fts_name(targets_fts_name, rowid, name) VALUES ('delete', old.id, old.name); "
+    "INSERT INTO targets_fts_name(rowid, name) VALUES (new.id, new.name); "
+    "END",
+    "INSERT INTO targets_fts_name(targets_fts_name) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER targets_fts_name_au",
+    "DROP TRIGGER targets_fts_name_ad",
+    "DROP TRIGGER targets_fts_name_ai",
+    "DROP TABLE targets_fts_name",
+]
+
+POSTGRES_UPGRADE = [
+    "DROP INDEX ix_targets_search",
+    "ALTER TABLE targets ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', name), 'A') || setweight(to_tsvector('simple', country), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')) STORED",
+    "CREATE INDEX ix_targets_search ON targets USING gin (search_vector)",
+    "ALTER TABLE targets ADD COLUMN name_vector tsvector GENERATED ALWAYS AS (to_tsvector('simple', name)) STORED",
+    "CREATE INDEX ix_targets_search_name ON targets USING gin (name_vector)",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX ix_targets_search_name",
+    "DROP INDEX ix_targets_search",
+    "ALTER TABLE targets DROP COLUMN name_vector",
+    "ALTER TABLE targets DROP COLUMN search_vector",
+    "CREATE INDEX ix_targets_search ON targets USING gin "
+    "((to_tsvector('english', name || ' ' || country || ' ' || coalesce(notes, ''))))",
+]
+
+
+def _run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _run({"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE})
+
+
+def downgrade() -> None:
+    _run({"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRES_DOWNGRADE})
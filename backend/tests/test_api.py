@@ -1,22 +1,46 @@
 import pytest
+
+from app.core.config import settings
 from app.schemas import CatCreate
 
+
 @pytest.mark.asyncio
 async def test_create_cat(client):
     response = await client.post(
         "/cats/",
         json={"name": "Test Cat", "years_of_experience": 2, "breed": "Maine Coon", "salary": 5000}
     )
-    # Note: This might fail if we don't mock the external API call in BreedValidator
-    # In real world, we should mock BreedValidator.is_valid_breed
-    if response.status_code == 201:
-        assert response.json()["name"] == "Test Cat"
-    else:
-        # If API fetch fails or strict validation, check 422 or 503
-        pass
+    # The known_breeds fixture keeps BreedValidator off the network
+    assert response.status_code == 201
+    assert response.json()["name"] == "Test Cat"
+
+
+@pytest.mark.asyncio
+async def test_create_cat_invalid_breed(client):
+    response = await client.post(
+        "/cats/",
+        json={"name": "Test Cat", "years_of_experience": 2, "breed": "Unicorn", "salary": 5000}
+    )
+    assert response.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_read_cats(client):
     response = await client.get("/cats/")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_is_cacheable_for_configured_origins(client):
+    headers = {"Origin": "http://localhost:3000", "Access-Control-Request-Method": "PATCH"}
+    response = await client.options("/cats/1", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+    assert response.headers["Access-Control-Max-Age"] == str(settings.CORS_MAX_AGE)
+
+    response = await client.options("/cats/1", headers={**headers, "Origin": "https://evil.example"})
+    assert response.status_code == 400
+
+    response = await client.get("/cats/", headers={"Origin": "http://localhost:3000"})
+    assert "ETag" in response.headers["Access-Control-Expose-Headers"]
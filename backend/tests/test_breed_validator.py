@@ -0,0 +1,109 @@
+import asyncio
+import json
+import time
+
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services import BreedValidator
+
+
+@pytest.fixture
+def cat_api(known_breeds):
+    """Routes BreedValidator's shared client to an in-process TheCatAPI stub."""
+    BreedValidator.clear_cache()
+    calls = []
+    state = {"fail": False}
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        if state["fail"]:
+            return httpx.Response(500)
+        return httpx.Response(200, json=[{"name": "Siamese"}, {"name": "Sphynx"}])
+
+    BreedValidator._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield calls, state
+    BreedValidator._client = None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_fetches_are_coalesced(cat_api, monkeypatch):
+    calls, _ = cat_api
+    monkeypatch.setattr("app.services.breed_validator.BUNDLED_SNAPSHOT", "/nonexistent")
+
+    results = await asyncio.gather(*(BreedValidator.get_valid_breeds() for _ in range(20)))
+
+    assert len(calls) == 1
+    assert all(r == {"Siamese", "Sphynx"} for r in results)
+    assert BreedValidator.get_stats()["misses"] == 20
+    assert BreedValidator.get_stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_served_while_refreshing(cat_api):
+    calls, _ = cat_api
+    BreedValidator.prime({"Old Breed"}, fetched_at=0)
+
+    assert await BreedValidator.get_valid_breeds() == {"Old Breed"}
+    await BreedValidator._refresh_task
+    assert await BreedValidator.get_valid_breeds() == {"Siamese", "Sphynx"}
+
+    stats = BreedValidator.get_stats()
+    assert (stats["stale_hits"], stats["hits"], len(calls)) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_network_failure_falls_back_to_bundled_snapshot(cat_api):
+    calls, state = cat_api
+    state["fail"] = True
+
+    await BreedValidator.validate_breed("Maine Coon")
+    await asyncio.sleep(0.05)
+    # The failed background refresh keeps the snapshot and backs off
+    await BreedValidator.validate_breed("Maine Coon")
+    assert len(calls) == 1
+    assert BreedValidator.get_stats()["refresh_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_writes_snapshot(cat_api, tmp_path, monkeypatch):
+    snapshot = tmp_path / "breeds.json"
+    monkeypatch.setattr(settings, "BREED_SNAPSHOT_PATH", str(snapshot))
+    monkeypatch.setattr("app.services.breed_validator.BUNDLED_SNAPSHOT", "/nonexistent")
+
+    await BreedValidator.get_valid_breeds()
+    assert json.loads(snapshot.read_text())["breeds"] == ["Siamese", "Sphynx"]
+
+    BreedValidator.clear_cache()
+    assert BreedValidator.load_snapshot()
+    assert await BreedValidator.is_valid_breed("Sphynx")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(fcntl is None, reason="snapshot sharing relies on fcntl.flock")
+async def test_workers_share_one_refresh_through_the_snapshot(cat_api, tmp_path, monkeypatch):
+    calls, _ = cat_api
+    snapshot = tmp_path / "breeds.json"
+    monkeypatch.setattr(settings, "BREED_SNAPSHOT_PATH", str(snapshot))
+
+    # Another worker already refreshed the shared snapshot: adopt it, no request
+    snapshot.write_text(json.dumps({"fetched_at": time.time(), "breeds": ["Bengal"]}))
+    BreedValidator.prime({"Old Breed"}, fetched_at=0)
+    await BreedValidator.refresh()
+    assert await BreedValidator.get_valid_breeds() == {"Bengal"}
+
+    # Another worker is fetching right now: keep serving the stale set
+    BreedValidator.prime({"Old Breed"}, fetched_at=0)
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["Old Breed"]}))
+    with open(f"{snapshot}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        assert await BreedValidator.refresh() == {"Old Breed"}
+    assert calls == []
+    assert BreedValidator.get_stats()["shared_snapshot_loads"] == 1
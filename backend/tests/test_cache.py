@@ -0,0 +1,166 @@
+import fnmatch
+
+import pytest
+
+from app.core.cache import MemoryCache, RedisCache, ResponseCache, CachedResponse
+
+
+@pytest.mark.asyncio
+async def test_repeated_get_is_served_from_cache(client, query_counter, create_cat):
+    cat_id = await create_cat()
+    first = await client.get(f"/cats/{cat_id}")
+    query_counter.clear()
+
+    second = await client.get(f"/cats/{cat_id}")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert query_counter == []
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_cached(client, create_cat):
+    assert (await client.get("/cats/1")).status_code == 404
+    await create_cat()
+    assert (await client.get("/cats/1")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_list_keeps_cursor_header_and_sees_new_rows(client, query_counter, create_cat):
+    for salary in (1000, 2000):
+        await create_cat(salary)
+    first = await client.get("/cats/?limit=1")
+    query_counter.clear()
+    cached = await client.get("/cats/?limit=1")
+    assert query_counter == []
+    assert cached.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    await create_cat(3000)
+    assert len((await client.get("/cats/?limit=10")).json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_cat_invalidates_cat_and_its_mission(client, create_cat, create_mission):
+    cat_id = await create_cat()
+    mission = await create_mission()
+    await client.post(f"/missions/{mission['id']}/assign/{cat_id}")
+    await client.get(f"/cats/{cat_id}")
+    await client.get(f"/missions/{mission['id']}")
+    await client.get("/missions/")
+
+    await client.patch(f"/cats/{cat_id}", json={"salary": 9999})
+
+    assert (await client.get(f"/cats/{cat_id}")).json()["salary"] == 9999
+    assert (await client.get(f"/missions/{mission['id']}")).json()["cat"]["salary"] == 9999
+    assert (await client.get("/missions/")).json()[0]["cat"]["salary"] == 9999
+
+
+@pytest.mark.asyncio
+async def test_mission_writes_invalidate_mission(client, create_cat, create_mission):
+    cat_id = await create_cat()
+    mission = await create_mission()
+    mission_id, target_id = mission["id"], mission["targets"][0]["id"]
+    await client.get(f"/missions/{mission_id}")
+
+    await client.post(f"/missions/{mission_id}/assign/{cat_id}")
+    assert (await client.get(f"/missions/{mission_id}")).json()["cat_id"] == cat_id
+
+    await client.patch(f"/missions/{mission_id}/targets/{target_id}", json={"is_completed": True})
+    body = (await client.get(f"/missions/{mission_id}")).json()
+    assert body["is_completed"] is True and body["targets"][0]["is_completed"] is True
+
+    other = await create_mission()
+    await client.get(f"/missions/{other['id']}")
+    await client.delete(f"/missions/{other['id']}")
+    assert (await client.get(f"/missions/{other['id']}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used_and_expires():
+    cache = ResponseCache(MemoryCache(max_entries=2), ttl=60)
+
+    async def build():
+        return CachedResponse(b"[]")
+
+    for key in ("a", "b", "a", "c"):
+        await cache.fetch(key, build)
+    assert cache.stats() == {
+        "hits": 1, "misses": 3, "invalidations": 0, "errors": 0,
+        "evictions": 1, "expirations": 0, "size": 2,
+    }
+    assert await cache.backend.get("b") is None
+
+    await cache.backend.set("short", b"x", ttl=-1)
+    assert await cache.backend.get("short") is None
+    assert cache.backend.expirations == 1
+
+
+class FakeRedis:
+    """In-process stand-in for the redis.asyncio client calls RedisCache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+    async def scan_iter(self, match):
+        for key in [k for k in self.data if fnmatch.fnmatch(k, match)]:
+            yield key
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_round_trip_and_invalidation():
+    cache = ResponseCache(RedisCache(FakeRedis()), ttl=60)
+    calls = []
+
+    async def build():
+        calls.append(1)
+        return CachedResponse(b'{"id": 1}', {"X-Next-Cursor": "abc"})
+
+    key = await cache.list_key("cats", 0, 100)
+    await cache.fetch(key, build)
+    cached = await cache.fetch(key, build)
+    assert cached == CachedResponse(b'{"id": 1}', {"X-Next-Cursor": "abc"})
+    assert len(calls) == 1
+
+    await cache.invalidate("cats", [1])
+    assert await cache.list_key("cats", 0, 100) != key
+
+    await cache.clear()
+    assert cache.backend.client.data == {}
+
+
+@pytest.mark.asyncio
+async def test_unreachable_backend_falls_back_to_database():
+    class Broken(FakeRedis):
+        async def get(self, key):
+            raise ConnectionError("down")
+
+    cache = ResponseCache(RedisCache(Broken()), ttl=60)
+
+    async def build():
+        return CachedResponse(b"[]")
+
+    assert await cache.list_key("cats") is None
+    assert (await cache.fetch("cats:1", build)).body == b"[]"
+    assert cache.stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_in_metrics(client):
+    await client.get("/cats/")
+    await client.get("/cats/")
+    body = (await client.get("/metrics")).text
+    assert 'response_cache_events_total{event="hits"} 1' in body
+    assert "response_cache_entries 1" in body
@@ -0,0 +1,143 @@
+import pytest
+
+from app.models import Cat
+
+
+async def walk_pages(client, url: str) -> list:
+    seen = []
+    cursor = None
+    while True:
+        params = {"cursor": cursor} if cursor else {}
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return seen
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_by_id(client, seed_cats):
+    await seed_cats(23)
+
+    cats = await walk_pages(client, "/cats/?limit=5")
+    assert [cat["id"] for cat in cats] == list(range(1, 24))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", ["salary", "years_of_experience"])
+async def test_cursor_pagination_by_column(client, order_by, seed_cats):
+    await seed_cats(23)
+
+    cats = await walk_pages(client, f"/cats/?limit=4&order_by={order_by}")
+    keys = [(cat[order_by], cat["id"]) for cat in cats]
+    assert len(keys) == 23
+    assert keys == sorted(keys)
+
+
+@pytest.mark.asyncio
+async def test_descending_cursor_pagination(client, seed_cats):
+    await seed_cats(23)
+
+    cats = await walk_pages(client, "/cats/?limit=4&order_by=-salary")
+    keys = [(cat["salary"], cat["id"]) for cat in cats]
+    assert len(keys) == 23
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_filters_and_field_projection(client, db_session, query_counter, seed_cats):
+    await seed_cats(10)
+    db_session.add(Cat(name="Leo", years_of_experience=2, breed="Bengal", salary=1003))
+    await db_session.commit()
+
+    query_counter.clear()
+    response = await client.get("/cats/?breed=Siamese&min_salary=1003&fields=id,salary")
+    assert response.json() == [{"id": 4, "salary": 1003.0}, {"id": 5, "salary": 1004.0},
+                               {"id": 9, "salary": 1003.0}, {"id": 10, "salary": 1004.0}]
+    select = query_counter[-1]
+    assert "cats.name" not in select and "cats.breed =" in select
+
+    response = await client.get("/cats/?max_salary=1000.5&order_by=-id&fields=name")
+    assert response.json() == [{"name": "Cat 5"}, {"name": "Cat 0"}]
+
+    assert (await client.get("/cats/?fields=id,password")).status_code == 422
+    assert (await client.get("/cats/?min_salary=-1")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_cursor_for_other_ordering_is_rejected(client, seed_cats):
+    await seed_cats(3)
+
+    response = await client.get("/cats/?limit=1&order_by=salary")
+    cursor = response.headers["X-Next-Cursor"]
+    response = await client.get("/cats/", params={"cursor": cursor})
+    assert response.status_code == 400
+
+    response = await client.get("/cats/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_cats_reports_partial_failures(client, known_breeds):
+    payload = [
+        {"name": "A", "years_of_experience": 1, "breed": "Siamese", "salary": 100},
+        {"name": "B", "years_of_experience": 2, "breed": "Unicorn", "salary": 100},
+        {"name": "", "years_of_experience": 3, "breed": "Bengal", "salary": 100},
+        {"name": "D", "years_of_experience": 4, "breed": "Bengal", "salary": 100},
+    ]
+    response = await client.post("/cats/bulk", json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 2)
+    assert [r["status"] for r in body["results"]] == ["created", "error", "error", "created"]
+
+    cats = (await client.get("/cats/")).json()
+    assert [c["name"] for c in cats] == ["A", "D"]
+    assert body["results"][3]["id"] == cats[1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_cats_ndjson_in_chunks(client, known_breeds, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 3)
+
+    lines = [
+        f'{{"name": "Cat {i}", "years_of_experience": {i}, "breed": "Bengal", "salary": 1000}}'
+        for i in range(10)
+    ]
+    lines.insert(4, "{not json")
+    response = await client.post(
+        "/cats/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    body = response.json()
+    assert (body["created"], body["failed"]) == (10, 1)
+    assert body["results"][4]["status"] == "error"
+    ids = [r["id"] for r in body["results"] if r["status"] == "created"]
+    assert ids == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_non_array(client, known_breeds):
+    response = await client.post("/cats/bulk", json={"name": "A"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_cats_ndjson_and_csv(client, seed_cats):
+    await seed_cats(3)
+
+    response = await client.get("/cats/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.strip().split("\n")
+    assert len(lines) == 3
+    assert '"name":"Cat 0"' in lines[0]
+
+    response = await client.get("/cats/export?format=csv")
+    rows = response.text.strip().splitlines()
+    assert rows[0] == "id,name,years_of_experience,breed,salary"
+    assert rows[1].startswith("1,Cat 0,0,Siamese,")
+    assert len(rows) == 4
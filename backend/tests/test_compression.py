@@ -0,0 +1,85 @@
+import pytest
+
+from app.api.compression import negotiate
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed_with_weak_etags(client, seed_cats):
+    await seed_cats(50)
+
+    response = await client.get("/cats/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.num_bytes_downloaded < len(response.content) / 3
+    assert len(response.json()) == 50
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = await client.get("/cats/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    response = await client.get("/cats/", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+    assert not response.headers["ETag"].startswith("W/")
+
+    response = await client.get("/cats/1", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers  # under COMPRESSION_MIN_SIZE
+
+
+@pytest.mark.asyncio
+async def test_streamed_export_is_compressed_chunk_by_chunk(client, seed_cats):
+    await seed_cats(1200)
+
+    response = await client.get("/cats/export", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    lines = response.text.splitlines()
+    assert len(lines) == 1200 and lines[-1].startswith('{"id":1200,')
+
+
+def _brotli_decode(body):
+    return pytest.importorskip("brotli").decompress(body)
+
+
+def _zstd_decode(body):
+    # Streamed frames carry no content size, so a one-shot decompress() refuses them
+    return pytest.importorskip("zstandard").ZstdDecompressor().decompressobj().decompress(body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding, decode", [("br", _brotli_decode), ("zstd", _zstd_decode)])
+async def test_brotli_and_zstd_bodies_decode_with_weak_etags(client, seed_cats, encoding, decode):
+    await seed_cats(50)
+    plain = (await client.get("/cats/", headers={"Accept-Encoding": "identity"})).content
+
+    async with client.stream("GET", "/cats/", headers={"Accept-Encoding": encoding}) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers["Content-Encoding"] == encoding
+    assert int(response.headers["Content-Length"]) == len(body) < len(plain) / 3
+    assert decode(body) == plain
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = await client.get("/cats/", headers={"Accept-Encoding": encoding, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_server_order_picks_zstd_then_brotli_then_gzip(client, seed_cats):
+    pytest.importorskip("brotli")
+    pytest.importorskip("zstandard")
+    await seed_cats(50)
+
+    for accept, expected in [("gzip, br, zstd", "zstd"), ("gzip, br", "br"), ("br;q=0, gzip", "gzip")]:
+        response = await client.get("/cats/", headers={"Accept-Encoding": accept})
+        assert response.headers["Content-Encoding"] == expected, accept
+
+
+def test_negotiate_prefers_server_order_and_honours_q_zero():
+    assert negotiate("gzip, br;q=0.5", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("gzip, br;q=0", ["br", "gzip"]) == "gzip"
+    assert negotiate("*;q=0.1", ["gzip"]) == "gzip"
+    assert negotiate("identity", ["gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
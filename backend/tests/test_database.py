@@ -0,0 +1,14 @@
+from app.core.config import settings
+from app.database import worker_pool_size
+
+
+def test_connection_budget_is_split_across_workers(monkeypatch):
+    assert worker_pool_size() == (settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 40)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 5)
+    assert worker_pool_size() == (5, 5)
+
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 64)
+    assert worker_pool_size() == (1, 0)
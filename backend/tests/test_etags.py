@@ -0,0 +1,103 @@
+import pytest
+
+from app.core.cache import response_cache
+
+
+async def _etag(client, url):
+    response = await client.get(url)
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_cat_returns_304(client, create_cat):
+    cat_id = await create_cat()
+    etag = await _etag(client, f"/cats/{cat_id}")
+
+    response = await client.get(f"/cats/{cat_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    await client.patch(f"/cats/{cat_id}", json={"salary": 2000})
+    response = await client.get(f"/cats/{cat_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_recreated_row_does_not_match_deleted_rows_etag(client, create_cat, create_mission):
+    await create_cat()
+    cat_id = await create_cat()
+    await create_mission()
+    mission = await create_mission()
+    urls = [f"/cats/{cat_id}", f"/missions/{mission['id']}"]
+    etags = [await _etag(client, url) for url in urls]
+
+    await client.delete(f"/cats/{cat_id}")
+    await client.delete(f"/missions/{mission['id']}")
+    assert await create_cat(salary=5000) != cat_id
+    assert (await create_mission())["id"] != mission["id"]
+
+    for url, etag in zip(urls, etags):
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 404, url
+
+
+@pytest.mark.asyncio
+async def test_conditional_miss_only_reads_versions(client, query_counter, create_cat, create_mission):
+    cat_id = await create_cat()
+    mission = await create_mission()
+    await client.post(f"/missions/{mission['id']}/assign/{cat_id}")
+    urls = [f"/cats/{cat_id}", "/cats/", f"/missions/{mission['id']}", "/missions/"]
+    etags = [await _etag(client, url) for url in urls]
+    await response_cache.clear()
+    query_counter.clear()
+
+    for url, etag in zip(urls, etags):
+        response = await client.get(url, headers={"If-None-Match": f'W/"other", {etag}'})
+        assert response.status_code == 304, url
+    assert len(query_counter) == len(urls)
+
+
+@pytest.mark.asyncio
+async def test_mission_etag_follows_targets_and_cat(client, create_cat, create_mission):
+    cat_id = await create_cat()
+    mission = await create_mission()
+    url = f"/missions/{mission['id']}"
+    seen = {await _etag(client, url)}
+
+    await client.post(f"/missions/{mission['id']}/assign/{cat_id}")
+    seen.add(await _etag(client, url))
+    await client.patch(f"{url}/targets/{mission['targets'][0]['id']}", json={"notes": "spotted"})
+    seen.add(await _etag(client, url))
+    await client.patch(f"/cats/{cat_id}", json={"salary": 5000})
+    seen.add(await _etag(client, url))
+    await client.delete(f"/cats/{cat_id}")
+    seen.add(await _etag(client, url))
+    assert len(seen) == 5
+
+    # The same versions read without loading the mission give the same ETag
+    await response_cache.clear()
+    response = await client.get(url, headers={"If-None-Match": (await _etag(client, url))})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_list_etag_changes_with_page_contents(client, create_cat):
+    first = await create_cat()
+    etag = await _etag(client, "/cats/")
+    assert (await client.get("/cats/", headers={"If-None-Match": etag})).status_code == 304
+
+    await create_cat()
+    assert (await client.get("/cats/", headers={"If-None-Match": etag})).status_code == 200
+
+    etag = await _etag(client, "/cats/?limit=1")
+    await client.patch(f"/cats/{first}", json={"salary": 3000})
+    assert await _etag(client, "/cats/?limit=1") != etag
+
+
+@pytest.mark.asyncio
+async def test_bad_cursor_with_if_none_match_is_still_400(client):
+    response = await client.get("/cats/?cursor=nope", headers={"If-None-Match": '"x"'})
+    assert response.status_code == 400
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.events import EventHub
+from app.main import app
+
+
+async def _drain(hub, subscriber):
+    frames = []
+    async for frame in hub.stream(subscriber):
+        frames.append(frame.decode())
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_and_slow_subscriber_is_dropped():
+    hub = EventHub(queue_size=2, replay_size=10, max_subscribers=10)
+    fast, slow = hub.subscribe(), hub.subscribe()
+
+    hub.publish("mission.created", mission_id=1)
+    assert (await fast.queue.get()).data == {"mission_id": 1}
+    hub.publish("mission.created", mission_id=2)
+    hub.publish("mission.created", mission_id=3)
+
+    assert slow.closed and hub.dropped == 1
+    assert await _drain(hub, slow) == ["retry: 3000\n\n"]
+    assert fast.queue.qsize() == 2 and not fast.closed
+
+
+@pytest.mark.asyncio
+async def test_resume_from_last_event_id():
+    hub = EventHub(queue_size=10, replay_size=3, max_subscribers=10)
+    for i in range(5):
+        hub.publish("target.updated", target_id=i)
+
+    resumed = hub.subscribe(last_event_id=3)
+    assert [e.id for e in [resumed.queue.get_nowait(), resumed.queue.get_nowait()]] == [4, 5]
+
+    # Event 1 fell out of the replay buffer, and 99 is from before a restart
+    for last_event_id in (0, 99):
+        assert hub.subscribe(last_event_id=last_event_id).queue.get_nowait().type == "resync"
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_heartbeats_and_ends_on_close():
+    hub = EventHub(queue_size=10, replay_size=10, max_subscribers=1, heartbeat=0.05)
+    subscriber = hub.subscribe()
+    with pytest.raises(RuntimeError):
+        hub.subscribe()
+
+    task = asyncio.create_task(_drain(hub, subscriber))
+    await asyncio.sleep(0.12)
+    hub.publish("mission.deleted", mission_id=7)
+    await asyncio.sleep(0.01)
+    hub.close()
+    frames = await task
+
+    assert ": keepalive\n\n" in frames
+    assert frames[-1] == 'id: 1\nevent: mission.deleted\ndata: {"mission_id": 7}\n\n'
+    assert hub.render_metrics()[1] == "events_subscribers 0"
+
+
+async def _open_stream(path="/missions/events"):
+    """Drive the ASGI app directly: httpx's ASGI transport buffers whole responses."""
+    chunks: asyncio.Queue = asyncio.Queue()
+    disconnect = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        await chunks.put(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"test")], "client": ("test", 1), "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    start = await chunks.get()
+    assert start["type"] == "http.response.start" and start["status"] == 200
+    return chunks, disconnect, task
+
+
+async def _next_event(chunks):
+    while True:
+        message = await asyncio.wait_for(chunks.get(), 2)
+        body = message.get("body", b"").decode()
+        if body.startswith("id:"):
+            lines = dict(line.split(": ", 1) for line in body.strip().splitlines())
+            return lines["event"], json.loads(lines["data"])
+
+
+@pytest.mark.asyncio
+async def test_mission_changes_are_streamed(client):
+    chunks, disconnect, task = await _open_stream()
+
+    cat = (await client.post(
+        "/cats/", json={"name": "Tom", "years_of_experience": 3, "breed": "Siamese", "salary": 1000}
+    )).json()
+    mission = (await client.post("/missions/", json={"targets": [{"name": "T", "country": "UA"}]})).json()
+    await client.post(f"/missions/{mission['id']}/assign/{cat['id']}")
+    await client.patch(
+        f"/missions/{mission['id']}/targets/{mission['targets'][0]['id']}", json={"is_completed": True}
+    )
+
+    received = [await _next_event(chunks) for _ in range(4)]
+    assert [event for event, _ in received] == [
+        "mission.created", "mission.assigned", "target.updated", "mission.completed",
+    ]
+    assert received[1][1] == {"mission_id": mission["id"], "cat_id": cat["id"]}
+    assert received[2][1]["is_completed"] is True
+
+    disconnect.set()
+    await asyncio.wait_for(task, 2)
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core import jobs
+from app.core.config import settings
+from app.models import Job
+
+
+async def wait_for_job(client, job_id: int, statuses=("succeeded", "failed", "cancelled")) -> dict:
+    for _ in range(200):
+        job = (await client.get(f"/jobs/{job_id}")).json()
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} stuck in {job['status']}")
+
+
+async def submit(job_workers, run):
+    async with job_workers.session_factory() as db:
+        return await job_workers.submit(db, "test", None, run)
+
+
+def blocking_job(release: asyncio.Event):
+    async def run(db, job):
+        await job.progress(0, 1)
+        await release.wait()
+        await job.progress(1, 1)
+        return {"released": True}
+    return run
+
+
+@pytest.mark.asyncio
+async def test_background_import_reports_progress_and_result(client, job_workers, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 2)
+    items = [{"targets": [{"name": f"T{i}", "country": "UA"}]} for i in range(4)] + [{"targets": []}]
+
+    response = await client.post("/missions/bulk?background=true", json=items)
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["Location"] == f"/jobs/{job['id']}"
+    assert (job["type"], job["status"], job["params"]) == ("missions.import", "queued", {"items": 5})
+
+    job = await wait_for_job(client, job["id"])
+    assert job["status"] == "succeeded"
+    assert (job["progress"], job["total"]) == (4, 4)
+    assert (job["result"]["created"], job["result"]["failed"]) == (4, 1)
+    assert len((await client.get("/missions/")).json()) == 4
+
+
+@pytest.mark.asyncio
+async def test_job_result_and_error(client, job_workers):
+    response = await client.post("/missions/auto-assign?background=true", json={"limit": 5})
+    assert response.status_code == 202
+    assert response.json()["params"] == {"strategy": "greedy", "limit": 5}
+    job = await wait_for_job(client, response.json()["id"])
+    assert (job["status"], job["result"]["assigned"]) == ("succeeded", 0)
+
+    async def fail(db, job):
+        raise ValueError("no such breed")
+
+    job = await wait_for_job(client, (await submit(job_workers, fail)).id)
+    assert (job["status"], job["error"]) == ("failed", "no such breed")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_and_jobs_cancel(client, job_workers, monkeypatch):
+    monkeypatch.setattr(job_workers, "queue_size", 1)
+    release = asyncio.Event()
+    running = [await submit(job_workers, blocking_job(release))
+               for _ in range(settings.JOBS_WORKERS)]
+    for job in running:
+        await wait_for_job(client, job.id, statuses=("running",))
+    waiting = (await client.post("/targets/search/reindex")).json()
+    assert waiting["status"] == "queued"
+
+    response = await client.post("/targets/search/reindex")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+
+    cancelled = (await client.post(f"/jobs/{waiting['id']}/cancel")).json()
+    assert cancelled["status"] == "cancelled"
+    response = await client.post(f"/jobs/{running[0].id}/cancel")
+    assert (response.json()["status"], response.json()["cancel_requested"]) == ("running", True)
+
+    release.set()
+    stopped = await wait_for_job(client, running[0].id)
+    assert (stopped["status"], stopped["error"]) == ("cancelled", "Cancelled while running")
+    finished = await wait_for_job(client, running[-1].id)
+    assert (finished["status"], finished["result"]) == ("succeeded", {"released": True})
+    assert (await client.post(f"/jobs/{running[-1].id}/cancel")).status_code == 409
+    assert (await client.get("/jobs/999")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_a_failure_to_record_a_job(client, job_workers, monkeypatch):
+    finish_job = jobs.finish_job
+    calls = []
+
+    async def flaky_finish_job(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        await finish_job(*args, **kwargs)
+
+    monkeypatch.setattr(jobs, "finish_job", flaky_finish_job)
+
+    async def done(db, job):
+        return {"done": True}
+
+    lost = await wait_for_job(client, (await submit(job_workers, done)).id)
+    assert (lost["status"], lost["error"]) == ("failed", "Job could not be run: database is locked")
+    # Every worker is still alive: a burst of jobs all complete
+    batch = [await submit(job_workers, done) for _ in range(settings.JOBS_WORKERS + 1)]
+    for job in batch:
+        assert (await wait_for_job(client, job.id))["result"] == {"done": True}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_and_restart_end_unfinished_jobs(client, job_workers, monkeypatch):
+    monkeypatch.setattr(job_workers, "workers", 1)
+    await job_workers.stop(timeout=1)
+    job_workers.start()
+    release = asyncio.Event()
+    running = await submit(job_workers, blocking_job(release))
+    queued = await submit(job_workers, blocking_job(release))
+    await wait_for_job(client, running.id, statuses=("running",))
+
+    # Still blocked when the drain time is up: it stops at its next progress report
+    asyncio.get_running_loop().call_later(0.4, release.set)
+    await job_workers.stop(timeout=0.3)
+    stopped = (await client.get(f"/jobs/{running.id}")).json()
+    assert (stopped["status"], stopped["error"]) == ("cancelled", "Server shut down while the job ran")
+    stopped = (await client.get(f"/jobs/{queued.id}")).json()
+    assert (stopped["status"], stopped["error"]) == ("cancelled", "Server shut down before the job started")
+    with pytest.raises(RuntimeError):
+        await submit(job_workers, blocking_job(release))
+
+    # A job left running by a process that died is failed on the next startup
+    left_over = Job(type="missions.import", status="running", created_at=datetime.now(timezone.utc))
+    async with job_workers.session_factory() as db:
+        db.add(left_over)
+        await db.commit()
+    assert await job_workers.recover() == 1
+    assert (await client.get(f"/jobs/{left_over.id}")).json()["status"] == "failed"
@@ -0,0 +1,67 @@
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+from app.core import logger as logging_module
+from app.core.config import settings
+
+
+@pytest.fixture
+def json_logging(monkeypatch):
+    """Run the real queue/listener pipeline with stdout redirected to a buffer."""
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    logging_module.setup_logging()
+    yield lambda: [json.loads(line) for line in stdout.getvalue().splitlines()]
+    logging_module.shutdown_logging()
+    root.handlers, root.level = saved_handlers, saved_level
+
+
+@pytest.mark.asyncio
+async def test_access_log_is_structured_and_carries_request_id(client, json_logging):
+    response = await client.get("/cats/", headers={"X-Request-ID": "req-42"})
+    assert response.headers["X-Request-ID"] == "req-42"
+
+    logging_module.shutdown_logging()
+    records = [r for r in json_logging() if r["logger"] == "spy_cat_agency.access"]
+    assert len(records) == 1
+    record = records[0]
+    assert record["request_id"] == "req-42"
+    assert (record["method"], record["path"], record["status"]) == ("GET", "/cats/", 200)
+    assert record["sql_queries"] == 1
+
+
+def test_exception_traceback_is_a_separate_field(json_logging):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging_module.logger.exception("Job %s failed", 7)
+
+    logging_module.shutdown_logging()
+    record = json_logging()[-1]
+    assert record["message"] == "Job 7 failed"
+    assert record["exc_info"].startswith("Traceback")
+    assert "ValueError: boom" in record["exc_info"]
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated(client):
+    response = await client.get("/")
+    assert len(response.headers["X-Request-ID"]) == 32
+
+
+def test_access_log_sampling(monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "ACCESS_LOG_SLOW_MS", 100.0)
+
+    assert not logging_module.should_log_access(200, 0.01)
+    assert logging_module.should_log_access(200, 0.2)
+    assert logging_module.should_log_access(503, 0.01)
+
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 1.0)
+    assert logging_module.should_log_access(200, 0.01)
@@ -0,0 +1,38 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_breaks_down_request(client):
+    await client.post("/missions/", json={"targets": [{"name": "T", "country": "UA"}]})
+
+    response = await client.get("/missions/")
+    timing = response.headers["Server-Timing"]
+    assert 'sql;dur=' in timing and 'desc="2 queries"' in timing
+    for phase in ("handler;dur=", "serialize;dur=", "total;dur="):
+        assert phase in timing
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_histograms(client):
+    await client.get("/cats/")
+    await client.get("/cats/1")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/cats/",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/cats/{cat_id}",status="404",le="+Inf"}' in body
+    assert 'http_request_sql_statements_bucket{method="GET",route="/cats/",le="1"}' in body
+    assert 'breed_cache_events_total{event="hits"}' in body
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_timed_to_the_last_chunk(client):
+    await client.post("/missions/", json={"targets": [{"name": "T", "country": "UA"}]})
+
+    response = await client.get("/missions/export")
+    assert response.status_code == 200 and len(response.text.splitlines()) == 1
+    assert "X-Request-ID" in response.headers and "Server-Timing" in response.headers
+
+    body = (await client.get("/metrics")).text
+    assert 'http_request_duration_seconds_count{method="GET",route="/missions/export",status="200"}' in body
@@ -0,0 +1,148 @@
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import event, inspect, text
+
+from app.core.migrations import alembic_config, run_migrations
+from app.crud import get_cats, get_missions, get_stats
+from app.database import Base, build_engine
+from app.models.search import include_name
+from app.services import MissionService
+pytestmark = pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL", "sqlite").startswith("sqlite"),
+    reason="EXPLAIN QUERY PLAN and file databases are SQLite specific")
+
+
+def _schema_diff(connection):
+    context = MigrationContext.configure(connection, opts={"include_name": include_name})
+    return compare_metadata(context, Base.metadata)
+
+
+@pytest.mark.asyncio
+async def test_migrations_match_models(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrated.db'}")
+    await run_migrations(engine)
+    async with engine.connect() as conn:
+        assert await conn.run_sync(_schema_diff) == []
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unversioned_database_is_adopted(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    await run_migrations(engine)
+    # Recreate what the old create_all() startup left behind: baseline tables, no version table
+    async with engine.begin() as conn:
+        for index in ["ix_cats_breed", "ix_cats_salary_id", "ix_cats_years_of_experience_id",
+                      "ix_missions_is_completed_cat_id", "ix_targets_mission_id_is_completed",
+                      "ix_targets_country_is_completed"]:
+            await conn.execute(text(f"DROP INDEX {index}"))
+        for trigger in ["targets_fts_ai", "targets_fts_ad", "targets_fts_au",
+                        "targets_fts_name_ai", "targets_fts_name_ad", "targets_fts_name_au"]:
+            await conn.execute(text(f"DROP TRIGGER {trigger}"))
+        await conn.execute(text("DROP TABLE targets_fts"))
+        await conn.execute(text("DROP TABLE targets_fts_name"))
+        await conn.execute(text("DROP TABLE jobs"))
+        for table in ["cats", "missions", "targets"]:
+            await conn.execute(text(f"ALTER TABLE {table} DROP COLUMN version"))
+        await conn.execute(text("DROP TABLE alembic_version"))
+
+    await run_migrations(engine)
+    async with engine.connect() as conn:
+        indexes = await conn.run_sync(lambda c: {i["name"] for i in inspect(c).get_indexes("targets")})
+        assert "ix_targets_mission_id_is_completed" in indexes
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rebuilding_for_autoincrement_keeps_rows_and_search(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'populated.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: command.upgrade(alembic_config(c), "0006"))
+        await conn.execute(text("INSERT INTO cats (name, years_of_experience, breed, salary) "
+                                "VALUES ('Tom', 3, 'Bengal', 1000), ('Leo', 2, 'Bengal', 1000)"))
+        await conn.execute(text("INSERT INTO missions (cat_id, is_completed) VALUES (1, 0)"))
+        await conn.execute(text("INSERT INTO targets (mission_id, name, country, notes, is_completed) "
+                                "VALUES (1, 'Harbour contact', 'PL', '', 0)"))
+
+    await run_migrations(engine)
+    search = text("SELECT rowid FROM targets_fts WHERE targets_fts MATCH :word")
+    async with engine.begin() as conn:
+        assert (await conn.execute(search, {"word": "harbour"})).all() == [(1,)]
+        await conn.execute(text("DELETE FROM cats WHERE id = 2"))
+        await conn.execute(text("INSERT INTO cats (name, years_of_experience, breed, salary) "
+                                "VALUES ('Max', 1, 'Bengal', 1)"))
+        assert (await conn.execute(text("SELECT max(id) FROM cats"))).scalar() == 3
+        await conn.execute(text("UPDATE targets SET notes = 'dockside' WHERE id = 1"))
+        assert (await conn.execute(search, {"word": "dockside"})).all() == [(1,)]
+    await engine.dispose()
+
+
+async def query_plans(db_session, action) -> list:
+    """Run `action` and return the EXPLAIN QUERY PLAN output of every statement it issued."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await action()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    for statement, parameters in captured:
+        conn = await db_session.connection()
+        rows = await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        plans.append("\n".join(row[-1] for row in rows))
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_mission_reads_use_target_index(client, db_session):
+    await client.post("/missions/", json={"targets": [{"name": "T", "country": "UA"}]})
+
+    plans = await query_plans(db_session, lambda: get_missions(db_session))
+    target_plan = next(p for p in plans if "targets" in p)
+    assert "INDEX ix_targets_mission_id_is_completed" in target_plan
+
+
+@pytest.mark.asyncio
+async def test_completion_check_uses_target_index(client, db_session):
+    await client.post("/missions/", json={"targets": [{"name": "T", "country": "UA"}]})
+
+    plans = await query_plans(db_session, lambda: MissionService.check_mission_completion(db_session, 1))
+    assert "SEARCH targets USING" in plans[0]
+    assert "INDEX ix_targets_mission_id_is_completed" in plans[0]
+
+
+@pytest.mark.asyncio
+async def test_cat_keyset_ordering_uses_index(db_session):
+    plans = await query_plans(db_session, lambda: get_cats(db_session, order_by="salary"))
+    assert "INDEX ix_cats_salary_id" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+
+@pytest.mark.asyncio
+async def test_breed_and_open_mission_lookups_use_indexes(db_session):
+    conn = await db_session.connection()
+    rows = await conn.exec_driver_sql("EXPLAIN QUERY PLAN SELECT id FROM cats WHERE breed = ?", ("Bengal",))
+    assert "INDEX ix_cats_breed" in rows.all()[0][-1]
+
+    rows = await conn.exec_driver_sql(
+        "EXPLAIN QUERY PLAN SELECT id FROM missions WHERE is_completed = 0 AND cat_id IS NULL"
+    )
+    assert "INDEX ix_missions_is_completed_cat_id" in rows.all()[0][-1]
+
+
+@pytest.mark.asyncio
+async def test_stats_country_aggregate_uses_covering_index(db_session):
+    plans = await query_plans(db_session, lambda: get_stats(db_session))
+    country_plan = next(p for p in plans if "targets" in p)
+    assert "COVERING INDEX ix_targets_country_is_completed" in country_plan
+    assert "TEMP B-TREE" not in country_plan
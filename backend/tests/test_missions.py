@@ -0,0 +1,333 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.models import Cat, Mission, Target
+
+
+async def seed_missions(session, count: int, targets_per_mission: int = 3) -> None:
+    for i in range(count):
+        cat = Cat(name=f"Cat {i}", years_of_experience=i % 10, breed="Siamese", salary=1000 + i)
+        mission = Mission(is_completed=False, cat=cat)
+        mission.targets = [
+            Target(name=f"Target {i}-{j}", country="UA", notes="", is_completed=False)
+            for j in range(targets_per_mission)
+        ]
+        session.add(mission)
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_list_missions_includes_targets_and_cat(client, db_session):
+    await seed_missions(db_session, 2)
+
+    response = await client.get("/missions/")
+    assert response.status_code == 200
+    missions = response.json()
+    assert len(missions) == 2
+    assert len(missions[0]["targets"]) == 3
+    assert missions[0]["cat"]["name"] == "Cat 0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [5, 50])
+async def test_list_missions_query_count_is_constant(client, db_session, query_counter, page_size):
+    await seed_missions(db_session, page_size)
+
+    query_counter.clear()
+    response = await client.get(f"/missions/?limit={page_size}")
+    assert response.status_code == 200
+    assert len(response.json()) == page_size
+    selects = [s for s in query_counter if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_mission_query_count(client, db_session, query_counter):
+    await seed_missions(db_session, 1)
+
+    query_counter.clear()
+    response = await client.get("/missions/1")
+    assert response.status_code == 200
+    assert len(response.json()["targets"]) == 3
+    selects = [s for s in query_counter if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_missions_filters(client, db_session):
+    await seed_missions(db_session, 3, targets_per_mission=1)
+    db_session.add(Mission(is_completed=True, targets=[Target(name="X", country="PL", notes="")]))
+    await db_session.commit()
+
+    async def ids(query):
+        response = await client.get(f"/missions/?{query}")
+        assert response.status_code == 200
+        return [m["id"] for m in response.json()]
+
+    assert await ids("is_completed=true") == [4]
+    assert await ids("assigned=false") == [4]
+    assert await ids("assigned=true&is_completed=false&order_by=-id") == [3, 2, 1]
+    assert await ids("country=PL") == [4]
+
+
+@pytest.mark.asyncio
+async def test_field_projection_skips_unrequested_relationships(client, db_session, query_counter):
+    await seed_missions(db_session, 3)
+
+    query_counter.clear()
+    response = await client.get("/missions/?fields=id,is_completed")
+    assert response.json() == [{"id": i, "is_completed": False} for i in (1, 2, 3)]
+    assert not any("FROM targets" in s for s in query_counter)
+    assert not any("JOIN cats" in s for s in query_counter if "missions.is_completed" in s)
+
+    response = await client.get("/missions/?fields=id,targets&limit=1")
+    mission = response.json()[0]
+    assert set(mission) == {"id", "targets"} and len(mission["targets"]) == 3
+
+    response = await client.get("/missions/?fields=cat")
+    assert [m["cat"]["name"] for m in response.json()] == ["Cat 0", "Cat 1", "Cat 2"]
+
+
+@pytest.mark.asyncio
+async def test_list_missions_cursor_pagination(client, db_session):
+    await seed_missions(db_session, 7, targets_per_mission=1)
+
+    response = await client.get("/missions/?limit=3")
+    first_page = [m["id"] for m in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/missions/", params={"limit": 3, "cursor": cursor})
+    assert [m["id"] for m in response.json()] == [4, 5, 6]
+    assert first_page == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_missions(client):
+    payload = [
+        {"targets": [{"name": "T1", "country": "UA"}]},
+        {"targets": []},
+        {"targets": [{"name": "T2", "country": "PL"}, {"name": "T3", "country": "DE"}]},
+    ]
+    response = await client.post("/missions/bulk", json=payload)
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+
+    missions = (await client.get("/missions/")).json()
+    assert [len(m["targets"]) for m in missions] == [1, 2]
+    assert missions[1]["targets"][1]["name"] == "T3"
+
+
+@pytest.mark.asyncio
+async def test_export_missions_inlines_targets(client, db_session):
+    await seed_missions(db_session, 2, targets_per_mission=2)
+    db_session.add(Mission(is_completed=False))
+    await db_session.commit()
+
+    response = await client.get("/missions/export")
+    missions = [json.loads(line) for line in response.text.splitlines()]
+    assert [len(m["targets"]) for m in missions] == [2, 2, 0]
+    assert missions[1]["targets"][0]["name"] == "Target 1-0"
+
+    response = await client.get("/missions/export?format=csv")
+    rows = response.text.strip().splitlines()
+    assert rows[0].startswith("mission_id,cat_id")
+    assert len(rows) == 1 + 4 + 1
+
+
+@pytest.mark.asyncio
+async def test_assign_cat_errors(client, db_session):
+    await seed_missions(db_session, 1)
+    db_session.add_all([Mission(is_completed=False), Mission(is_completed=True)])
+    db_session.add(Cat(name="Idle", years_of_experience=1, breed="Siamese", salary=1))
+    await db_session.commit()
+
+    assert (await client.post("/missions/99/assign/2")).status_code == 404
+    assert (await client.post("/missions/2/assign/99")).status_code == 404
+    assert (await client.post("/missions/1/assign/2")).status_code == 409
+    assert (await client.post("/missions/3/assign/2")).status_code == 409
+    response = await client.post("/missions/2/assign/1")
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Cat already assigned to mission 1"
+
+    response = await client.post("/missions/2/assign/2")
+    assert response.status_code == 200
+    assert response.json()["cat"]["name"] == "Idle"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_assignment_has_single_winner(client, concurrent_db):
+    async with concurrent_db() as session:
+        session.add_all([Mission(is_completed=False) for _ in range(10)])
+        session.add_all([Cat(name=f"Cat {i}", years_of_experience=1, breed="Siamese", salary=1) for i in range(10)])
+        await session.commit()
+
+    # One cat raced onto every mission, then every other cat raced onto one mission
+    responses = await asyncio.gather(*(client.post(f"/missions/{m}/assign/1") for m in range(1, 11)))
+    assert sorted(r.status_code for r in responses) == [200] + [409] * 9
+
+    free_mission = next(m for m in range(1, 11) if responses[m - 1].status_code == 409)
+    responses = await asyncio.gather(*(client.post(f"/missions/{free_mission}/assign/{c}") for c in range(2, 11)))
+    assert sorted(r.status_code for r in responses) == [200] + [409] * 8
+
+
+@pytest.mark.asyncio
+async def test_update_target_auto_completes_mission(client, db_session, query_counter):
+    await seed_missions(db_session, 1, targets_per_mission=2)
+
+    response = await client.patch("/missions/1/targets/1", json={"notes": "seen", "is_completed": True})
+    assert response.status_code == 200
+    assert response.json()["notes"] == "seen"
+    assert (await client.get("/missions/1")).json()["is_completed"] is False
+
+    query_counter.clear()
+    response = await client.patch("/missions/1/targets/2", json={"is_completed": True})
+    assert response.status_code == 200
+    # joined read, target UPDATE, conditional mission UPDATE
+    assert len(query_counter) == 3
+    assert (await client.get("/missions/1")).json()["is_completed"] is True
+
+    response = await client.patch("/missions/1/targets/1", json={"notes": "late"})
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_update_target_not_found(client, db_session):
+    await seed_missions(db_session, 2, targets_per_mission=1)
+
+    assert (await client.patch("/missions/9/targets/1", json={"notes": "x"})).status_code == 404
+    response = await client.patch("/missions/1/targets/2", json={"notes": "x"})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Target with id 2 not found in mission 1"
+
+
+@pytest.mark.asyncio
+async def test_batch_target_update_completes_mission_once(client, db_session, query_counter):
+    await seed_missions(db_session, 1, targets_per_mission=3)
+
+    query_counter.clear()
+    response = await client.patch("/missions/1/targets", json=[
+        {"id": 1, "notes": "seen", "is_completed": True},
+        {"id": 2, "is_completed": True},
+        {"id": 3, "notes": "gone", "is_completed": True},
+    ])
+    assert response.status_code == 200
+    assert [(t["id"], t["notes"], t["is_completed"]) for t in response.json()] == [
+        (1, "seen", True), (2, "", True), (3, "gone", True),
+    ]
+    # one joined read, three target UPDATEs, one conditional mission UPDATE
+    assert len(query_counter) == 5
+    assert sum("UPDATE missions" in s for s in query_counter) == 1
+    assert (await client.get("/missions/1")).json()["is_completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_batch_target_update_is_all_or_nothing(client, db_session):
+    await seed_missions(db_session, 2, targets_per_mission=2)
+    await client.patch("/missions/1/targets/2", json={"is_completed": True})
+
+    response = await client.patch("/missions/1/targets", json=[
+        {"id": 1, "notes": "fine"}, {"id": 2, "notes": "frozen"},
+    ])
+    assert response.status_code == 409
+    assert (await client.get("/missions/1")).json()["targets"][0]["notes"] == ""
+
+    response = await client.patch("/missions/1/targets", json=[{"id": 1, "notes": "x"}, {"id": 3, "notes": "x"}])
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Target with id 3 not found in mission 1"
+    assert (await client.patch("/missions/1/targets", json=[{"id": 1}, {"id": 1}])).status_code == 422
+    assert (await client.patch("/missions/1/targets", json=[])).status_code == 422
+    assert (await client.patch("/missions/9/targets", json=[{"id": 1}])).status_code == 404
+
+
+def open_mission(open_targets: int, done_targets: int = 0, **kwargs) -> Mission:
+    targets = [Target(name=f"T{i}", country="UA", notes="", is_completed=i >= open_targets)
+               for i in range(open_targets + done_targets)]
+    return Mission(is_completed=False, targets=targets, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_auto_assign_greedy_serves_hardest_missions_first(client, db_session, query_counter):
+    busy = Cat(name="Busy", years_of_experience=6, breed="Siamese", salary=1000)
+    db_session.add_all([
+        Cat(name="Veteran", years_of_experience=6, breed="Siamese", salary=5000),
+        Cat(name="Rookie", years_of_experience=2, breed="Bengal", salary=1000),
+        Cat(name="Pricey", years_of_experience=6, breed="Bengal", salary=9000),
+        open_mission(1, done_targets=2),  # wants 2 years
+        open_mission(3),  # wants 6 years
+        open_mission(1, cat=busy),
+        Mission(is_completed=True, targets=[Target(name="X", country="UA", notes="", is_completed=True)]),
+    ])
+    await db_session.commit()
+
+    query_counter.clear()
+    response = await client.post("/missions/auto-assign")
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["strategy"], body["assigned"], body["open_missions"], body["assignable_cats"]) == ("greedy", 2, 2, 3)
+    assert [(a["mission_id"], a["cat_id"], a["cost"]) for a in body["assignments"]] == [(1, 2, 1.0), (2, 1, 5.0)]
+    assert body["total_cost"] == 6.0
+    writes = [s for s in query_counter if s.lstrip().upper().startswith("UPDATE")]
+    assert len(writes) == 1
+
+    assert (await client.get("/missions/2")).json()["cat"]["name"] == "Veteran"
+    assert (await client.post("/missions/auto-assign")).json()["assigned"] == 0
+
+
+@pytest.mark.asyncio
+async def test_auto_assign_optimal_beats_greedy(client, db_session):
+    pytest.importorskip("numpy")
+    db_session.add_all([
+        Cat(name="Three", years_of_experience=3, breed="Siamese", salary=1000),
+        Cat(name="Five", years_of_experience=5, breed="Siamese", salary=1000),
+        open_mission(2),  # wants 4 years: either cat costs 2
+        open_mission(1),  # wants 2 years: Three costs 2, Five costs 4
+    ])
+    await db_session.commit()
+
+    response = await client.post("/missions/auto-assign", json={"strategy": "optimal"})
+    assert response.status_code == 200
+    body = response.json()
+    assert [(a["mission_id"], a["cat_id"]) for a in body["assignments"]] == [(1, 2), (2, 1)]
+    assert body["total_cost"] == 4.0  # greedy would give mission 1 cat 1 first: 6.0
+
+
+@pytest.mark.asyncio
+async def test_auto_assign_limits(client, db_session, monkeypatch):
+    pytest.importorskip("numpy")
+    db_session.add_all([Cat(name=f"Cat {i}", years_of_experience=i, breed="Bengal", salary=1000) for i in range(3)])
+    db_session.add_all([open_mission(i + 1) for i in range(3)])
+    await db_session.commit()
+    monkeypatch.setattr(settings, "AUTO_ASSIGN_OPTIMAL_MAX", 2)
+
+    response = await client.post("/missions/auto-assign", json={"strategy": "optimal"})
+    assert response.status_code == 422
+
+    response = await client.post("/missions/auto-assign", json={"strategy": "optimal", "limit": 2})
+    assert response.status_code == 200
+    # The two hardest missions (3 and 2 open targets) go first
+    assert [a["mission_id"] for a in response.json()["assignments"]] == [2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", [
+    "/missions/", "/missions/?fields=id,cat", "/missions/?fields=targets,is_completed&limit=2",
+    "/cats/", "/cats/?fields=salary,name&order_by=-salary&limit=2",
+])
+async def test_row_fast_path_matches_schema_path(client, db_session, monkeypatch, path):
+    await seed_missions(db_session, 3, targets_per_mission=2)
+    db_session.add_all([Mission(is_completed=True), Cat(name="Idle", years_of_experience=1, breed="Bengal", salary=5)])
+    await db_session.commit()
+
+    responses = []
+    for fast in (True, False):
+        monkeypatch.setattr(settings, "JSON_FAST_PATH", fast)
+        await response_cache.clear()
+        responses.append(await client.get(path))
+    fast, slow = responses
+    assert fast.content == slow.content
+    assert fast.headers["ETag"] == slow.headers["ETag"]
+    assert fast.headers.get("X-Next-Cursor") == slow.headers.get("X-Next-Cursor")
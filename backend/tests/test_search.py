@@ -0,0 +1,112 @@
+import pytest
+
+from app.core.config import settings
+from app.crud import rebuild_search_index
+from app.crud.search import _POSTGRES_CANDIDATES, _POSTGRES_PREFIX_CANDIDATES
+
+
+async def _mission(client, *targets):
+    response = await client.post("/missions/", json={"targets": [{"name": n, "country": c} for n, c in targets]})
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_search_follows_target_writes(client):
+    mission = await _mission(client, ("Harbour contact", "PL"), ("Courier", "UA"))
+    courier = mission["targets"][1]
+    other = await _mission(client, ("Embassy clerk", "DE"))
+
+    assert (await client.get("/targets/search", params={"q": "harbour"})).json()[0]["id"] == mission["targets"][0]["id"]
+
+    await client.patch(
+        f"/missions/{mission['id']}/targets/{courier['id']}",
+        json={"notes": "Met the courier at the harbour market at dawn"},
+    )
+    hits = (await client.get("/targets/search", params={"q": "harbour"})).json()
+    # A name match outranks a notes match
+    assert [hit["id"] for hit in hits] == [mission["targets"][0]["id"], courier["id"]]
+    assert "[harbour]" in hits[1]["snippet"]
+    assert hits[0]["rank"] > hits[1]["rank"]
+
+    # Every word must match, and a trailing * matches a prefix
+    assert (await client.get("/targets/search", params={"q": "courier mark"})).json() == []
+    hits = (await client.get("/targets/search", params={"q": "Courier mark*"})).json()
+    assert [hit["id"] for hit in hits] == [courier["id"]]
+    assert hits[0]["snippet"] == "Met the [courier] at the harbour [market] at dawn"
+
+    await client.delete(f"/missions/{other['id']}")
+    assert (await client.get("/targets/search", params={"q": "embassy"})).json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_pagination_and_bad_queries(client, db_session):
+    for i in range(5):
+        await _mission(client, (f"Agent {i}", "UA"))
+    await rebuild_search_index(db_session)
+
+    first = (await client.get("/targets/search", params={"q": "agent", "limit": 3})).json()
+    rest = (await client.get("/targets/search", params={"q": "agent", "skip": 3, "limit": 3})).json()
+    assert len(first) == 3 and len(rest) == 2
+    assert {hit["id"] for hit in first}.isdisjoint(hit["id"] for hit in rest)
+
+    # FTS5 syntax is not passed through: quotes and punctuation are dropped, OR is a word
+    assert len((await client.get("/targets/search", params={"q": '"agent" -'})).json()) == 5
+    assert (await client.get("/targets/search", params={"q": "agent OR"})).json() == []
+    assert (await client.get("/targets/search", params={"q": "?!"})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_pages_past_the_rank_window(client, monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_RANK_WINDOW", 4)
+    for i in range(5):
+        await _mission(client, (f"Agent {i}", "UA"))
+
+    assert len((await client.get("/targets/search", params={"q": "agent", "skip": 1, "limit": 3})).json()) == 3
+    response = await client.get("/targets/search", params={"q": "agent", "skip": 3, "limit": 3})
+    assert response.status_code == 422
+    assert "4" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_old_name_match_outranks_newer_notes_matches(client, monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_RANK_WINDOW", 3)
+    old = await _mission(client, ("Harbour master", "PL"))
+    newer = [await _mission(client, (f"Clerk {i}", "UA")) for i in range(4)]
+    for mission in newer:
+        target = mission["targets"][0]
+        await client.patch(f"/missions/{mission['id']}/targets/{target['id']}", json={"notes": "Seen at the harbour"})
+
+    hits = (await client.get("/targets/search", params={"q": "harbour", "limit": 3})).json()
+    assert hits[0]["id"] == old["targets"][0]["id"]
+    # The oldest notes match is past the window and not ranked
+    assert newer[0]["targets"][0]["id"] not in [hit["id"] for hit in hits]
+
+
+@pytest.mark.asyncio
+async def test_postgres_candidates_use_the_search_indexes(db_session):
+    if db_session.get_bind().dialect.name != "postgresql":
+        pytest.skip("PostgreSQL query plans")
+    conn = await db_session.connection()
+    await conn.exec_driver_sql("SET enable_seqscan = off")
+    statement = _POSTGRES_CANDIDATES.bindparams(query="harbour", window=20).compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = "\n".join(row[0] for row in await conn.exec_driver_sql(f"EXPLAIN {statement}"))
+    assert "Index Scan on ix_targets_search_name " in plan
+    assert "Index Scan on ix_targets_search " in plan
+
+    # Prefixes have no statistics, so their name matches always come from the index
+    statement = _POSTGRES_PREFIX_CANDIDATES.bindparams(query="harb:*", window=20).compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = "\n".join(row[0] for row in await conn.exec_driver_sql(f"EXPLAIN {statement}"))
+    assert "Index Scan on ix_targets_search_name " in plan
+
+    # The tsvector is weighted by column and kept up to date by PostgreSQL
+    await conn.exec_driver_sql("INSERT INTO missions (is_completed, version) VALUES (false, 1)")
+    await conn.exec_driver_sql(
+        "INSERT INTO targets (mission_id, name, country, notes, is_completed, version) "
+        "SELECT id, 'Harbour', 'PL', 'Dock', false, 1 FROM missions"
+    )
+    vector = (await conn.exec_driver_sql("SELECT search_vector::text FROM targets")).scalar()
+    assert vector == "'dock':3C 'harbour':1A 'pl':2B"
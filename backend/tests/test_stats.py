@@ -0,0 +1,63 @@
+import pytest
+
+from app.core.config import settings
+from app.services import StatsService
+
+
+@pytest.fixture(autouse=True)
+def reset_stats_memo():
+    StatsService.reset()
+    yield
+    StatsService.reset()
+
+
+async def _seed(client):
+    cats = []
+    for name, breed, salary in [("Tom", "Siamese", 1000), ("Kit", "Siamese", 1500), ("Max", "Bengal", 2000)]:
+        response = await client.post(
+            "/cats/", json={"name": name, "years_of_experience": 2, "breed": breed, "salary": salary}
+        )
+        cats.append(response.json())
+    done = (await client.post("/missions/", json={"targets": [{"name": "A", "country": "UA"}]})).json()
+    active = (await client.post(
+        "/missions/", json={"targets": [{"name": "B", "country": "UA"}, {"name": "C", "country": "PL"}]}
+    )).json()
+    await client.post(f"/missions/{done['id']}/assign/{cats[0]['id']}")
+    await client.post(f"/missions/{active['id']}/assign/{cats[1]['id']}")
+    await client.patch(f"/missions/{done['id']}/targets/{done['targets'][0]['id']}", json={"is_completed": True})
+
+
+@pytest.mark.asyncio
+async def test_stats_aggregates_in_two_queries(client, query_counter):
+    await _seed(client)
+    query_counter.clear()
+
+    response = await client.get("/stats/")
+    assert response.status_code == 200
+    assert len(query_counter) == 2
+    stats = response.json()
+
+    assert (stats["cats"], stats["idle_cats"], stats["payroll"]) == (3, 2, 4500)
+    assert stats["breeds"] == [
+        {"breed": "Bengal", "cats": 1, "idle_cats": 1, "payroll": 2000},
+        {"breed": "Siamese", "cats": 2, "idle_cats": 1, "payroll": 2500},
+    ]
+    assert (stats["missions"], stats["completed_missions"], stats["completion_rate"]) == (2, 1, 0.5)
+    assert stats["countries"] == [
+        {"country": "PL", "targets": 1, "completed_targets": 0, "completion_rate": 0},
+        {"country": "UA", "targets": 2, "completed_targets": 1, "completion_rate": 0.5},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stats_memo(client, query_counter, monkeypatch):
+    assert (await client.get("/stats/")).json()["missions"] == 0
+    await client.post("/missions/", json={"targets": [{"name": "A", "country": "UA"}]})
+    query_counter.clear()
+
+    # Within the TTL the memo is served without touching the database
+    assert (await client.get("/stats/")).json()["missions"] == 0
+    assert query_counter == []
+
+    monkeypatch.setattr(settings, "STATS_CACHE_TTL", 0)
+    assert (await client.get("/stats/")).json()["missions"] == 1